@@ -1,4 +1,46 @@
-from aoc import a_star, bfs, dijkstra, exceptions, puzzle
+from aoc import (
+    a_star,
+    bfs,
+    bitset,
+    compiled,
+    corridors,
+    cycles,
+    dijkstra,
+    exceptions,
+    grid,
+    ida_star,
+    incremental,
+    intern,
+    jps,
+    parallel,
+    pq,
+    puzzle,
+    regions,
+    search_tree,
+    stats,
+)
 from aoc.datatypes import Coord, Direction
 
-__all__ = ["Coord", "Direction", "a_star", "bfs", "puzzle", "dijkstra", "exceptions"]
+__all__ = [
+    "Coord",
+    "Direction",
+    "a_star",
+    "bfs",
+    "bitset",
+    "compiled",
+    "corridors",
+    "cycles",
+    "puzzle",
+    "dijkstra",
+    "exceptions",
+    "grid",
+    "ida_star",
+    "incremental",
+    "intern",
+    "jps",
+    "parallel",
+    "pq",
+    "regions",
+    "search_tree",
+    "stats",
+]
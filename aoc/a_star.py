@@ -1,9 +1,14 @@
 import heapq
-from collections import defaultdict
-from collections.abc import Iterator, Mapping
+import itertools
+from array import array
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping
 from typing import Protocol
 
 from aoc.exceptions import UnsolveableError
+from aoc.intern import ParentView, StateTable
+from aoc.pq import PriorityQueue, QueueFactory
+from aoc.search_tree import GoalTest, goal_test, start_nodes
+from aoc.stats import SearchStats
 
 
 class Heuristic[T](Protocol):
@@ -18,46 +23,325 @@ class Neighbors[T](Protocol):
     def __call__(self, current: T, paths: Mapping[T, T]) -> Iterator[T]: ...
 
 
-def _reconstruct_path[T](paths: Mapping[T, T], start: T, goal: T) -> list[T]:
+class Estimate[T](Protocol):
+    def __call__(self, current: T) -> float: ...
+
+
+class MultiGoalHeuristic[T](Estimate[T]):
+    """Estimates the cost to the nearest of several goals, with a single goal heuristic."""
+
+    def __init__(self, heuristic: Heuristic[T], goals: Iterable[T]) -> None:
+        self.heuristic = heuristic
+        self.goals = tuple(goals)
+
+    def __call__(self, current: T) -> float:
+        return min(self.heuristic(current, goal) for goal in self.goals)
+
+
+def _reconstruct_path[T](paths: Mapping[T, T], goal: T) -> list[T]:
     path = [goal]
     current = goal
     while current in paths:
-        path.insert(0, paths[current])
         current = paths[current]
-        if current == start:
-            break
+        path.append(current)
+    path.reverse()
     return path
 
 
-def a_star[T](
+def a_star[T: Hashable](  # noqa: PLR0913
     start: T,
     goal: T,
     heuristic: Heuristic[T],
     cost_func: Cost[T],
     next_func: Neighbors[T],
+    *,
+    prefer_deeper: bool = False,
+    stats: SearchStats | None = None,
+    queue: QueueFactory[T] | None = None,
+    interned: bool = False,
+) -> tuple[list[T], float]:
+    """Find the cheapest path from start to goal.
+
+    Args:
+        start: The node to start searching from.
+        goal: The node to find a path to.
+        heuristic: An estimate of the remaining cost, which must never overestimate it. If it
+            is also consistent, never dropping by more than the cost of a step, every node is
+            expanded at most once. Otherwise nodes are expanded again when a cheaper path to
+            them is found.
+        cost_func: The cost of stepping from the last node to the current one.
+        next_func: The nodes reachable from the current node.
+        prefer_deeper: When two nodes have the same estimated total cost, expand the one
+            furthest from the start first. On grids this avoids expanding most of the equally
+            good nodes.
+        stats: If given, filled in with statistics about the search.
+        queue: A priority queue from aoc.pq to use as the frontier, instead of a heapq heap.
+            Ties are then broken by the queue, so prefer_deeper can not be used with it.
+        interned: Number the nodes with an aoc.intern.StateTable, and keep the costs and
+            parents in arrays indexed by those numbers. Every generated node is then hashed
+            once, which is faster when nodes are large tuples or frozensets.
+
+    Returns:
+        The path from start to goal (inclusive), and its cost.
+    """
+    return _a_star(
+        [start],
+        goal_test(goal, None),
+        lambda current: heuristic(current, goal),
+        cost_func,
+        next_func,
+        prefer_deeper=prefer_deeper,
+        stats=stats,
+        queue=queue,
+        interned=interned,
+    )
+
+
+def a_star_multi[T: Hashable](  # noqa: PLR0913
+    starts: Iterable[T],
+    goals: Collection[T] | GoalTest[T],
+    heuristic: Estimate[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+    *,
+    prefer_deeper: bool = False,
+    stats: SearchStats | None = None,
+    queue: QueueFactory[T] | None = None,
+    interned: bool = False,
+) -> tuple[list[T], float]:
+    """Find the cheapest path from any of the starts to any of the goals.
+
+    Args:
+        starts: The nodes to start searching from, all at a cost of zero.
+        goals: The nodes to find a path to, or a predicate that accepts goal nodes.
+        heuristic: An estimate of the remaining cost to the nearest goal, which must never
+            overestimate it. For a collection of goals, use MultiGoalHeuristic.
+        cost_func: The cost of stepping from the last node to the current one.
+        next_func: The nodes reachable from the current node.
+        prefer_deeper: See a_star.
+        stats: See a_star.
+        queue: See a_star.
+        interned: See a_star.
+
+    Returns:
+        The path from a start to the cheapest goal (inclusive), and its cost.
+    """
+    return _a_star(
+        start_nodes(None, starts),
+        goal_test(None, goals),
+        heuristic,
+        cost_func,
+        next_func,
+        prefer_deeper=prefer_deeper,
+        stats=stats,
+        queue=queue,
+        interned=interned,
+    )
+
+
+def _a_star[T: Hashable](  # noqa: C901, PLR0912, PLR0913
+    starts: list[T],
+    is_goal: GoalTest[T],
+    heuristic: Estimate[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+    *,
+    prefer_deeper: bool,
+    stats: SearchStats | None,
+    queue: QueueFactory[T] | None,
+    interned: bool,
+) -> tuple[list[T], float]:
+    if queue is not None:
+        if prefer_deeper:
+            msg = "prefer_deeper can not be used with a custom queue."
+            raise ValueError(msg)
+        if interned:
+            msg = "interned can not be used with a custom queue."
+            raise ValueError(msg)
+        return _a_star_with_queue(starts, is_goal, heuristic, cost_func, next_func, queue(), stats)
+    if interned:
+        return _a_star_interned(
+            starts,
+            is_goal,
+            heuristic,
+            cost_func,
+            next_func,
+            prefer_deeper=prefer_deeper,
+            stats=stats,
+        )
+
+    # Entries are (estimated total, tie break, counter, node). The counter keeps nodes from
+    # ever being compared with each other.
+    counter = itertools.count()
+    frontier: list[tuple[float, float, int, T]] = [
+        (heuristic(start), 0.0, next(counter), start) for start in starts
+    ]
+    heapq.heapify(frontier)
+    paths: dict[T, T] = {}
+    cheapest_path: dict[T, float] = dict.fromkeys(starts, 0.0)
+    closed: set[T] = set()
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
+
+    try:
+        while len(frontier) > 0:
+            _, _, _, current = heapq.heappop(frontier)
+            if current in closed:
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            if is_goal(current):
+                path = _reconstruct_path(paths, current)
+                return path, cheapest_path[current]
+            closed.add(current)
+
+            current_cost = cheapest_path[current]
+            for neighbor in next_func(current, paths):
+                new_cost = current_cost + cost_func(paths, neighbor, current)
+
+                if new_cost < cheapest_path.get(neighbor, float("inf")):
+                    # Only a heuristic that is not consistent can close a node too early. It
+                    # is opened again, so the cheaper path through it is still found.
+                    closed.discard(neighbor)
+                    paths[neighbor] = current
+                    cheapest_path[neighbor] = new_cost
+                    heapq.heappush(
+                        frontier,
+                        (
+                            new_cost + heuristic(neighbor),
+                            -new_cost if prefer_deeper else 0.0,
+                            next(counter),
+                            neighbor,
+                        ),
+                    )
+    finally:
+        if stats is not None:
+            stats.pushed += next(counter)
+            stats.observe_frontier(len(frontier))
+
+    msg = "Could not find a path."
+    raise UnsolveableError(msg)
+
+
+def _a_star_with_queue[T: Hashable](  # noqa: PLR0913, PLR0917
+    starts: list[T],
+    is_goal: GoalTest[T],
+    heuristic: Estimate[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+    frontier: PriorityQueue[T],
+    stats: SearchStats | None,
 ) -> tuple[list[T], float]:
-    frontier: list[tuple[float, T]] = []
-    heapq.heappush(frontier, (heuristic(start, goal), start))
+    """The same search as _a_star, with a pluggable priority queue as the frontier."""
+    for start in starts:
+        frontier.push(start, heuristic(start))
+    pushed = len(starts)
     paths: dict[T, T] = {}
-    cheapest_path: dict[T, float] = defaultdict(lambda: float("inf"))
-    cheapest_path[start] = 0.0
+    cheapest_path: dict[T, float] = dict.fromkeys(starts, 0.0)
+    closed: set[T] = set()
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
+
+    try:
+        while len(frontier) > 0:
+            _, current = frontier.pop()
+            if current in closed:
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            if is_goal(current):
+                return _reconstruct_path(paths, current), cheapest_path[current]
+            closed.add(current)
+
+            current_cost = cheapest_path[current]
+            for neighbor in next_func(current, paths):
+                new_cost = current_cost + cost_func(paths, neighbor, current)
+                if new_cost < cheapest_path.get(neighbor, float("inf")):
+                    closed.discard(neighbor)
+                    paths[neighbor] = current
+                    cheapest_path[neighbor] = new_cost
+                    frontier.push(neighbor, new_cost + heuristic(neighbor))
+                    pushed += 1
+    finally:
+        if stats is not None:
+            stats.pushed += pushed
+            stats.observe_frontier(len(frontier))
+
+    msg = "Could not find a path."
+    raise UnsolveableError(msg)
+
 
-    while len(frontier) > 0:
-        _, current = heapq.heappop(frontier)
-        if current == goal:
-            path = _reconstruct_path(paths, start, goal)
-            return path, cheapest_path[current]
+def _a_star_interned[T: Hashable](  # noqa: C901, PLR0913
+    starts: list[T],
+    is_goal: GoalTest[T],
+    heuristic: Estimate[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+    *,
+    prefer_deeper: bool,
+    stats: SearchStats | None,
+) -> tuple[list[T], float]:
+    """The same search as _a_star, on the numbers of the nodes in a StateTable."""
+    table = StateTable(starts)
+    numbers, states = table.numbers, table.states
+    cheapest_path = array("d", [0.0]) * len(table)
+    parents = array("q", range(len(table)))
+    closed = bytearray(len(table))
+    # The cost and neighbor functions see the parents as a mapping between nodes.
+    paths = ParentView(table, parents)
+    # Numbers are comparable, so they break ties in the heap without a counter.
+    frontier: list[tuple[float, float, int]] = [
+        (heuristic(start), 0.0, number) for number, start in enumerate(table)
+    ]
+    heapq.heapify(frontier)
+    pushed = len(frontier)
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
 
-        for neighbor in next_func(current, paths):
-            new_cost = cheapest_path[current] + cost_func(paths, neighbor, current)
+    try:
+        while len(frontier) > 0:
+            _, _, number = heapq.heappop(frontier)
+            if closed[number]:
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            current = states[number]
+            if is_goal(current):
+                return table.path(parents, number), cheapest_path[number]
+            closed[number] = True
 
-            if new_cost < cheapest_path[neighbor]:
-                paths[neighbor] = current
-                cheapest_path[neighbor] = new_cost
+            current_cost = cheapest_path[number]
+            for neighbor in next_func(current, paths):
+                neighbor_number = numbers.setdefault(neighbor, len(states))
+                if neighbor_number == len(states):
+                    states.append(neighbor)
+                new_cost = current_cost + cost_func(paths, neighbor, current)
+                if neighbor_number == len(cheapest_path):
+                    cheapest_path.append(new_cost)
+                    parents.append(number)
+                    closed.append(False)
+                elif new_cost < cheapest_path[neighbor_number]:
+                    cheapest_path[neighbor_number] = new_cost
+                    parents[neighbor_number] = number
+                    closed[neighbor_number] = False
+                else:
+                    continue
                 heapq.heappush(
                     frontier,
-                    (new_cost + heuristic(neighbor, goal), neighbor),
+                    (
+                        new_cost + heuristic(neighbor),
+                        -new_cost if prefer_deeper else 0.0,
+                        neighbor_number,
+                    ),
                 )
+                pushed += 1
+    finally:
+        if stats is not None:
+            stats.pushed += pushed
+            stats.observe_frontier(len(frontier))
 
     msg = "Could not find a path."
     raise UnsolveableError(msg)
@@ -0,0 +1,172 @@
+"""Distances between every pair of nodes of interest, vectorized with NumPy.
+
+NumPy is an optional dependency, install it with the numpy extra.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from aoc.compiled import CompiledGraph
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    from aoc.dijkstra import Cost
+
+type Method = Literal["auto", "floyd_warshall", "bfs", "dijkstra"]
+
+# Floyd-Warshall does a pass over the whole distance matrix per node, so above this many nodes
+# searching from every node of interest is faster.
+FLOYD_WARSHALL_MAX_NODES = 400
+
+
+@dataclass(frozen=True)
+class DistanceMatrix[S: Hashable]:
+    """The distances between nodes, as a matrix with a row and a column per node.
+
+    Unreachable nodes are infinitely far away.
+    """
+
+    matrix: npt.NDArray[np.float64]
+    index: Mapping[S, int]
+
+    def __getitem__(self, pair: tuple[S, S]) -> float:
+        start, goal = pair
+        return float(self.matrix[self.index[start], self.index[goal]])
+
+    @property
+    def nodes(self) -> list[S]:
+        """The nodes in the order of the rows and columns."""
+        return sorted(self.index, key=self.index.__getitem__)
+
+
+def _csr_arrays[S: Hashable](
+    graph: CompiledGraph[S],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    return (
+        np.asarray(graph.offsets, dtype=np.int64),
+        np.asarray(graph.targets, dtype=np.int64),
+        np.asarray(graph.weights, dtype=np.float64),
+    )
+
+
+def _floyd_warshall[S: Hashable](graph: CompiledGraph[S]) -> npt.NDArray[np.float64]:
+    size = len(graph)
+    distances = np.full((size, size), np.inf)
+    offsets, targets, weights = _csr_arrays(graph)
+    rows = np.repeat(np.arange(size), np.diff(offsets))
+    distances[rows, targets] = weights
+    np.fill_diagonal(distances, 0.0)
+    for via in range(size):
+        np.minimum(distances, distances[:, via, None] + distances[None, via, :], out=distances)
+    return distances
+
+
+def _multi_source_bfs[S: Hashable](
+    graph: CompiledGraph[S],
+    sources: npt.NDArray[np.int64],
+) -> npt.NDArray[np.float64]:
+    """Search from every source at once, with a row of the frontier per source."""
+    offsets, targets, _ = _csr_arrays(graph)
+    distances = np.full((len(sources), len(graph)), np.inf)
+    distances[np.arange(len(sources)), sources] = 0.0
+    rows, nodes = np.arange(len(sources)), sources
+    step = 0
+    while len(rows):
+        step += 1
+        # Gather every edge leaving the frontier, along with the row of the search it is in.
+        firsts = offsets[nodes]
+        counts = offsets[nodes + 1] - firsts
+        edge_rows = np.repeat(rows, counts)
+        edge_offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        edge_targets = targets[np.repeat(firsts, counts) + edge_offsets]
+        new = distances[edge_rows, edge_targets] == np.inf
+        rows, nodes = edge_rows[new], edge_targets[new]
+        distances[rows, nodes] = step
+        # A node reached over several edges at once is only expanded once.
+        unique = np.unique(rows * len(graph) + nodes)
+        rows, nodes = unique // len(graph), unique % len(graph)
+    return distances
+
+
+def _repeated_dijkstra[S: Hashable](
+    graph: CompiledGraph[S],
+    sources: npt.NDArray[np.int64],
+) -> npt.NDArray[np.float64]:
+    distances = np.full((len(sources), len(graph)), np.inf)
+    states = graph.table.states
+    for row, source in enumerate(sources):
+        tree = graph.dijkstra_distances(start=states[source])
+        for node, cost in tree.distances.items():
+            distances[row, graph.table.numbers[node]] = cost
+    return distances
+
+
+def all_pairs_distances[S: Hashable](
+    paths: Mapping[S, set[S]],
+    *,
+    nodes: Iterable[S] | None = None,
+    cost_func: Cost[S] | None = None,
+    method: Method = "auto",
+) -> DistanceMatrix[S]:
+    """Find the distance between every pair of nodes of interest.
+
+    Three methods are available:
+    - floyd_warshall relaxes the whole matrix through one node at a time, which is fastest for
+      small dense graphs.
+    - bfs searches from every node of interest at once, level by level. Every edge costs 1.
+    - dijkstra searches from every node of interest in turn, on a CompiledGraph.
+    By default floyd_warshall is used for graphs of at most FLOYD_WARSHALL_MAX_NODES nodes with
+    at least a quarter of all possible edges, and otherwise bfs or dijkstra, depending on
+    whether a cost function is given.
+
+    Args:
+        paths: The nodes reachable from every node.
+        nodes: The nodes to find the distances between. All nodes by default.
+        cost_func: The cost of every edge, as taken by dijkstra. Every edge costs 1 by default.
+        method: The method to use.
+
+    Returns:
+        The distances, with a row and a column for every node of interest.
+    """
+    node_list = None if nodes is None else list(dict.fromkeys(nodes))
+    if node_list is not None and not all(node in paths for node in node_list):
+        # Nodes of interest that are not in the graph have no edges.
+        paths = {node: set() for node in node_list} | dict(paths)
+    graph = (
+        CompiledGraph.from_mapping(paths)
+        if cost_func is None
+        else CompiledGraph.from_mapping(paths, cost_func=cost_func)
+    )
+    if node_list is None:
+        node_list = list(graph.table)
+    sources = np.array([graph.table.numbers[node] for node in node_list], dtype=np.int64)
+
+    if method == "auto":
+        size = len(graph)
+        dense = 4 * len(graph.targets) >= size * size
+        if dense and size <= FLOYD_WARSHALL_MAX_NODES:
+            method = "floyd_warshall"
+        else:
+            method = "bfs" if cost_func is None else "dijkstra"
+
+    match method:
+        case "floyd_warshall":
+            distances = _floyd_warshall(graph)[np.ix_(sources, sources)]
+        case "bfs":
+            if cost_func is not None:
+                msg = "bfs can only be used when every edge costs 1."
+                raise ValueError(msg)
+            distances = _multi_source_bfs(graph, sources)[:, sources]
+        case "dijkstra":
+            distances = _repeated_dijkstra(graph, sources)[:, sources]
+        case _:
+            msg = f"Unknown method {method!r}."
+            raise ValueError(msg)
+
+    return DistanceMatrix(distances, {node: row for row, node in enumerate(node_list)})
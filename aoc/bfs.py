@@ -1,60 +1,317 @@
-from collections import deque
-from collections.abc import Iterator, Mapping
-from typing import NamedTuple, Protocol, TypeVar
+from array import array
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from typing import Any, Protocol, TypeVar, overload
 
 from aoc.exceptions import UnsolveableError
+from aoc.intern import StateTable
+from aoc.search_tree import (
+    GoalTest,
+    ShortestPathTree,
+    goal_test,
+    join_paths,
+    reconstruct_path,
+    reverse_paths,
+    start_nodes,
+)
+from aoc.stats import SearchStats
 
 S = TypeVar("S")
+S_contra = TypeVar("S_contra", contravariant=True)
 
 
-class Neighbors(Protocol):
+class Neighbors(Protocol[S]):
     def __call__(self, current: S, paths: Mapping[S, set[S]]) -> Iterator[S]: ...
 
 
-class SimpleMappingNeighborFunc(Neighbors):
+class Visited(Protocol[S_contra]):
+    """The part of a set that flood_fill needs, so a VisitedBitset can be used instead."""
+
+    def __contains__(self, node: object, /) -> bool: ...
+
+    def add(self, node: S_contra, /) -> None: ...
+
+
+V = TypeVar("V", bound=Visited[Any])
+
+
+class SimpleMappingNeighborFunc(Neighbors[S]):
     def __call__(self, current: S, paths: Mapping[S, set[S]]) -> Iterator[S]:
         if current not in paths:
             return
         yield from paths[current]
 
 
-_default_neighbor_func = SimpleMappingNeighborFunc()
+_default_neighbor_func = SimpleMappingNeighborFunc[Any]()
+
 
+def breadth_first_search(  # noqa: C901, PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+    stats: SearchStats | None = None,
+    interned: bool = False,
+) -> tuple[list[S], int]:
+    """Find the shortest path from a start to a goal.
+
+    Either a single start or several starts can be given, in which case the path from the
+    nearest one is returned. Likewise either a single goal, a collection of goals, or a
+    predicate that accepts goal nodes can be given. When stats are given, they are filled in
+    during the search. When interned is set, nodes are numbered with an aoc.intern.StateTable
+    and the parents are kept in an array, see dijkstra.
 
-class _SearchPath[S](NamedTuple):
-    path: list[S]
-    cost: int
+    Returns:
+        The path from a start to the nearest goal (inclusive), and its length.
+    """
+    is_goal = goal_test(goal, goals)
+    frontier = start_nodes(start, starts)
+    for node in frontier:
+        if is_goal(node):
+            return [node], 0
+    if interned:
+        return _bfs_interned(frontier, is_goal, paths, next_func, stats)
 
-    @property
-    def current(self) -> S:
-        return self.path[-1]
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func)
+        stats.observe_frontier(len(frontier))
 
+    # Nodes are marked as seen when they are discovered, so every node enters the frontier once.
+    parents: dict[S, S] = {node: node for node in frontier}
+    cost = 0
+    try:
+        while frontier:
+            cost += 1
+            next_frontier: list[S] = []
+            for current in frontier:
+                for next_node in next_func(current, paths=paths):
+                    if next_node in parents:
+                        continue
+                    parents[next_node] = current
+                    if is_goal(next_node):
+                        return reconstruct_path(parents, next_node), cost
+                    next_frontier.append(next_node)
+            frontier = next_frontier
+            if stats is not None:
+                stats.observe_frontier(len(frontier))
+    finally:
+        if stats is not None:
+            stats.pushed += len(parents)
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
 
-def breadth_first_search(
+
+def _bfs_interned(
+    start_list: list[S],
+    is_goal: GoalTest[S],
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S],
+    stats: SearchStats | None,
+) -> tuple[list[S], int]:
+    """The same search as breadth_first_search, on the numbers of the nodes in a StateTable."""
+    table = StateTable(start_list)
+    numbers, states = table.numbers, table.states
+    parents = array("q", range(len(table)))
+    frontier = list(range(len(table)))
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func)
+        stats.observe_frontier(len(frontier))
+
+    cost = 0
+    try:
+        while frontier:
+            cost += 1
+            next_frontier: list[int] = []
+            for number in frontier:
+                for next_node in next_func(states[number], paths=paths):
+                    next_number = numbers.setdefault(next_node, len(states))
+                    if next_number < len(states):
+                        continue
+                    states.append(next_node)
+                    parents.append(number)
+                    if is_goal(next_node):
+                        return table.path(parents, next_number), cost
+                    next_frontier.append(next_number)
+            frontier = next_frontier
+            if stats is not None:
+                stats.observe_frontier(len(frontier))
+    finally:
+        if stats is not None:
+            stats.pushed += len(parents)
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
+
+
+def bfs_distances(
+    *,
+    start: S | None = None,
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+) -> ShortestPathTree[S]:
+    """Find the distance to, and a shortest path to, every node reachable from the start(s)."""
+    frontier = start_nodes(start, starts)
+    distances: dict[S, int] = dict.fromkeys(frontier, 0)
+    parents: dict[S, S] = {node: node for node in frontier}
+    cost = 0
+    while frontier:
+        cost += 1
+        next_frontier: list[S] = []
+        for current in frontier:
+            for next_node in next_func(current, paths=paths):
+                if next_node in parents:
+                    continue
+                parents[next_node] = current
+                distances[next_node] = cost
+                next_frontier.append(next_node)
+        frontier = next_frontier
+
+    return ShortestPathTree(distances, parents)
+
+
+@overload
+def flood_fill(
+    *,
+    start: S | None = None,
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S] = ...,
+    starts: Iterable[S] | None = None,
+    visited: None = None,
+) -> set[S]: ...
+
+
+@overload
+def flood_fill(
+    *,
+    start: S | None = None,
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S] = ...,
+    starts: Iterable[S] | None = None,
+    visited: V,
+) -> V: ...
+
+
+def flood_fill(
+    *,
+    start: S | None = None,
+    paths: Mapping[S, set[S]],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    visited: Visited[S] | None = None,
+) -> Visited[S]:
+    """Find every node reachable from the start(s), without keeping distances or paths.
+
+    Args:
+        start: The node to start from.
+        paths: Passed to next_func.
+        next_func: The nodes reachable from the current node.
+        starts: The nodes to start from, instead of a single start.
+        visited: The container to add the reached nodes to, a new set by default. On bounded
+            grids a VisitedBitset uses a fraction of the memory of a set.
+
+    Returns:
+        The visited container, holding every reachable node.
+    """
+    frontier = start_nodes(start, starts)
+    if visited is None:
+        visited = set()
+    for node in frontier:
+        visited.add(node)
+    # Searching breadth first keeps the frontier to the nodes at the edge of the filled area,
+    # where a stack could grow to hold most of the nodes.
+    while frontier:
+        next_frontier: list[S] = []
+        for current in frontier:
+            for next_node in next_func(current, paths=paths):
+                if next_node not in visited:
+                    visited.add(next_node)
+                    next_frontier.append(next_node)
+        frontier = next_frontier
+    return visited
+
+
+def _expand_level(
+    frontier: list[S],
+    seen: dict[S, S],
+    other: Mapping[S, S],
+    next_func: Neighbors[S],
+    paths: Mapping[S, set[S]],
+) -> tuple[list[S], S | None]:
+    next_frontier: list[S] = []
+    for current in frontier:
+        for next_node in next_func(current, paths=paths):
+            if next_node in seen:
+                continue
+            seen[next_node] = current
+            if next_node in other:
+                return next_frontier, next_node
+            next_frontier.append(next_node)
+    return next_frontier, None
+
+
+def bidirectional_search(
     *,
     start: S,
     goal: S,
     paths: Mapping[S, set[S]],
-    next_func: Neighbors = _default_neighbor_func,
+    next_func: Neighbors[S] = _default_neighbor_func,
+    prev_func: Neighbors[S] | None = None,
 ) -> tuple[list[S], int]:
-    start_path = _SearchPath([start], 0)
-    frontier = deque([start_path])
-    seen = set()
-    while frontier:
-        current_path = frontier.popleft()
-        if current_path.current == goal:
-            return current_path.path, current_path.cost
-        if current_path.current in seen:
-            continue
-        seen.add(current_path.current)
-
-        for next_node in next_func(current_path.current, paths=paths):
-            frontier.append(
-                _SearchPath(
-                    [*current_path.path, next_node],
-                    current_path.cost + 1,
-                ),
+    """Find the shortest path from start to goal, searching from both ends at once.
+
+    Args:
+        start: The node to start searching from.
+        goal: The node to find a path to.
+        paths: The graph, passed on to the neighbor functions.
+        next_func: The nodes reachable from the current node.
+        prev_func: The nodes the current node is reachable from. When not given, this is derived
+            by reversing paths, which requires next_func to be the default.
+
+    Returns:
+        The path from start to goal (inclusive), and its length.
+    """
+    if prev_func is None:
+        if next_func is not _default_neighbor_func:
+            msg = "A prev_func is needed to search backwards with a custom next_func."
+            raise ValueError(msg)
+        prev_func = _default_neighbor_func
+        prev_paths: Mapping[S, set[S]] = reverse_paths(paths)
+    else:
+        prev_paths = paths
+
+    if start == goal:
+        return [start], 0
+
+    forward: dict[S, S] = {start: start}
+    backward: dict[S, S] = {goal: goal}
+    forward_frontier, backward_frontier = [start], [goal]
+    cost = 0
+    while forward_frontier and backward_frontier:
+        cost += 1
+        # Expand whichever side has the smaller frontier by a whole level. The first node seen by
+        # both sides is then on a shortest path.
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_level(
+                forward_frontier,
+                forward,
+                backward,
+                next_func,
+                paths,
+            )
+        else:
+            backward_frontier, meeting = _expand_level(
+                backward_frontier,
+                backward,
+                forward,
+                prev_func,
+                prev_paths,
             )
+        if meeting is not None:
+            return join_paths(forward, backward, meeting), cost
 
     msg = "No paths found"
     raise UnsolveableError(msg)
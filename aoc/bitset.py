@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc.datatypes import Coord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class VisitedBitset:
+    """A set of Coords in a bounded grid, stored as one bit per cell.
+
+    A set of Coords costs over 100 bytes per entry, while this costs an eighth of a byte per
+    cell of the grid, whether it was visited or not. It has the in and add of a set, so it can
+    be used as the visited set of flood_fill. Checking a Coord is slower than with a set, so this
+    is worth it when memory is the limit, like flood fills over millions of cells.
+    """
+
+    def __init__(self, corner: Coord, coords: Iterable[Coord] = ()) -> None:
+        """Create an empty set.
+
+        Args:
+            corner: The corner of the grid, which represents the largest possible row and column.
+            coords: Coords to add to the set.
+        """
+        self.corner = corner
+        self._width = corner.col + 1
+        self._bits = bytearray(((corner.row + 1) * self._width + 7) // 8)
+        for coord in coords:
+            self.add(coord)
+
+    def __contains__(self, coord: object) -> bool:
+        if not isinstance(coord, tuple) or not Coord.within(coord, self.corner):  # type: ignore[arg-type]
+            return False
+        index = coord[0] * self._width + coord[1]
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def add(self, coord: Coord) -> None:
+        if not coord.within(self.corner):
+            msg = f"{coord} is outside of the grid."
+            raise IndexError(msg)
+        index = coord[0] * self._width + coord[1]
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def discard(self, coord: Coord) -> None:
+        if coord.within(self.corner):
+            index = coord[0] * self._width + coord[1]
+            self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __len__(self) -> int:
+        return int.from_bytes(self._bits).bit_count()
+
+    def __iter__(self) -> Iterator[Coord]:
+        width = self._width
+        for byte_index, byte in enumerate(self._bits):
+            bits = byte
+            while bits:
+                bit = bits & -bits
+                index = byte_index * 8 + bit.bit_length() - 1
+                yield Coord(*divmod(index, width))
+                bits ^= bit
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping
+
+from aoc.dijkstra import Cost, unit_cost
+from aoc.exceptions import UnsolveableError
+from aoc.intern import StateTable
+from aoc.search_tree import GoalTest, ShortestPathTree, goal_test, start_nodes
+
+_INF = float("inf")
+
+
+class CompiledGraph[S: Hashable]:
+    """A fixed graph frozen into compressed sparse row arrays, for repeated searches.
+
+    Nodes are numbered with a StateTable. The edges leaving node i are the targets, with their
+    weights, from offsets[i] up to offsets[i + 1]. The searches walk these arrays directly, so
+    they neither call a neighbor or cost function nor hash any node while searching. Compiling
+    visits every edge once, which pays off when the same graph is searched many times.
+    """
+
+    def __init__(
+        self,
+        table: StateTable[S],
+        offsets: array[int],
+        targets: array[int],
+        weights: array[float],
+    ) -> None:
+        self.table = table
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_mapping(
+        cls,
+        paths: Mapping[S, set[S]],
+        cost_func: Cost[S] = unit_cost,
+    ) -> CompiledGraph[S]:
+        """Compile an adjacency mapping, as taken by bfs and dijkstra.
+
+        Args:
+            paths: The nodes reachable from every node.
+            cost_func: The cost of every edge, as taken by dijkstra. Every edge costs 1 by default.
+        """
+        table = StateTable(paths)
+        for next_nodes in paths.values():
+            for next_node in next_nodes:
+                table.intern(next_node)
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for node in table:
+            for next_node in paths.get(node, ()):
+                targets.append(table.intern(next_node))
+                weights.append(cost_func(paths, next_node, node))
+            offsets.append(len(targets))
+        return cls(table, offsets, targets, weights)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.table
+
+    def neighbors(self, node: S) -> Iterator[tuple[S, float]]:
+        """Yield the nodes reachable from the node, with the cost of getting there."""
+        number = self.table.numbers[node]
+        states = self.table.states
+        for index in range(self.offsets[number], self.offsets[number + 1]):
+            yield states[self.targets[index]], self.weights[index]
+
+    def _numbers(self, start: S | None, starts: Iterable[S] | None) -> list[int]:
+        numbers = self.table.numbers
+        for node in (start_list := start_nodes(start, starts)):
+            if node not in numbers:
+                msg = f"{node!r} is not in the graph."
+                raise UnsolveableError(msg)
+        return [numbers[node] for node in start_list]
+
+    def bfs(
+        self,
+        *,
+        start: S | None = None,
+        goal: S | None = None,
+        starts: Iterable[S] | None = None,
+        goals: Collection[S] | GoalTest[S] | None = None,
+    ) -> tuple[list[S], int]:
+        """Find the path with the fewest edges from a start to a goal, like breadth_first_search.
+
+        Returns:
+            The path from a start to the nearest goal (inclusive), and its length.
+        """
+        is_goal = goal_test(goal, goals)
+        states, offsets, targets = self.table.states, self.offsets, self.targets
+        frontier = self._numbers(start, starts)
+        parents = array("q", [-1]) * len(states)
+        for number in frontier:
+            if is_goal(states[number]):
+                return [states[number]], 0
+            parents[number] = number
+
+        cost = 0
+        while frontier:
+            cost += 1
+            next_frontier: list[int] = []
+            for number in frontier:
+                for next_number in targets[offsets[number] : offsets[number + 1]]:
+                    if parents[next_number] != -1:
+                        continue
+                    parents[next_number] = number
+                    if is_goal(states[next_number]):
+                        return self.table.path(parents, next_number), cost
+                    next_frontier.append(next_number)
+            frontier = next_frontier
+
+        msg = "No paths found"
+        raise UnsolveableError(msg)
+
+    def dijkstra(
+        self,
+        *,
+        start: S | None = None,
+        goal: S | None = None,
+        starts: Iterable[S] | None = None,
+        goals: Collection[S] | GoalTest[S] | None = None,
+    ) -> tuple[list[S], float]:
+        """Find the cheapest path from a start to a goal, like dijkstra.
+
+        Returns:
+            The path from a start to the cheapest goal (inclusive), and its cost.
+        """
+        is_goal = goal_test(goal, goals)
+        states, offsets, targets, weights = (
+            self.table.states,
+            self.offsets,
+            self.targets,
+            self.weights,
+        )
+        distances, parents, frontier = self._start_search(self._numbers(start, starts))
+        while frontier:
+            cost, number = heapq.heappop(frontier)
+            if cost > distances[number]:
+                continue
+            if is_goal(states[number]):
+                return self.table.path(parents, number), cost
+
+            first, last = offsets[number], offsets[number + 1]
+            for next_number, weight in zip(targets[first:last], weights[first:last], strict=True):
+                next_cost = cost + weight
+                if next_cost < distances[next_number]:
+                    distances[next_number] = next_cost
+                    parents[next_number] = number
+                    heapq.heappush(frontier, (next_cost, next_number))
+
+        msg = "No paths found"
+        raise UnsolveableError(msg)
+
+    def dijkstra_distances(
+        self,
+        *,
+        start: S | None = None,
+        starts: Iterable[S] | None = None,
+    ) -> ShortestPathTree[S]:
+        """Find the cost of, and a cheapest path to, every node reachable from the start(s)."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances, parents, frontier = self._start_search(self._numbers(start, starts))
+        while frontier:
+            cost, number = heapq.heappop(frontier)
+            if cost > distances[number]:
+                continue
+
+            first, last = offsets[number], offsets[number + 1]
+            for next_number, weight in zip(targets[first:last], weights[first:last], strict=True):
+                next_cost = cost + weight
+                if next_cost < distances[next_number]:
+                    distances[next_number] = next_cost
+                    parents[next_number] = number
+                    heapq.heappush(frontier, (next_cost, next_number))
+
+        states = self.table.states
+        return ShortestPathTree(
+            {states[number]: cost for number, cost in enumerate(distances) if cost != _INF},
+            {
+                states[number]: states[parent]
+                for number, parent in enumerate(parents)
+                if parent != -1
+            },
+        )
+
+    def _start_search(
+        self,
+        start_list: list[int],
+    ) -> tuple[array[float], array[int], list[tuple[float, int]]]:
+        distances = array("d", [_INF]) * len(self.table)
+        parents = array("q", [-1]) * len(self.table)
+        for number in start_list:
+            distances[number] = 0.0
+            parents[number] = number
+        # Numbers are comparable, so they break ties in the heap without a counter.
+        return distances, parents, [(0.0, number) for number in start_list]
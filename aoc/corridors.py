@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from aoc.dijkstra import Cost, unit_cost
+from aoc.search_tree import reverse_paths
+
+if TYPE_CHECKING:
+    from aoc.datatypes import Coord
+
+
+@dataclass(frozen=True)
+class JunctionGraph[S: Hashable]:
+    """A graph in which every corridor of a larger graph is replaced by a single weighted edge.
+
+    The paths and cost_func can be passed straight to dijkstra, and the path it finds can be
+    turned back into a path through the original graph with expand.
+    """
+
+    paths: Mapping[S, set[S]]
+    costs: Mapping[tuple[S, S], float]
+    # The nodes strictly between the two ends of every edge, in the order they are walked.
+    corridors: Mapping[tuple[S, S], tuple[S, ...]]
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.paths
+
+    def cost_func(self, paths: Mapping[S, set[S]], current: S, last: S) -> float:  # noqa: ARG002
+        """The cost of the edge from last to current, in the Cost signature of dijkstra."""
+        return self.costs[last, current]
+
+    def expand(self, path: Iterable[S]) -> list[S]:
+        """Turn a path through the junctions into a path through every node of the corridors."""
+        expanded: list[S] = []
+        for node in path:
+            if expanded:
+                expanded.extend(self.corridors[expanded[-1], node])
+            expanded.append(node)
+        return expanded
+
+
+def _grid_paths(walkable: Collection[Coord]) -> dict[Coord, set[Coord]]:
+    return {
+        cell: {neighbor for neighbor in cell.neighbors4() if neighbor in walkable}
+        for cell in walkable
+    }
+
+
+def contract_corridors[S: Hashable](
+    graph: Mapping[S, set[S]] | Collection[S],
+    *,
+    keep: Iterable[S] = (),
+    cost_func: Cost[S] = unit_cost,
+) -> JunctionGraph[S]:
+    """Contract every chain of nodes with exactly two neighbors into a single weighted edge.
+
+    A node is part of a corridor when it has exactly two neighbors, and can be entered from both
+    of them, so one way corridors in a directed graph are left alone. Loops made only of
+    corridor nodes are not connected to any junction, and are dropped.
+
+    Args:
+        graph: An adjacency mapping, or a collection of walkable Coords which are connected to
+            their four direct neighbors.
+        keep: Nodes that must stay in the contracted graph, like the start and goal.
+        cost_func: The cost of an edge in the original graph. Every edge costs 1 by default.
+
+    Returns:
+        The graph between the junctions, with the cheapest corridor between every pair.
+    """
+    paths = (
+        cast("Mapping[S, set[S]]", graph)
+        if isinstance(graph, Mapping)
+        else cast("dict[S, set[S]]", _grid_paths(cast("Collection[Coord]", graph)))
+    )
+    incoming = reverse_paths(paths)
+    kept = set(keep)
+
+    def in_corridor(node: S) -> bool:
+        next_nodes = paths.get(node, set())
+        return node not in kept and len(next_nodes) == 2 and incoming.get(node) == next_nodes  # noqa: PLR2004
+
+    junctions = {node for node in (*paths, *incoming, *kept) if not in_corridor(node)}
+    junction_paths: dict[S, set[S]] = {node: set() for node in junctions}
+    costs: dict[tuple[S, S], float] = {}
+    corridors: dict[tuple[S, S], tuple[S, ...]] = {}
+    for junction in junctions:
+        for first in paths.get(junction, ()):
+            last, current = junction, first
+            cost = cost_func(paths, current, last)
+            cells: list[S] = []
+            while current not in junctions:
+                cells.append(current)
+                (next_node,) = paths[current] - {last}
+                last, current = current, next_node
+                cost += cost_func(paths, current, last)
+            edge = (junction, current)
+            if current == junction or cost >= costs.get(edge, float("inf")):
+                continue
+            junction_paths[junction].add(current)
+            costs[edge] = cost
+            corridors[edge] = tuple(cells)
+
+    return JunctionGraph(junction_paths, costs, corridors)
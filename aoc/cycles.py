@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+# Enough fingerprints for simulations that repeat within a million steps, in roughly 100MB.
+MAX_FINGERPRINTS = 1 << 20
+
+
+@dataclass(frozen=True)
+class Cycle:
+    """States repeat from step start onwards, every length steps."""
+
+    start: int
+    length: int
+
+    def reduce(self, steps: int) -> int:
+        """The smallest number of steps that leads to the same state as the given number."""
+        if steps < self.start:
+            return steps
+        return self.start + (steps - self.start) % self.length
+
+
+def _identity[S](state: S) -> S:
+    return state
+
+
+def _advance[S](state: S, step: Callable[[S], S], steps: int) -> S:
+    for _ in range(steps):
+        state = step(state)
+    return state
+
+
+def _brent[S](
+    state: S,
+    step: Callable[[S], S],
+    key: Callable[[S], Hashable],
+    limit: int | None = None,
+) -> tuple[S, int, int | None]:
+    """Walk ahead until a state repeats, keeping only two states, with Brent's algorithm.
+
+    Returns:
+        The state the walk stopped at, the number of steps taken to get there, and the length
+        of the cycle, or None if no state repeated within the limit.
+    """
+    power = length = 1
+    tortoise = key(state)
+    hare, taken = step(state), 1
+    while (hare_key := key(hare)) != tortoise:
+        if limit is not None and taken >= limit:
+            return hare, taken, None
+        if power == length:
+            # Move the tortoise up to the hare, and give the hare twice as long to catch it.
+            tortoise = hare_key
+            power *= 2
+            length = 0
+        hare, taken = step(hare), taken + 1
+        length += 1
+    return hare, taken, length
+
+
+def find_cycle[S](
+    state: S,
+    step: Callable[[S], S],
+    *,
+    key: Callable[[S], Hashable] = _identity,
+) -> Cycle:
+    """Find where, and how often, the states of a simulation start repeating.
+
+    Only a couple of states are kept at any time, so this works for states of any size. Every
+    state is stepped at most about three times as often as the start plus the length of the
+    cycle. It never returns if the states never repeat.
+
+    Args:
+        state: The first state.
+        step: Returns the next state. It must not change the state it is given.
+        key: Turns a state into a value that is equal for equal states, for example a tuple
+            for states that are lists. The states themselves are compared by default.
+
+    Returns:
+        The first step of the cycle, and its length.
+    """
+    # Without a limit, the walk only stops once it finds the cycle.
+    length = cast("int", _brent(state, step, key)[2])
+    # With one pointer a cycle's length ahead, the pointers meet at the start of the cycle.
+    tortoise, hare = state, _advance(state, step, length)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def state_after[S](
+    state: S,
+    step: Callable[[S], S],
+    steps: int,
+    *,
+    key: Callable[[S], Hashable] = _identity,
+    max_fingerprints: int = MAX_FINGERPRINTS,
+) -> S:
+    """Find the state after a number of steps, skipping ahead once the states repeat.
+
+    The hash of every state is remembered along with its step, instead of the state itself.
+    When a hash comes up again, the state is stepped through the supposed cycle once, to make
+    sure it really repeats. Once max_fingerprints hashes are stored, or if two different states
+    turn out to have the same hash, the rest of the walk uses Brent's algorithm. It needs no
+    memory, but takes a few times as many steps.
+
+    Args:
+        state: The first state.
+        step: Returns the next state. It must not change the state it is given.
+        steps: The number of steps to take.
+        key: Turns a state into a hashable value that is equal for equal states, for example
+            a tuple for states that are lists. The states themselves are hashed by default.
+        max_fingerprints: The most hashes to store.
+
+    Returns:
+        The state after the given number of steps.
+    """
+    fingerprints: dict[int, int] = {}
+    for done in range(steps):
+        current = key(state)
+        fingerprint = hash(current)
+        seen = fingerprints.get(fingerprint)
+        if seen is None and len(fingerprints) < max_fingerprints:
+            fingerprints[fingerprint] = done
+            state = step(state)
+            continue
+
+        left = steps - done
+        if seen is not None:
+            length = done - seen
+            if left <= length:
+                return _advance(state, step, left)
+            if key(_advance(state, step, length)) == current:
+                return _advance(state, step, left % length)
+        # Out of room for fingerprints, or two different states had the same hash.
+        hare, taken, brent_length = _brent(state, step, key, left)
+        if brent_length is None:
+            return hare
+        return _advance(hare, step, (left - taken) % brent_length)
+    return state
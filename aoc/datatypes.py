@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import itertools
 from enum import Enum
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class Direction(Enum):
@@ -11,6 +13,23 @@ class Direction(Enum):
     WEST = "W"
     EAST = "E"
 
+    # Set for every member below the Coord class, see _DIRECTION_OFFSETS.
+    _offset: tuple[int, int]
+
+    @property
+    def delta(self) -> Coord:
+        return _DIRECTION_DELTAS[self]
+
+    @property
+    def opposite(self) -> Direction:
+        return _OPPOSITES[self]
+
+    def turn_left(self) -> Direction:
+        return _LEFT_TURNS[self]
+
+    def turn_right(self) -> Direction:
+        return _RIGHT_TURNS[self]
+
 
 class Coord(NamedTuple):
     row: int
@@ -18,21 +37,12 @@ class Coord(NamedTuple):
 
     def __add__(self, other: object) -> Coord:
         if isinstance(other, Coord):
-            delta = other
-        elif isinstance(other, Direction):
-            match other:
-                case Direction.NORTH:
-                    delta = Coord(-1, 0)
-                case Direction.SOUTH:
-                    delta = Coord(1, 0)
-                case Direction.WEST:
-                    delta = Coord(0, -1)
-                case Direction.EAST:
-                    delta = Coord(0, 1)
-        else:
-            msg = "Coords can only be added with themselves and Directions."
-            raise TypeError(msg)
-        return Coord(self.row + delta.row, self.col + delta.col)
+            return _new_coord(Coord, (self[0] + other[0], self[1] + other[1]))
+        if isinstance(other, Direction):
+            row, col = other._offset
+            return _new_coord(Coord, (self[0] + row, self[1] + col))
+        msg = "Coords can only be added with themselves and Directions."
+        raise TypeError(msg)
 
     def __neg__(self) -> Coord:
         return Coord(-self.row, -self.col)
@@ -57,12 +67,10 @@ class Coord(NamedTuple):
         Returns:
             All coordinates neighboring this coordinate.
         """
-        all_neighbors = []
-        for row, col in itertools.product(range(-1, 2, 1), repeat=2):
-            if row == 0 and col == 0:
-                continue
-            all_neighbors.append(Coord(self.row + row, self.col + col))
-        return all_neighbors
+        row, col = self
+        return [
+            _new_coord(Coord, (row + d_row, col + d_col)) for d_row, d_col in NEIGHBOR_OFFSETS_8
+        ]
 
     def get_neighbors_limited(self, corner: Coord) -> list[Coord]:
         """Gets all neighboring coords to the coordinate, but stays within the bounds of given by
@@ -75,16 +83,90 @@ class Coord(NamedTuple):
             All the coordinates surrounding the current coordinate, that do not exceed the bounds
             of the corner.
         """
-        neighbors = self.get_neighbors()
+        return list(self.neighbors8(corner))
 
-        def filter_below_bounds(coord: Coord) -> bool:
-            return coord.row > -1 and coord.col > -1
+    def within(self, corner: Coord) -> bool:
+        """Whether the coordinate lies in the bounds used by get_neighbors_limited.
 
-        # Filter out neighbors that are smaller than the top row or left column
-        neighbors = list(filter(filter_below_bounds, neighbors))
+        Args:
+            corner: The corner of the area, which represents the largest possible row and column.
 
-        def filter_above_bounds(coord: Coord) -> bool:
-            return coord.row <= corner.row and coord.col <= corner.col
+        Returns:
+            Whether the coordinate lies between the origin and the corner (inclusive).
+        """
+        return 0 <= self[0] <= corner[0] and 0 <= self[1] <= corner[1]
+
+    def neighbors4(self, corner: Coord | None = None) -> Iterator[Coord]:
+        """Yields the coords directly above, below, left and right of the coordinate.
 
-        # Filter out the neighbors that are larger than the corner row or column
-        return list(filter(filter_above_bounds, neighbors))
+        Args:
+            corner: If given, only coords between the origin and the corner are yielded.
+        """
+        return self._neighbors(NEIGHBOR_OFFSETS_4, corner)
+
+    def neighbors8(self, corner: Coord | None = None) -> Iterator[Coord]:
+        """Yields the coords surrounding the coordinate, including the diagonals.
+
+        Args:
+            corner: If given, only coords between the origin and the corner are yielded.
+        """
+        return self._neighbors(NEIGHBOR_OFFSETS_8, corner)
+
+    def _neighbors(
+        self,
+        offsets: tuple[tuple[int, int], ...],
+        corner: Coord | None,
+    ) -> Iterator[Coord]:
+        row, col = self
+        if corner is None:
+            for d_row, d_col in offsets:
+                yield _new_coord(Coord, (row + d_row, col + d_col))
+            return
+        max_row, max_col = corner
+        for d_row, d_col in offsets:
+            new_row = row + d_row
+            new_col = col + d_col
+            if 0 <= new_row <= max_row and 0 <= new_col <= max_col:
+                yield _new_coord(Coord, (new_row, new_col))
+
+
+# Creating coords through tuple.__new__ skips the generated NamedTuple.__new__, which is
+# noticeably faster on hot paths.
+_new_coord = tuple.__new__
+
+# In the same order as Coord.get_neighbors has always returned them.
+NEIGHBOR_OFFSETS_8: tuple[tuple[int, int], ...] = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+NEIGHBOR_OFFSETS_4: tuple[tuple[int, int], ...] = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+_DIRECTION_OFFSETS: dict[Direction, tuple[int, int]] = {
+    Direction.NORTH: (-1, 0),
+    Direction.SOUTH: (1, 0),
+    Direction.WEST: (0, -1),
+    Direction.EAST: (0, 1),
+}
+for _direction, _offset in _DIRECTION_OFFSETS.items():
+    _direction._offset = _offset  # noqa: SLF001
+del _direction, _offset
+_DIRECTION_DELTAS = {direction: Coord(*offset) for direction, offset in _DIRECTION_OFFSETS.items()}
+_OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.WEST: Direction.EAST,
+    Direction.EAST: Direction.WEST,
+}
+_LEFT_TURNS = {
+    Direction.NORTH: Direction.WEST,
+    Direction.WEST: Direction.SOUTH,
+    Direction.SOUTH: Direction.EAST,
+    Direction.EAST: Direction.NORTH,
+}
+_RIGHT_TURNS = {direction: left for left, direction in _LEFT_TURNS.items()}
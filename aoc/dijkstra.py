@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 import heapq
-from collections.abc import Hashable, Iterator, Mapping
-from typing import Any, NamedTuple, Protocol
+import itertools
+from array import array
+from collections import deque
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Protocol
 
 from aoc.exceptions import UnsolveableError
+from aoc.intern import StateTable
+from aoc.search_tree import (
+    GoalTest,
+    ShortestPathDag,
+    ShortestPathTree,
+    goal_test,
+    join_paths,
+    reconstruct_path,
+    reverse_paths,
+    start_nodes,
+)
+
+if TYPE_CHECKING:
+    from aoc.pq import PriorityQueue, QueueFactory
+    from aoc.stats import SearchStats
 
 
 class Neighbors[S: Hashable](Protocol):
@@ -22,43 +40,541 @@ class Cost[S: Hashable](Protocol):
     def __call__(self, paths: Mapping[S, set[S]], current: S, last: S) -> float: ...
 
 
+class UnitCost[S: Hashable](Cost[S]):
+    """Every step costs 1. It accepts any paths mapping, so a_star can use it as well."""
+
+    def __call__(self, paths: Mapping[S, Any], current: S, last: S) -> float:  # noqa: ARG002
+        return 1.0
+
+
 _default_neighbor_func = SimpleMappingNeighborFunc[Any]()
+unit_cost = UnitCost[Any]()
+
+# Above this maximum edge cost, dijkstra_auto uses a heap instead of Dial's buckets.
+DIAL_MAX_COST = 10_000
+
+
+def dijkstra[S: Hashable](  # noqa: C901, PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+    stats: SearchStats | None = None,
+    queue: QueueFactory[S] | None = None,
+    interned: bool = False,
+) -> tuple[list[S], float]:
+    """Find the cheapest path from a start to a goal.
+
+    Either a single start or several starts can be given, in which case the path from the
+    cheapest one is returned. Likewise either a single goal, a collection of goals, or a
+    predicate that accepts goal nodes can be given. When stats are given, they are filled in
+    during the search. The frontier is a heapq heap, unless a queue from aoc.pq is given.
+
+    When interned is set, nodes are numbered with an aoc.intern.StateTable, and the costs and
+    parents are kept in arrays indexed by those numbers. Every generated node is then hashed
+    once, which is faster when nodes are large tuples or frozensets.
+
+    Returns:
+        The path from a start to the cheapest goal (inclusive), and its cost.
+    """
+    is_goal = goal_test(goal, goals)
+    start_list = start_nodes(start, starts)
+    if interned:
+        if queue is not None:
+            msg = "interned can not be used with a custom queue."
+            raise ValueError(msg)
+        return _dijkstra_interned(start_list, is_goal, paths, cost_func, next_func, stats)
+    if queue is not None:
+        return _dijkstra_with_queue(
+            start_list,
+            is_goal,
+            paths,
+            cost_func,
+            next_func,
+            queue(),
+            stats,
+        )
+    distances: dict[S, float] = dict.fromkeys(start_list, 0.0)
+    parents: dict[S, S] = {node: node for node in start_list}
+    # The counter breaks ties between equal costs, so nodes themselves are never compared.
+    counter = itertools.count()
+    frontier: list[tuple[float, int, S]] = [(0.0, next(counter), node) for node in start_list]
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
+
+    try:
+        while frontier:
+            cost, _, current = heapq.heappop(frontier)
+            if cost > distances[current]:
+                # A cheaper entry for this node was already expanded.
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            if is_goal(current):
+                return reconstruct_path(parents, current), cost
+
+            for next_node in next_func(current, paths=paths):
+                next_cost = cost + cost_func(paths, next_node, current)
+                if next_cost < distances.get(next_node, float("inf")):
+                    distances[next_node] = next_cost
+                    parents[next_node] = current
+                    heapq.heappush(frontier, (next_cost, next(counter), next_node))
+    finally:
+        if stats is not None:
+            stats.pushed += next(counter)
+            stats.observe_frontier(len(frontier))
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
+
+
+def _dijkstra_with_queue[S: Hashable](  # noqa: PLR0913, PLR0917
+    start_list: list[S],
+    is_goal: GoalTest[S],
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S],
+    frontier: PriorityQueue[S],
+    stats: SearchStats | None,
+) -> tuple[list[S], float]:
+    """The same search as dijkstra, with a pluggable priority queue as the frontier."""
+    distances: dict[S, float] = dict.fromkeys(start_list, 0.0)
+    parents: dict[S, S] = {node: node for node in start_list}
+    for node in start_list:
+        frontier.push(node, 0.0)
+    pushed = len(start_list)
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
+
+    try:
+        while frontier:
+            cost, current = frontier.pop()
+            if cost > distances[current]:
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            if is_goal(current):
+                return reconstruct_path(parents, current), cost
 
+            for next_node in next_func(current, paths=paths):
+                next_cost = cost + cost_func(paths, next_node, current)
+                if next_cost < distances.get(next_node, float("inf")):
+                    distances[next_node] = next_cost
+                    parents[next_node] = current
+                    frontier.push(next_node, next_cost)
+                    pushed += 1
+    finally:
+        if stats is not None:
+            stats.pushed += pushed
+            stats.observe_frontier(len(frontier))
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
+
+
+def _dijkstra_interned[S: Hashable](  # noqa: PLR0913, PLR0917
+    start_list: list[S],
+    is_goal: GoalTest[S],
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S],
+    stats: SearchStats | None,
+) -> tuple[list[S], float]:
+    """The same search as dijkstra, on the numbers of the nodes in a StateTable."""
+    table = StateTable(start_list)
+    numbers, states = table.numbers, table.states
+    distances = array("d", [0.0]) * len(table)
+    parents = array("q", range(len(table)))
+    # Numbers are comparable, so they break ties in the heap without a counter.
+    frontier: list[tuple[float, int]] = [(0.0, number) for number in range(len(table))]
+    pushed = len(frontier)
+    if stats is not None:
+        next_func = stats.timed_neighbors(next_func, frontier)
+        cost_func = stats.timed_cost(cost_func)
+
+    try:
+        while frontier:
+            cost, number = heapq.heappop(frontier)
+            if cost > distances[number]:
+                if stats is not None:
+                    stats.stale_skipped += 1
+                continue
+            current = states[number]
+            if is_goal(current):
+                return table.path(parents, number), cost
+
+            for next_node in next_func(current, paths=paths):
+                next_cost = cost + cost_func(paths, next_node, current)
+                next_number = numbers.setdefault(next_node, len(states))
+                if next_number == len(states):
+                    states.append(next_node)
+                    distances.append(next_cost)
+                    parents.append(number)
+                elif next_cost < distances[next_number]:
+                    distances[next_number] = next_cost
+                    parents[next_number] = number
+                else:
+                    continue
+                heapq.heappush(frontier, (next_cost, next_number))
+                pushed += 1
+    finally:
+        if stats is not None:
+            stats.pushed += pushed
+            stats.observe_frontier(len(frontier))
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
 
-class _SearchPath[S: Hashable](NamedTuple):
-    path: list[S]
-    cost: float
 
-    @property
-    def current(self) -> S:
-        return self.path[-1]
+def dijkstra_distances[S: Hashable](
+    *,
+    start: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+) -> ShortestPathTree[S]:
+    """Find the cost of, and a cheapest path to, every node reachable from the start(s)."""
+    start_list = start_nodes(start, starts)
+    distances: dict[S, float] = dict.fromkeys(start_list, 0.0)
+    parents: dict[S, S] = {node: node for node in start_list}
+    counter = itertools.count()
+    frontier: list[tuple[float, int, S]] = [(0.0, next(counter), node) for node in start_list]
+    while frontier:
+        cost, _, current = heapq.heappop(frontier)
+        if cost > distances[current]:
+            continue
+
+        for next_node in next_func(current, paths=paths):
+            next_cost = cost + cost_func(paths, next_node, current)
+            if next_cost < distances.get(next_node, float("inf")):
+                distances[next_node] = next_cost
+                parents[next_node] = current
+                heapq.heappush(frontier, (next_cost, next(counter), next_node))
 
+    return ShortestPathTree(distances, parents)
 
-def dijkstra[S: Hashable](
+
+def dijkstra_all_best[S: Hashable](  # noqa: C901, PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+) -> ShortestPathDag[S]:
+    """Find every cheapest path from a start to a goal, in a single search.
+
+    Takes the same start and goal arguments as dijkstra. Instead of a single parent, every node
+    keeps all neighbors it can be reached from at its lowest cost.
+
+    Returns:
+        The predecessors of every node no further away than the nearest goals, from which the
+        paths can be counted or walked.
+
+    Raises:
+        ValueError: If an edge does not cost more than 0, as edges between nodes at the same
+            distance would make the predecessors loop.
+    """
+    is_goal = goal_test(goal, goals)
+    start_list = start_nodes(start, starts)
+    distances: dict[S, float] = dict.fromkeys(start_list, 0.0)
+    predecessors: dict[S, set[S]] = {node: set() for node in start_list}
+    counter = itertools.count()
+    frontier: list[tuple[float, int, S]] = [(0.0, next(counter), node) for node in start_list]
+    found: list[S] = []
+    while frontier:
+        cost, _, current = heapq.heappop(frontier)
+        if found and cost > distances[found[0]]:
+            break
+        if cost > distances[current]:
+            continue
+        if is_goal(current):
+            found.append(current)
+        if found:
+            # Only goals at the same cost are left to find, and they can not be reached through
+            # nodes at that cost.
+            continue
+
+        for next_node in next_func(current, paths=paths):
+            edge_cost = cost_func(paths, next_node, current)
+            if edge_cost <= 0:
+                msg = f"Edge costs need to be positive, but got {edge_cost}."
+                raise ValueError(msg)
+            next_cost = cost + edge_cost
+            best_cost = distances.get(next_node, float("inf"))
+            if next_cost < best_cost:
+                distances[next_node] = next_cost
+                predecessors[next_node] = {current}
+                heapq.heappush(frontier, (next_cost, next(counter), next_node))
+            elif next_cost == best_cost:
+                predecessors[next_node].add(current)
+
+    if not found:
+        msg = "No paths found"
+        raise UnsolveableError(msg)
+    # Nodes further away than the goals may not have all their predecessors yet.
+    best_cost = distances[found[0]]
+    settled = {node: cost for node, cost in distances.items() if cost <= best_cost}
+    return ShortestPathDag(
+        settled,
+        {node: predecessors[node] for node in settled},
+        tuple(found),
+    )
+
+
+def bidirectional_dijkstra[S: Hashable](  # noqa: C901, PLR0913
     *,
     start: S,
     goal: S,
     paths: Mapping[S, set[S]],
     cost_func: Cost[S],
     next_func: Neighbors[S] = _default_neighbor_func,
+    prev_func: Neighbors[S] | None = None,
 ) -> tuple[list[S], float]:
-    start_path = _SearchPath([start], 0.0)
-    frontier = [(start_path.cost, start_path)]
-    seen = set()
+    """Find the cheapest path from start to goal, searching from both ends at once.
+
+    Args:
+        start: The node to start searching from.
+        goal: The node to find a path to.
+        paths: The graph, passed on to the neighbor and cost functions.
+        cost_func: The cost of stepping from the last node to the current one. The backwards
+            search calls it with the edges in their original direction.
+        next_func: The nodes reachable from the current node.
+        prev_func: The nodes the current node is reachable from. When not given, this is derived
+            by reversing paths, which requires next_func to be the default.
+
+    Returns:
+        The path from start to goal (inclusive), and its cost.
+    """
+    if prev_func is None:
+        if next_func is not _default_neighbor_func:
+            msg = "A prev_func is needed to search backwards with a custom next_func."
+            raise ValueError(msg)
+        prev_func = _default_neighbor_func
+        prev_paths: Mapping[S, set[S]] = reverse_paths(paths)
+    else:
+        prev_paths = paths
+
+    def backward_cost(paths: Mapping[S, set[S]], current: S, last: S) -> float:
+        return cost_func(paths, last, current)
+
+    # Everything the two searches need is indexed by side: 0 is forwards, 1 is backwards.
+    neighbor_funcs = ((next_func, paths), (prev_func, prev_paths))
+    cost_funcs = (cost_func, backward_cost)
+    distances = ({start: 0.0}, {goal: 0.0})
+    parents = ({start: start}, {goal: goal})
+    counter = itertools.count()
+    frontiers: tuple[list[tuple[float, int, S]], list[tuple[float, int, S]]] = (
+        [(0.0, next(counter), start)],
+        [(0.0, next(counter), goal)],
+    )
+    best_cost = 0.0 if start == goal else float("inf")
+    meeting = start
+
+    while frontiers[0] and frontiers[1]:
+        # Once the cheapest unexpanded nodes on both sides together cost more than the best path
+        # found so far, no cheaper path can be found.
+        if frontiers[0][0][0] + frontiers[1][0][0] >= best_cost:
+            break
+
+        side = 0 if frontiers[0][0][0] <= frontiers[1][0][0] else 1
+        cost, _, current = heapq.heappop(frontiers[side])
+        if cost > distances[side][current]:
+            continue
+
+        this_distances, other_distances = distances[side], distances[1 - side]
+        side_next_func, side_paths = neighbor_funcs[side]
+        side_cost_func = cost_funcs[side]
+        for next_node in side_next_func(current, paths=side_paths):
+            next_cost = cost + side_cost_func(paths, next_node, current)
+            if next_cost >= this_distances.get(next_node, float("inf")):
+                continue
+            this_distances[next_node] = next_cost
+            parents[side][next_node] = current
+            heapq.heappush(frontiers[side], (next_cost, next(counter), next_node))
+            if next_node in other_distances:
+                total = next_cost + other_distances[next_node]
+                if total < best_cost:
+                    best_cost, meeting = total, next_node
+
+    if best_cost == float("inf"):
+        msg = "No paths found"
+        raise UnsolveableError(msg)
+    return join_paths(parents[0], parents[1], meeting), best_cost
+
+
+def _invalid_cost(cost: float, max_cost: int) -> ValueError:
+    msg = f"Edge costs need to be integers from 0 to {max_cost}, but got {cost}."
+    return ValueError(msg)
+
+
+def zero_one_bfs[S: Hashable](  # noqa: PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+) -> tuple[list[S], float]:
+    """Find the cheapest path where every edge costs 0 or 1, with a deque instead of a heap.
+
+    Free edges go to the front of the deque and unit edges to the back, which keeps the deque
+    sorted by cost. The arguments and result are the same as for dijkstra.
+
+    Raises:
+        ValueError: If an edge costs something other than 0 or 1.
+    """
+    is_goal = goal_test(goal, goals)
+    start_list = start_nodes(start, starts)
+    distances: dict[S, int] = dict.fromkeys(start_list, 0)
+    parents: dict[S, S] = {node: node for node in start_list}
+    frontier = deque((0, node) for node in start_list)
     while frontier:
-        _, current_path = heapq.heappop(frontier)
-        if current_path.current == goal:
-            return current_path.path, current_path.cost
-        if current_path.current in seen:
+        cost, current = frontier.popleft()
+        if cost > distances[current]:
             continue
-        seen.add(current_path.current)
+        if is_goal(current):
+            return reconstruct_path(parents, current), float(cost)
 
-        for next_node in next_func(current_path.current, paths=paths):
-            next_search_path = _SearchPath(
-                [*current_path.path, next_node],
-                current_path.cost + cost_func(paths, next_node, current_path.current),
-            )
-            heapq.heappush(frontier, (next_search_path.cost, next_search_path))
+        for next_node in next_func(current, paths=paths):
+            edge_cost = cost_func(paths, next_node, current)
+            if edge_cost not in (0, 1):
+                raise _invalid_cost(edge_cost, 1)
+            next_cost = cost + int(edge_cost)
+            if next_cost < distances.get(next_node, next_cost + 1):
+                distances[next_node] = next_cost
+                parents[next_node] = current
+                if edge_cost:
+                    frontier.append((next_cost, next_node))
+                else:
+                    frontier.appendleft((next_cost, next_node))
 
     msg = "No paths found"
     raise UnsolveableError(msg)
+
+
+def dial[S: Hashable](  # noqa: PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    max_cost: int,
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+) -> tuple[list[S], float]:
+    """Find the cheapest path where every edge has a small integer cost, with Dial's algorithm.
+
+    Instead of a heap, nodes are kept in a ring of max_cost + 1 buckets, one per cost. Every
+    node in the frontier costs at most max_cost more than the cheapest one, so the ring never
+    wraps onto itself. The arguments and result are the same as for dijkstra.
+
+    Raises:
+        ValueError: If an edge cost is not an integer from 0 to max_cost.
+    """
+    is_goal = goal_test(goal, goals)
+    start_list = start_nodes(start, starts)
+    distances: dict[S, int] = dict.fromkeys(start_list, 0)
+    parents: dict[S, S] = {node: node for node in start_list}
+    bucket_count = max_cost + 1
+    buckets: list[list[S]] = [[] for _ in range(bucket_count)]
+    buckets[0].extend(start_list)
+    pending = len(start_list)
+    cost = 0
+    while pending:
+        bucket = buckets[cost % bucket_count]
+        while bucket:
+            current = bucket.pop()
+            pending -= 1
+            if distances[current] != cost:
+                # This node was moved to a cheaper bucket after it was added here.
+                continue
+            if is_goal(current):
+                return reconstruct_path(parents, current), float(cost)
+
+            for next_node in next_func(current, paths=paths):
+                edge_cost = cost_func(paths, next_node, current)
+                if not 0 <= edge_cost <= max_cost or edge_cost != int(edge_cost):
+                    raise _invalid_cost(edge_cost, max_cost)
+                next_cost = cost + int(edge_cost)
+                if next_cost < distances.get(next_node, next_cost + 1):
+                    distances[next_node] = next_cost
+                    parents[next_node] = current
+                    buckets[next_cost % bucket_count].append(next_node)
+                    pending += 1
+        cost += 1
+
+    msg = "No paths found"
+    raise UnsolveableError(msg)
+
+
+def dijkstra_auto[S: Hashable](  # noqa: PLR0913
+    *,
+    start: S | None = None,
+    goal: S | None = None,
+    paths: Mapping[S, set[S]],
+    cost_func: Cost[S],
+    max_cost: int | None,
+    next_func: Neighbors[S] = _default_neighbor_func,
+    starts: Iterable[S] | None = None,
+    goals: Collection[S] | GoalTest[S] | None = None,
+) -> tuple[list[S], float]:
+    """Find the cheapest path, with the fastest engine for the declared maximum edge cost.
+
+    Args:
+        start: See dijkstra.
+        goal: See dijkstra.
+        paths: See dijkstra.
+        cost_func: See dijkstra.
+        max_cost: The largest integer cost of any edge, or None if costs are not integers.
+            With 0/1 costs this uses zero_one_bfs, with small integer costs dial, and otherwise
+            dijkstra.
+        next_func: See dijkstra.
+        starts: See dijkstra.
+        goals: See dijkstra.
+
+    Returns:
+        The path from a start to the cheapest goal (inclusive), and its cost.
+    """
+    if max_cost is None or max_cost > DIAL_MAX_COST:
+        return dijkstra(
+            start=start,
+            goal=goal,
+            paths=paths,
+            cost_func=cost_func,
+            next_func=next_func,
+            starts=starts,
+            goals=goals,
+        )
+    if max_cost <= 1:
+        return zero_one_bfs(
+            start=start,
+            goal=goal,
+            paths=paths,
+            cost_func=cost_func,
+            next_func=next_func,
+            starts=starts,
+            goals=goals,
+        )
+    return dial(
+        start=start,
+        goal=goal,
+        paths=paths,
+        cost_func=cost_func,
+        max_cost=max_cost,
+        next_func=next_func,
+        starts=starts,
+        goals=goals,
+    )
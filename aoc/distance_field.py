@@ -0,0 +1,87 @@
+"""Whole-grid breadth first search, vectorized with NumPy.
+
+NumPy is an optional dependency, install it with the numpy extra.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from aoc.datatypes import Coord
+
+
+def _to_mask(coords: Iterable[Coord], shape: tuple[int, int]) -> npt.NDArray[np.bool_]:
+    mask = np.zeros(shape, dtype=np.bool_)
+    for coord in coords:
+        if not (0 <= coord.row < shape[0] and 0 <= coord.col < shape[1]):
+            msg = f"{coord} is outside of the grid."
+            raise IndexError(msg)
+        mask[coord.row, coord.col] = True
+    return mask
+
+
+def _spread(frontier: npt.NDArray[np.bool_], *, diagonal: bool) -> npt.NDArray[np.bool_]:
+    """Every cell next to a cell in the frontier."""
+    grown = np.zeros_like(frontier)
+    grown[1:, :] |= frontier[:-1, :]
+    grown[:-1, :] |= frontier[1:, :]
+    grown[:, 1:] |= frontier[:, :-1]
+    grown[:, :-1] |= frontier[:, 1:]
+    if diagonal:
+        grown[1:, 1:] |= frontier[:-1, :-1]
+        grown[1:, :-1] |= frontier[:-1, 1:]
+        grown[:-1, 1:] |= frontier[1:, :-1]
+        grown[:-1, :-1] |= frontier[1:, 1:]
+    return grown
+
+
+def grid_distance_field(
+    walls: Iterable[Coord] | npt.NDArray[np.bool_],
+    sources: Iterable[Coord],
+    corner: Coord,
+    *,
+    diagonal: bool = False,
+) -> npt.NDArray[np.int64]:
+    """Find the number of steps from the nearest source to every cell of a grid.
+
+    The whole frontier is expanded at once, so every step costs a few array operations over the
+    grid. This is fastest on open grids, where the number of steps is small compared to the
+    number of cells.
+
+    Args:
+        walls: The cells that can not be entered, as Coords or a boolean array of the grid's shape.
+        sources: The cells to measure the distance from.
+        corner: The corner of the grid, which represents the largest possible row and column.
+        diagonal: Whether diagonal steps are allowed.
+
+    Returns:
+        An array indexed by [row, col] with the distance to every cell, and -1 for unreachable
+        cells and walls.
+    """
+    shape = (corner.row + 1, corner.col + 1)
+    if isinstance(walls, np.ndarray):
+        if walls.shape != shape:
+            msg = f"The walls have shape {walls.shape}, but the grid has shape {shape}."
+            raise ValueError(msg)
+        open_cells = ~walls.astype(np.bool_)
+    else:
+        open_cells = ~_to_mask(walls, shape)
+
+    frontier = _to_mask(sources, shape)
+    distances = np.full(shape, -1, dtype=np.int64)
+    distances[frontier] = 0
+    seen = frontier.copy()
+    step = 0
+    while True:
+        step += 1
+        frontier = _spread(frontier, diagonal=diagonal) & open_cells & ~seen
+        if not frontier.any():
+            return distances
+        distances[frontier] = step
+        seen |= frontier
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aoc import a_star, bfs, dijkstra
+from aoc.datatypes import Coord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from aoc.puzzle import PuzzleInput
+
+
+class Grid:
+    """A rectangular character grid, stored as a flat bytearray.
+
+    Cells are addressed by their index in the bytearray (row * width + col), so the search
+    engines can work on plain ints. Coords are only used at the edges of the API.
+    """
+
+    def __init__(self, cells: bytearray, width: int, *, walls: str = "#") -> None:
+        if width <= 0 or len(cells) % width != 0:
+            msg = "The cells do not make up a rectangle."
+            raise ValueError(msg)
+        self.cells = cells
+        self.width = width
+        self.height = len(cells) // width
+        self.walls = walls
+        self._open = bytes(0 if chr(byte) in walls else 1 for byte in range(256))
+        self._neighbor_tables: dict[bool, list[tuple[int, ...]]] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], *, walls: str = "#") -> Grid:
+        rows = [line.encode() for line in lines]
+        while rows and not rows[-1]:
+            rows.pop()
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            msg = "All lines of a grid need to have the same length."
+            raise ValueError(msg)
+        return cls(bytearray().join(rows), len(rows[0]), walls=walls)
+
+    @classmethod
+    def from_puzzle_input(cls, puzzle_input: PuzzleInput, *, walls: str = "#") -> Grid:
+        return cls.from_lines(puzzle_input.lines, walls=walls)
+
+    @property
+    def corner(self) -> Coord:
+        """The largest row and column in the grid."""
+        return Coord(self.height - 1, self.width - 1)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, coord: object) -> bool:
+        return (
+            isinstance(coord, Coord)
+            and 0 <= coord.row < self.height
+            and 0 <= coord.col < self.width
+        )
+
+    def __getitem__(self, coord: Coord) -> str:
+        return chr(self.cells[self.index(coord)])
+
+    def __setitem__(self, coord: Coord, value: str) -> None:
+        self.cells[self.index(coord)] = ord(value)
+        self._neighbor_tables.clear()
+
+    def index(self, coord: Coord) -> int:
+        if coord not in self:
+            msg = f"{coord} is outside of the grid."
+            raise IndexError(msg)
+        return coord.row * self.width + coord.col
+
+    def coord(self, index: int) -> Coord:
+        row, col = divmod(index, self.width)
+        return Coord(row, col)
+
+    def to_coords(self, indices: Iterable[int]) -> list[Coord]:
+        width = self.width
+        return [Coord(*divmod(index, width)) for index in indices]
+
+    def find(self, char: str) -> Coord:
+        index = self.cells.find(ord(char))
+        if index == -1:
+            msg = f"{char!r} is not in the grid."
+            raise ValueError(msg)
+        return self.coord(index)
+
+    def find_all(self, char: str) -> list[Coord]:
+        value = ord(char)
+        return [self.coord(index) for index, cell in enumerate(self.cells) if cell == value]
+
+    def is_open(self, index: int) -> bool:
+        return bool(self._open[self.cells[index]])
+
+    def is_open_at(self, row: int, col: int) -> bool:
+        """Whether the cell exists and is not a wall."""
+        return (
+            0 <= row < self.height
+            and 0 <= col < self.width
+            and bool(self._open[self.cells[row * self.width + col]])
+        )
+
+    def offsets(self, *, diagonal: bool = False) -> tuple[tuple[int, int, int], ...]:
+        """The (index delta, row delta, col delta) of every neighbor of a cell."""
+        width = self.width
+        steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if diagonal:
+            steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        return tuple((row * width + col, row, col) for row, col in steps)
+
+    def neighbor_table(self, *, diagonal: bool = False) -> list[tuple[int, ...]]:
+        """The open neighbors of every cell, indexed by cell.
+
+        The table is built once per connectivity, and rebuilt after the grid is modified.
+        """
+        if diagonal in self._neighbor_tables:
+            return self._neighbor_tables[diagonal]
+
+        offsets = self.offsets(diagonal=diagonal)
+        width, height, cells, is_open = self.width, self.height, self.cells, self._open
+        table: list[tuple[int, ...]] = []
+        for index in range(len(cells)):
+            if not is_open[cells[index]]:
+                table.append(())
+                continue
+            row, col = divmod(index, width)
+            table.append(
+                tuple(
+                    index + delta
+                    for delta, row_delta, col_delta in offsets
+                    if 0 <= row + row_delta < height
+                    and 0 <= col + col_delta < width
+                    and is_open[cells[index + delta]]
+                ),
+            )
+        self._neighbor_tables[diagonal] = table
+        return table
+
+    def bfs_path(
+        self,
+        start: Coord,
+        goal: Coord,
+        *,
+        diagonal: bool = False,
+    ) -> tuple[list[Coord], int]:
+        path, cost = bfs.breadth_first_search(
+            start=self.index(start),
+            goal=self.index(goal),
+            paths={},
+            next_func=GridNeighbors(self, diagonal=diagonal),
+        )
+        return self.to_coords(path), cost
+
+    def dijkstra_path(
+        self,
+        start: Coord,
+        goal: Coord,
+        cost_func: dijkstra.Cost[int],
+        *,
+        diagonal: bool = False,
+    ) -> tuple[list[Coord], float]:
+        path, cost = dijkstra.dijkstra(
+            start=self.index(start),
+            goal=self.index(goal),
+            paths={},
+            cost_func=cost_func,
+            next_func=GridNeighbors(self, diagonal=diagonal),
+        )
+        return self.to_coords(path), cost
+
+    def a_star_path(
+        self,
+        start: Coord,
+        goal: Coord,
+        cost_func: a_star.Cost[int] | None = None,
+        *,
+        diagonal: bool = False,
+    ) -> tuple[list[Coord], float]:
+        """Find the cheapest path with A*, by default with a cost of 1 per step."""
+        path, cost = a_star.a_star(
+            self.index(start),
+            self.index(goal),
+            GridHeuristic(self, diagonal=diagonal),
+            dijkstra.unit_cost if cost_func is None else cost_func,
+            GridNeighbors(self, diagonal=diagonal),
+            prefer_deeper=True,
+        )
+        return self.to_coords(path), cost
+
+
+class GridNeighbors:
+    """A neighbor function over cell indices, usable by bfs, dijkstra and a_star."""
+
+    def __init__(self, grid: Grid, *, diagonal: bool = False) -> None:
+        self.table = grid.neighbor_table(diagonal=diagonal)
+
+    def __call__(self, current: int, paths: Mapping[int, Any]) -> Iterator[int]:  # noqa: ARG002
+        return iter(self.table[current])
+
+
+class GridHeuristic(a_star.Heuristic[int]):
+    """The Manhattan distance between cells, or the Chebyshev distance with diagonal steps."""
+
+    def __init__(self, grid: Grid, *, diagonal: bool = False) -> None:
+        self.width = grid.width
+        self.diagonal = diagonal
+
+    def __call__(self, current: int, goal: int) -> float:
+        current_row, current_col = divmod(current, self.width)
+        goal_row, goal_col = divmod(goal, self.width)
+        row_diff = abs(current_row - goal_row)
+        col_diff = abs(current_col - goal_col)
+        return float(max(row_diff, col_diff) if self.diagonal else row_diff + col_diff)
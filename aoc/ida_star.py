@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING
+
+from aoc.exceptions import UnsolveableError
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+    from aoc.a_star import Cost, Heuristic, Neighbors
+
+
+def ida_star[T: Hashable](
+    start: T,
+    goal: T,
+    heuristic: Heuristic[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+) -> tuple[list[T], float]:
+    """Find the cheapest path from start to goal, with iterative deepening A*.
+
+    Repeats a depth first search that gives up on any path whose estimated total cost exceeds a
+    bound, raising the bound to the cheapest estimate that exceeded it each time. Only the
+    current path is stored, so memory use is proportional to the length of the solution. In
+    exchange nodes are revisited, both within an iteration and across iterations.
+
+    The paths mapping passed to cost_func and next_func holds the parents of the nodes on the
+    current path only.
+
+    Args:
+        start: The node to start searching from.
+        goal: The node to find a path to.
+        heuristic: An estimate of the remaining cost, which must never overestimate it.
+        cost_func: The cost of stepping from the last node to the current one.
+        next_func: The nodes reachable from the current node.
+
+    Returns:
+        The path from start to goal (inclusive), and its cost.
+    """
+    if start == goal:
+        return [start], 0.0
+
+    bound = heuristic(start, goal)
+    while True:
+        next_bound = _search(start, goal, bound, heuristic, cost_func, next_func)
+        if isinstance(next_bound, tuple):
+            return next_bound
+        if next_bound == float("inf"):
+            msg = "Could not find a path."
+            raise UnsolveableError(msg)
+        bound = next_bound
+
+
+def _search[T: Hashable](  # noqa: PLR0913, PLR0917
+    start: T,
+    goal: T,
+    bound: float,
+    heuristic: Heuristic[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+) -> tuple[list[T], float] | float:
+    """One depth first search of ida_star.
+
+    Returns:
+        The path and its cost if the goal was found within the bound, and otherwise the lowest
+        estimated total cost that exceeded the bound.
+    """
+    path = [start]
+    costs = [0.0]
+    parents: dict[T, T] = {}
+    on_path = {start}
+    stack: list[Iterator[T]] = [next_func(start, parents)]
+    next_bound = float("inf")
+    while stack:
+        current = path[-1]
+        neighbor = next(stack[-1], None)
+        if neighbor is None:
+            # Every neighbor of the current node was searched, so step back.
+            stack.pop()
+            path.pop()
+            costs.pop()
+            on_path.discard(current)
+            parents.pop(current, None)
+            continue
+        if neighbor in on_path:
+            continue
+
+        cost = costs[-1] + cost_func(parents, neighbor, current)
+        estimate = cost + heuristic(neighbor, goal)
+        if estimate > bound:
+            next_bound = min(next_bound, estimate)
+            continue
+        if neighbor == goal:
+            return [*path, neighbor], cost
+
+        parents[neighbor] = current
+        path.append(neighbor)
+        costs.append(cost)
+        on_path.add(neighbor)
+        stack.append(next_func(neighbor, parents))
+    return next_bound
+
+
+def beam_search[T: Hashable](  # noqa: PLR0913
+    start: T,
+    goal: T,
+    heuristic: Heuristic[T],
+    cost_func: Cost[T],
+    next_func: Neighbors[T],
+    *,
+    beam_width: int,
+) -> tuple[list[T], float]:
+    """Find a cheap path from start to goal, keeping only the most promising nodes of every step.
+
+    The search advances one step at a time from every node in the beam, and keeps the
+    beam_width new nodes with the lowest estimated total cost. Memory use is capped by the beam
+    width and the length of the path, but the path found is not guaranteed to be the cheapest,
+    and a path may not be found at all when the beam is too narrow.
+
+    Args:
+        start: The node to start searching from.
+        goal: The node to find a path to.
+        heuristic: An estimate of the remaining cost.
+        cost_func: The cost of stepping from the last node to the current one.
+        next_func: The nodes reachable from the current node.
+        beam_width: The number of nodes to keep after every step.
+
+    Returns:
+        The path from start to goal (inclusive), and its cost.
+    """
+    if beam_width < 1:
+        msg = "The beam needs to be at least one node wide."
+        raise ValueError(msg)
+
+    paths: dict[T, T] = {}
+    cheapest_path: dict[T, float] = {start: 0.0}
+    beam = [start]
+    while beam and not (goal in cheapest_path and beam[0] == goal):
+        estimates: dict[T, float] = {}
+        for current in beam:
+            if current == goal:
+                estimates[current] = cheapest_path[current]
+                continue
+            current_cost = cheapest_path[current]
+            for neighbor in next_func(current, paths):
+                new_cost = current_cost + cost_func(paths, neighbor, current)
+                if new_cost < cheapest_path.get(neighbor, float("inf")):
+                    paths[neighbor] = current
+                    cheapest_path[neighbor] = new_cost
+                    estimates[neighbor] = new_cost + heuristic(neighbor, goal)
+        # The goal stays in the beam until nothing left in it could lead to a cheaper path.
+        beam = heapq.nsmallest(beam_width, estimates, key=estimates.__getitem__)
+
+    if goal not in cheapest_path:
+        msg = "Could not find a path."
+        raise UnsolveableError(msg)
+
+    path = [goal]
+    current = goal
+    while current in paths:
+        current = paths[current]
+        path.append(current)
+    path.reverse()
+    return path, cheapest_path[goal]
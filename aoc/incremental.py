@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+from aoc.exceptions import UnsolveableError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from aoc.a_star import Heuristic
+    from aoc.datatypes import Coord
+    from aoc.stats import SearchStats
+
+_INF = float("inf")
+
+type _Key = tuple[float, float]
+
+
+class IncrementalAStar:
+    """Shortest paths on a grid whose walls change between queries, with Lifelong Planning A*.
+
+    The search keeps the cost to every cell it has looked at. After walls are added or removed,
+    only the cells whose cost changed are searched again, so a long series of small changes
+    costs a fraction of searching from scratch after every change. Every step costs 1.
+
+    Typical use is adding walls one at a time, until the goal can no longer be reached:
+
+        search = IncrementalAStar(start, goal, corner, heuristic)
+        for wall in walls:
+            search.add_wall(wall)
+            if search.distance() == float("inf"):
+                break
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        start: Coord,
+        goal: Coord,
+        corner: Coord,
+        heuristic: Heuristic[Coord],
+        *,
+        walls: Iterable[Coord] = (),
+        diagonal: bool = False,
+        stats: SearchStats | None = None,
+    ) -> None:
+        """Set up the search. Nothing is searched until the first query.
+
+        Args:
+            start: The cell to find paths from.
+            goal: The cell to find paths to.
+            corner: The largest row and column of the grid. The smallest are 0.
+            heuristic: An estimate of the remaining cost, which must be consistent: it never
+                drops by more than 1 between neighboring cells, and is 0 at the goal. Never
+                overestimating is not enough, as the search stops once the goal's cost is known.
+            walls: The cells that can not be entered.
+            diagonal: Whether diagonal steps are allowed.
+            stats: If given, filled in with statistics about all searches so far.
+        """
+        self.start = start
+        self.goal = goal
+        self.corner = corner
+        self.heuristic = heuristic
+        self.walls = set(walls)
+        self.diagonal = diagonal
+        self.stats = stats
+        # The cost of every cell as of its last expansion, and as its neighbors now suggest.
+        # Cells where the two differ are queued to be expanded again.
+        self._costs: dict[Coord, float] = {}
+        self._lookahead: dict[Coord, float] = {}
+        # The heap may contain outdated entries, _queued holds the current key of every cell.
+        self._counter = itertools.count()
+        self._frontier: list[tuple[_Key, int, Coord]] = []
+        self._queued: dict[Coord, _Key] = {}
+        self._update(start)
+
+    def _neighbors(self, cell: Coord) -> Iterator[Coord]:
+        neighbors = cell.neighbors8 if self.diagonal else cell.neighbors4
+        walls = self.walls
+        return (neighbor for neighbor in neighbors(self.corner) if neighbor not in walls)
+
+    def _key(self, cell: Coord) -> _Key:
+        cost = min(self._costs.get(cell, _INF), self._lookahead.get(cell, _INF))
+        return cost + self.heuristic(cell, self.goal), cost
+
+    def _queue(self, cell: Coord) -> None:
+        key = self._key(cell)
+        self._queued[cell] = key
+        heapq.heappush(self._frontier, (key, next(self._counter), cell))
+        if self.stats is not None:
+            self.stats.pushed += 1
+            self.stats.observe_frontier(len(self._queued))
+
+    def _top_key(self) -> _Key:
+        frontier = self._frontier
+        while frontier:
+            key, _, cell = frontier[0]
+            if self._queued.get(cell) == key:
+                return key
+            heapq.heappop(frontier)
+            if self.stats is not None:
+                self.stats.stale_skipped += 1
+        return _INF, _INF
+
+    def _update(self, cell: Coord) -> None:
+        """Recalculate the lookahead cost of a cell, and queue it if it became inconsistent."""
+        if cell in self.walls:
+            self._lookahead[cell] = _INF
+        elif cell == self.start:
+            self._lookahead[cell] = 0.0
+        else:
+            costs = self._costs
+            self._lookahead[cell] = min(
+                (costs.get(neighbor, _INF) + 1 for neighbor in self._neighbors(cell)),
+                default=_INF,
+            )
+        self._queued.pop(cell, None)
+        if self._costs.get(cell, _INF) != self._lookahead.get(cell, _INF):
+            self._queue(cell)
+
+    def _search(self) -> None:
+        goal = self.goal
+        costs, lookahead = self._costs, self._lookahead
+        while self._top_key() < self._key(goal) or costs.get(goal, _INF) != lookahead.get(
+            goal,
+            _INF,
+        ):
+            _, _, cell = heapq.heappop(self._frontier)
+            del self._queued[cell]
+            if self.stats is not None:
+                self.stats.expanded += 1
+            if costs.get(cell, _INF) > lookahead.get(cell, _INF):
+                # The cell got cheaper, which can only make its neighbors cheaper.
+                costs[cell] = lookahead[cell]
+                for neighbor in self._neighbors(cell):
+                    self._update(neighbor)
+            else:
+                # The cell got more expensive, so everything that relied on it needs checking.
+                costs[cell] = _INF
+                self._update(cell)
+                for neighbor in self._neighbors(cell):
+                    self._update(neighbor)
+
+    def _changed(self, cell: Coord) -> None:
+        self._update(cell)
+        neighbors = cell.neighbors8 if self.diagonal else cell.neighbors4
+        for neighbor in neighbors(self.corner):
+            self._update(neighbor)
+
+    def add_wall(self, cell: Coord) -> None:
+        """Block a cell. The affected costs are repaired by the next query."""
+        if cell not in self.walls:
+            self.walls.add(cell)
+            self._changed(cell)
+
+    def remove_wall(self, cell: Coord) -> None:
+        """Unblock a cell. The affected costs are repaired by the next query."""
+        if cell in self.walls:
+            self.walls.remove(cell)
+            self._changed(cell)
+
+    def distance(self) -> float:
+        """The cost of the cheapest path from start to goal, or infinity if there is none."""
+        self._search()
+        return self._costs.get(self.goal, _INF)
+
+    def path(self) -> list[Coord]:
+        """The cheapest path from start to goal (inclusive).
+
+        Raises:
+            UnsolveableError: If the goal can not be reached.
+        """
+        cost = self.distance()
+        if cost == _INF:
+            msg = "Could not find a path."
+            raise UnsolveableError(msg)
+
+        costs = self._costs
+        path = [self.goal]
+        current = self.goal
+        while current != self.start:
+            current = min(self._neighbors(current), key=lambda cell: costs.get(cell, _INF))
+            path.append(current)
+        path.reverse()
+        return path
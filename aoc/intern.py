@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from array import array
+
+
+class StateTable[S: Hashable]:
+    """Numbers states densely from 0, in the order they are first seen.
+
+    Large composite states, like tuples holding a position, a direction and a frozenset of keys,
+    are slow to hash and compare. Once a state is interned, a search can keep its distances and
+    parents in arrays indexed by its number, and only hash the state once per time it is
+    generated.
+    """
+
+    def __init__(self, states: Iterable[S] = ()) -> None:
+        # The search engines use these directly in their inner loops, to save method calls.
+        self.numbers: dict[S, int] = {}
+        self.states: list[S] = []
+        for state in states:
+            self.intern(state)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, state: object) -> bool:
+        return state in self.numbers
+
+    def __iter__(self) -> Iterator[S]:
+        return iter(self.states)
+
+    def __getitem__(self, number: int) -> S:
+        """The state with the given number."""
+        return self.states[number]
+
+    def intern(self, state: S) -> int:
+        """The number of the state, numbering it first if it is new."""
+        number = self.numbers.setdefault(state, len(self.states))
+        if number == len(self.states):
+            self.states.append(state)
+        return number
+
+    def find(self, state: S) -> int | None:
+        """The number of the state, or None if it was never interned."""
+        return self.numbers.get(state)
+
+    def path(self, parents: array[int], number: int) -> list[S]:
+        """Walk the parent numbers back from a state to the start, which is its own parent.
+
+        Returns:
+            The states from the start to the given one (inclusive).
+        """
+        path = [self.states[number]]
+        while (parent := parents[number]) != number:
+            path.append(self.states[parent])
+            number = parent
+        path.reverse()
+        return path
+
+
+class ParentView[S: Hashable](Mapping[S, S]):
+    """A read only mapping from states to their parents, backed by an array of parent numbers.
+
+    Starts, which are their own parent, and states without a parent are left out, so this
+    behaves like the paths dict that a_star passes to its cost and neighbor functions.
+    """
+
+    def __init__(self, table: StateTable[S], parents: array[int]) -> None:
+        self.table = table
+        self.parents = parents
+
+    def _parent(self, state: object) -> int | None:
+        number = self.table.find(state)  # type: ignore[arg-type]
+        if number is None or number >= len(self.parents):
+            return None
+        parent = self.parents[number]
+        if parent in {-1, number}:
+            return None
+        return parent
+
+    def __getitem__(self, state: S) -> S:
+        parent = self._parent(state)
+        if parent is None:
+            raise KeyError(state)
+        return self.table[parent]
+
+    def __contains__(self, state: object) -> bool:
+        return self._parent(state) is not None
+
+    def __iter__(self) -> Iterator[S]:
+        return (
+            self.table[number]
+            for number, parent in enumerate(self.parents)
+            if parent not in {-1, number}
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import itertools
+import math
+from typing import TYPE_CHECKING
+
+from aoc import a_star
+from aoc.datatypes import Coord
+from aoc.grid import Grid
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Container, Iterator, Mapping
+
+    from aoc.stats import SearchStats
+
+type IsOpen = Callable[[int, int], bool]
+
+_SQRT_2 = math.sqrt(2)
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _open_check(walkable: Grid | Container[Coord]) -> IsOpen:
+    if isinstance(walkable, Grid):
+        return walkable.is_open_at
+
+    def is_open(row: int, col: int) -> bool:
+        # Plain tuples compare equal to, and hash the same as, Coords.
+        return (row, col) in walkable
+
+    return is_open
+
+
+class JumpPointNeighbors(a_star.Neighbors[Coord]):
+    """Yields the jump points reachable from a node, given the direction it was entered from.
+
+    Straight runs of cells that have no reason to turn are skipped, so only the cells where an
+    optimal path might change direction end up in the frontier.
+    """
+
+    def __init__(self, is_open: IsOpen, goal: Coord, *, diagonal: bool) -> None:
+        self.is_open = is_open
+        self.goal = goal
+        self.diagonal = diagonal
+
+    def __call__(self, current: Coord, paths: Mapping[Coord, Coord]) -> Iterator[Coord]:
+        row, col = current
+        for d_row, d_col in self._directions(current, paths.get(current)):
+            jump_point = self._jump(row + d_row, col + d_col, d_row, d_col)
+            if jump_point is not None:
+                yield Coord(*jump_point)
+
+    def _directions(self, current: Coord, parent: Coord | None) -> list[tuple[int, int]]:
+        """The directions worth searching in, pruning those a path through the parent covers."""
+        is_open = self.is_open
+        row, col = current
+        if parent is None:
+            offsets = _OFFSETS_8 if self.diagonal else _OFFSETS_4
+            return [(d_row, d_col) for d_row, d_col in offsets if is_open(row + d_row, col + d_col)]
+
+        d_row, d_col = _sign(row - parent.row), _sign(col - parent.col)
+        if not self.diagonal:
+            if d_col:
+                return [(-1, 0), (1, 0), (0, d_col)]
+            return [(0, -1), (0, 1), (d_row, 0)]
+        if d_row and d_col:
+            directions = [(d_row, 0), (0, d_col), (d_row, d_col)]
+            if not is_open(row, col - d_col):
+                directions.append((d_row, -d_col))
+            if not is_open(row - d_row, col):
+                directions.append((-d_row, d_col))
+            return directions
+        # Moving straight, diagonal turns are only needed around walls next to the current cell.
+        directions = [(d_row, d_col)]
+        for side_row, side_col in ((d_col, d_row), (-d_col, -d_row)):
+            if not is_open(row + side_row, col + side_col):
+                directions.append((d_row + side_row, d_col + side_col))
+        return directions
+
+    def _jump(self, row: int, col: int, d_row: int, d_col: int) -> tuple[int, int] | None:
+        """Walk from the cell in the direction, until a jump point or a wall is found."""
+        is_open = self.is_open
+        is_jump_point = self._is_jump_point_8 if self.diagonal else self._is_jump_point_4
+        goal_row, goal_col = self.goal
+        while is_open(row, col):
+            if (row == goal_row and col == goal_col) or is_jump_point(row, col, d_row, d_col):
+                return row, col
+            row += d_row
+            col += d_col
+        return None
+
+    def _has_forced_neighbor(self, row: int, col: int, d_row: int, d_col: int) -> bool:
+        """Whether a cell beside a straight run can only be reached optimally by turning here."""
+        is_open = self.is_open
+        for side_row, side_col in ((d_col, d_row), (-d_col, -d_row)):
+            if self.diagonal:
+                # The cell diagonally ahead is open, but the one beside the run is a wall.
+                forced = is_open(row + d_row + side_row, col + d_col + side_col) and not is_open(
+                    row + side_row,
+                    col + side_col,
+                )
+            else:
+                # The cell beside the run is open, but the one beside the previous cell was a wall.
+                forced = is_open(row + side_row, col + side_col) and not is_open(
+                    row - d_row + side_row,
+                    col - d_col + side_col,
+                )
+            if forced:
+                return True
+        return False
+
+    def _is_jump_point_4(self, row: int, col: int, d_row: int, d_col: int) -> bool:
+        if self._has_forced_neighbor(row, col, d_row, d_col):
+            return True
+        # Vertical runs stop wherever a horizontal run would find a jump point.
+        return bool(d_row) and (
+            self._jump(row, col + 1, 0, 1) is not None
+            or self._jump(row, col - 1, 0, -1) is not None
+        )
+
+    def _is_jump_point_8(self, row: int, col: int, d_row: int, d_col: int) -> bool:
+        if not (d_row and d_col):
+            return self._has_forced_neighbor(row, col, d_row, d_col)
+
+        is_open = self.is_open
+        if (is_open(row + d_row, col - d_col) and not is_open(row, col - d_col)) or (
+            is_open(row - d_row, col + d_col) and not is_open(row - d_row, col)
+        ):
+            return True
+        # Diagonal runs stop wherever a straight run would find a jump point.
+        return (
+            self._jump(row, col + d_col, 0, d_col) is not None
+            or self._jump(row + d_row, col, d_row, 0) is not None
+        )
+
+
+class JumpCost(a_star.Cost[Coord]):
+    """The cost of a straight or diagonal run between two jump points."""
+
+    def __init__(self, *, diagonal: bool) -> None:
+        self.diagonal_cost = _SQRT_2 if diagonal else 2.0
+
+    def __call__(self, paths: Mapping[Coord, Coord], current: Coord, last: Coord) -> float:  # noqa: ARG002
+        rows = abs(current.row - last.row)
+        cols = abs(current.col - last.col)
+        if rows and cols:
+            return rows * self.diagonal_cost
+        return float(rows + cols)
+
+
+class OctileHeuristic(a_star.Heuristic[Coord]):
+    """The Manhattan distance, or the octile distance when diagonal steps are allowed."""
+
+    def __init__(self, *, diagonal: bool) -> None:
+        self.diagonal = diagonal
+
+    def __call__(self, current: Coord, goal: Coord) -> float:
+        rows = abs(current.row - goal.row)
+        cols = abs(current.col - goal.col)
+        if self.diagonal:
+            return max(rows, cols) + (_SQRT_2 - 1) * min(rows, cols)
+        return float(rows + cols)
+
+
+def _expand_path(jump_points: list[Coord]) -> list[Coord]:
+    path = jump_points[:1]
+    for last, current in itertools.pairwise(jump_points):
+        d_row, d_col = _sign(current.row - last.row), _sign(current.col - last.col)
+        steps = max(abs(current.row - last.row), abs(current.col - last.col))
+        path.extend(
+            Coord(last.row + d_row * step, last.col + d_col * step) for step in range(1, steps + 1)
+        )
+    return path
+
+
+def jump_point_search(
+    start: Coord,
+    goal: Coord,
+    walkable: Grid | Container[Coord],
+    *,
+    diagonal: bool = False,
+    stats: SearchStats | None = None,
+) -> tuple[list[Coord], float]:
+    """Find the cheapest path on a uniform cost grid, with Jump Point Search.
+
+    This finds the same cost as a_star, but skips over the many equally good paths on open grids
+    and only puts the cells where paths turn into the frontier.
+
+    Args:
+        start: The cell to start from.
+        goal: The cell to find a path to.
+        walkable: A Grid, or the collection of all cells that can be entered.
+        diagonal: Whether diagonal steps are allowed. Diagonal steps cost sqrt(2), which the
+            pruning rules of JPS rely on, and may pass between two walls.
+        stats: If given, filled in with statistics about the search.
+
+    Returns:
+        The path from start to goal (inclusive) in single steps, and its cost.
+    """
+    is_open = _open_check(walkable)
+    if not is_open(*start) or not is_open(*goal):
+        msg = "The start and goal need to be walkable."
+        raise ValueError(msg)
+
+    jump_points, cost = a_star.a_star(
+        start,
+        goal,
+        OctileHeuristic(diagonal=diagonal),
+        JumpCost(diagonal=diagonal),
+        JumpPointNeighbors(is_open, goal, diagonal=diagonal),
+        prefer_deeper=True,
+        stats=stats,
+    )
+    return _expand_path(jump_points), cost
+
+
+_OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_OFFSETS_8 = (*_OFFSETS_4, (-1, -1), (-1, 1), (1, -1), (1, 1))
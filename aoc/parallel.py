@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from aoc.exceptions import UnsolveableError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+# Set in every worker process once, so the graph is not sent along with every query.
+_engine: Callable[[Any, Any], Any] | None = None
+_graph: Any = None
+
+
+def _init_worker[G, Q, R](engine: Callable[[G, Q], R], graph: G) -> None:
+    global _engine, _graph
+    _engine, _graph = engine, graph
+
+
+def _search[G, Q, R](engine: Callable[[G, Q], R], graph: G, query: Q) -> R | UnsolveableError:
+    try:
+        return engine(graph, query)
+    except UnsolveableError as error:
+        return error
+
+
+def _run(query: object) -> object:
+    if _engine is None:
+        msg = "The worker was not initialized."
+        raise RuntimeError(msg)
+    return _search(_engine, _graph, query)
+
+
+def batch_search[G, Q, R](
+    engine: Callable[[G, Q], R],
+    graph: G,
+    queries: Iterable[Q],
+    *,
+    workers: int | None = None,
+) -> Iterator[R | UnsolveableError]:
+    """Run many independent searches on the same graph, spread over a pool of processes.
+
+    Every worker gets the graph once when it starts. On Linux the workers are forked, so they
+    share the parent's memory, and even large graphs are not copied. Elsewhere the graph and
+    engine are pickled once per worker, so they need to be defined at module level.
+
+    Args:
+        engine: Runs a single query on the graph, for example a function that calls dijkstra
+            with a start and goal taken from the query.
+        graph: Passed to every call of the engine.
+        queries: The queries to run.
+        workers: The number of processes to use, by default one per CPU. With a single worker,
+            the queries are run in this process.
+
+    Returns:
+        The result of every query, in the order of the queries. Queries that raised an
+        UnsolveableError have the error in place of their result. Any other error is raised.
+    """
+    query_list = list(queries)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(query_list) <= 1:
+        for query in query_list:
+            yield _search(engine, graph, query)
+        return
+
+    # Forking is only safe on Linux. macOS defaults to spawning, as forking can crash there.
+    context = multiprocessing.get_context("fork") if sys.platform == "linux" else None
+    # A few chunks per worker keeps the workers busy when some queries take longer than others.
+    chunksize = max(1, len(query_list) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(query_list)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(engine, graph),
+    ) as pool:
+        yield from pool.map(_run, query_list, chunksize=chunksize)  # type: ignore[misc]
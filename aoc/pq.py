@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class PriorityQueue[S](Protocol):
+    """The frontier of a search: items ordered by a priority, smallest first."""
+
+    def __len__(self) -> int: ...
+
+    def push(self, item: S, priority: float) -> None:
+        """Add an item, or lower its priority if it is queued already."""
+        ...
+
+    def pop(self) -> tuple[float, S]:
+        """Remove and return the item with the smallest priority, with its priority."""
+        ...
+
+
+type QueueFactory[S] = Callable[[], PriorityQueue[S]]
+
+
+class LazyHeap[S]:
+    """A plain heapq binary heap.
+
+    Pushing an item that is queued already adds a second entry instead of updating the first,
+    so the search has to skip outdated entries when they are popped.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, S]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: S, priority: float) -> None:
+        heapq.heappush(self._heap, (priority, next(self._counter), item))
+
+    def pop(self) -> tuple[float, S]:
+        priority, _, item = heapq.heappop(self._heap)
+        return priority, item
+
+
+class IndexedHeap[S]:
+    """A d-ary heap that tracks the position of every item, so it supports decrease-key.
+
+    Every item is in the heap at most once, so there are no outdated entries to skip, and the
+    heap never grows larger than the number of open nodes. A higher arity makes the heap
+    shallower, which makes decrease-key cheaper and pop more expensive.
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        if arity < 2:  # noqa: PLR2004
+            msg = "A heap needs an arity of at least 2."
+            raise ValueError(msg)
+        self.arity = arity
+        self._priorities: list[float] = []
+        self._items: list[S] = []
+        self._positions: dict[S, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._positions
+
+    def priority(self, item: S) -> float:
+        return self._priorities[self._positions[item]]
+
+    def push(self, item: S, priority: float) -> None:
+        position = self._positions.get(item)
+        if position is None:
+            self._priorities.append(priority)
+            self._items.append(item)
+            position = len(self._items) - 1
+        elif priority < self._priorities[position]:
+            self._priorities[position] = priority
+        else:
+            return
+        self._sift_up(position, item, priority)
+
+    def pop(self) -> tuple[float, S]:
+        if not self._items:
+            msg = "pop from an empty heap"
+            raise IndexError(msg)
+        priority, item = self._priorities[0], self._items[0]
+        del self._positions[item]
+        last_priority, last_item = self._priorities.pop(), self._items.pop()
+        if self._items:
+            self._sift_down(last_item, last_priority)
+        return priority, item
+
+    def _sift_up(self, position: int, item: S, priority: float) -> None:
+        priorities, items, positions, arity = (
+            self._priorities,
+            self._items,
+            self._positions,
+            self.arity,
+        )
+        while position > 0:
+            parent = (position - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            priorities[position] = priorities[parent]
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    def _sift_down(self, item: S, priority: float) -> None:
+        """Place the item at the root, and move it down to where it belongs."""
+        priorities, items, positions, arity = (
+            self._priorities,
+            self._items,
+            self._positions,
+            self.arity,
+        )
+        size = len(items)
+        position = 0
+        while True:
+            first_child = position * arity + 1
+            if first_child >= size:
+                break
+            last_child = min(first_child + arity, size)
+            child = min(range(first_child, last_child), key=priorities.__getitem__)
+            if priorities[child] >= priority:
+                break
+            priorities[position] = priorities[child]
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+
+class RadixHeap[S]:
+    """A monotone priority queue for integer priorities.
+
+    Entries are kept in buckets by the highest bit in which their priority differs from the
+    last popped priority. Only the lowest non-empty bucket is ever sorted through, which makes
+    pushes O(1) and pops amortized O(log C), for a largest priority difference C.
+
+    Priorities must be whole numbers and may never be lower than the last popped priority,
+    which holds for dijkstra and for a_star with a consistent heuristic. Like LazyHeap,
+    pushing a queued item again adds a second entry.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[list[tuple[int, S]]] = [[]]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: S, priority: float) -> None:
+        key = int(priority)
+        if key != priority or key < self._last:
+            msg = f"Priorities need to be integers of at least {self._last}, but got {priority}."
+            raise ValueError(msg)
+        index = (key ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((key, item))
+        self._size += 1
+
+    def pop(self) -> tuple[float, S]:
+        buckets = self._buckets
+        if not buckets[0]:
+            index = next((index for index, bucket in enumerate(buckets) if bucket), None)
+            if index is None:
+                msg = "pop from an empty heap"
+                raise IndexError(msg)
+            # Everything in the lowest non-empty bucket moves to a lower bucket, relative to
+            # its smallest priority.
+            entries = buckets[index]
+            buckets[index] = []
+            last = self._last = min(key for key, _ in entries)
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        key, item = buckets[0].pop()
+        self._size -= 1
+        return float(key), item
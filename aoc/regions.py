@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import importlib.util
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from aoc.datatypes import Coord
+from aoc.intern import StateTable
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    import numpy as np
+    import numpy.typing as npt
+
+# NumPy is an optional dependency, install it with the numpy extra.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# The (row, col) of the two cells next to a cell that meet at one of its corners.
+_CORNERS = (((-1, 0), (0, -1)), ((-1, 0), (0, 1)), ((1, 0), (0, -1)), ((1, 0), (0, 1)))
+
+
+def _find(parents: array[int], number: int) -> int:
+    root = number
+    while (parent := parents[root]) != root:
+        root = parent
+    # Point everything on the way straight at the root, so the next find is a single step.
+    while (parent := parents[number]) != root:
+        parents[number] = root
+        number = parent
+    return root
+
+
+def _union(parents: array[int], ranks: bytearray, first: int, second: int) -> int | None:
+    """Merge the sets of two numbers, and return the new root, or None if they were merged."""
+    first, second = _find(parents, first), _find(parents, second)
+    if first == second:
+        return None
+    if ranks[first] < ranks[second]:
+        first, second = second, first
+    parents[second] = first
+    if ranks[first] == ranks[second]:
+        ranks[first] += 1
+    return first
+
+
+class UnionFind[S: Hashable]:
+    """Disjoint sets of nodes, which can be merged and queried in nearly constant time.
+
+    Nodes are numbered with a StateTable, and the sets are kept as a forest in an array of
+    parent numbers, with union by rank and path compression. Nodes are added on first use.
+    """
+
+    def __init__(self, nodes: Iterable[S] = ()) -> None:
+        self.table: StateTable[S] = StateTable()
+        self._parents = array("q")
+        self._ranks = bytearray()
+        self.sets = 0
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.table
+
+    def add(self, node: S) -> int:
+        """Add the node in a set of its own, if it is new, and return its number."""
+        number = self.table.intern(node)
+        if number == len(self._parents):
+            self._parents.append(number)
+            self._ranks.append(0)
+            self.sets += 1
+        return number
+
+    def find(self, node: S) -> S:
+        """The node that represents the set the node is in."""
+        return self.table[_find(self._parents, self.add(node))]
+
+    def union(self, first: S, second: S) -> bool:
+        """Merge the sets of two nodes, and return whether they were in different sets."""
+        merged = _union(self._parents, self._ranks, self.add(first), self.add(second))
+        if merged is None:
+            return False
+        self.sets -= 1
+        return True
+
+    def connected(self, first: S, second: S) -> bool:
+        """Whether two nodes are in the same set."""
+        return self.find(first) == self.find(second)
+
+    def groups(self) -> list[list[S]]:
+        """The nodes of every set, in the order the sets' first nodes were added."""
+        parents = self._parents
+        groups: dict[int, list[S]] = {}
+        for number, node in enumerate(self.table):
+            groups.setdefault(_find(parents, number), []).append(node)
+        return list(groups.values())
+
+
+@dataclass(frozen=True)
+class Regions:
+    """The regions of a grid: the groups of equal cells that touch up, down, left or right.
+
+    Regions are numbered in the order of their first cell, row by row. Every list but labels
+    has an entry per region.
+    """
+
+    labels: list[list[int]]
+    kinds: list[str]
+    areas: list[int]
+    perimeters: list[int]
+    sides: list[int]
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def cells(self, label: int) -> list[Coord]:
+        """The cells of a region."""
+        return [
+            Coord(row, col)
+            for row, line in enumerate(self.labels)
+            for col, cell_label in enumerate(line)
+            if cell_label == label
+        ]
+
+
+def _label_python(rows: list[str], width: int) -> Regions:
+    height = len(rows)
+    cells = "".join(rows)
+    parents = array("q", range(len(cells)))
+    ranks = bytearray(len(cells))
+    for index, cell in enumerate(cells):
+        if index % width and cells[index - 1] == cell:
+            _union(parents, ranks, index - 1, index)
+        if index >= width and cells[index - width] == cell:
+            _union(parents, ranks, index - width, index)
+
+    numbers: dict[int, int] = {}
+    kinds: list[str] = []
+    flat: list[int] = []
+    for index, cell in enumerate(cells):
+        label = numbers.setdefault(_find(parents, index), len(numbers))
+        if label == len(kinds):
+            kinds.append(cell)
+        flat.append(label)
+    labels = [flat[row * width : (row + 1) * width] for row in range(height)]
+    return Regions(labels, kinds, *_measure_python(labels, len(kinds)))
+
+
+def _measure_python(labels: list[list[int]], count: int) -> tuple[list[int], list[int], list[int]]:
+    """The area, perimeter and number of sides of every region."""
+    height, width = len(labels), len(labels[0])
+
+    def same(row: int, col: int, label: int) -> bool:
+        return 0 <= row < height and 0 <= col < width and labels[row][col] == label
+
+    areas, perimeters, sides = [0] * count, [0] * count, [0] * count
+    for row, line in enumerate(labels):
+        for col, label in enumerate(line):
+            areas[label] += 1
+            perimeters[label] += sum(
+                not same(row + d_row, col + d_col, label)
+                for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            )
+            # A region has as many sides as corners. A corner is convex where both cells next
+            # to it are outside the region, and concave where both are inside but the cell
+            # diagonally across is not.
+            for (row_delta, _), (_, col_delta) in _CORNERS:
+                vertical = same(row + row_delta, col, label)
+                horizontal = same(row, col + col_delta, label)
+                if (not vertical and not horizontal) or (
+                    vertical and horizontal and not same(row + row_delta, col + col_delta, label)
+                ):
+                    sides[label] += 1
+    return areas, perimeters, sides
+
+
+def _label_numpy(rows: list[str], width: int) -> Regions:
+    import numpy as np  # noqa: PLC0415
+
+    height = len(rows)
+    codes = np.frombuffer("".join(rows).encode("utf-32-le"), dtype=np.uint32).reshape(
+        height,
+        width,
+    )
+    # Every pair of equal neighbors is an edge, and every cell starts as its own root.
+    indices = np.arange(height * width).reshape(height, width)
+    across = codes[:, :-1] == codes[:, 1:]
+    down = codes[:-1, :] == codes[1:, :]
+    firsts = np.concatenate([indices[:, :-1][across], indices[:-1, :][down]])
+    seconds = np.concatenate([indices[:, 1:][across], indices[1:, :][down]])
+    parents = np.arange(height * width)
+    while True:
+        first_roots, second_roots = parents[firsts], parents[seconds]
+        split = first_roots != second_roots
+        if not split.any():
+            break
+        firsts, seconds = firsts[split], seconds[split]
+        # Hang the larger root of every edge under the smaller one, then jump every cell
+        # straight to its root, until all edges are within a tree.
+        np.minimum.at(
+            parents,
+            np.maximum(first_roots[split], second_roots[split]),
+            np.minimum(first_roots[split], second_roots[split]),
+        )
+        while not np.array_equal(grandparents := parents[parents], parents):
+            parents = grandparents
+
+    # Every root is the first cell of its region, so sorting roots numbers regions in order.
+    roots, flat_labels = np.unique(parents, return_inverse=True)
+    labels = flat_labels.reshape(height, width)
+    count = len(roots)
+
+    padded = np.full((height + 2, width + 2), -1)
+    padded[1:-1, 1:-1] = labels
+
+    def same(d_row: int, d_col: int) -> npt.NDArray[np.bool_]:
+        neighbors = padded[1 + d_row : height + 1 + d_row, 1 + d_col : width + 1 + d_col]
+        equal: npt.NDArray[np.bool_] = neighbors == labels
+        return equal
+
+    perimeter = np.zeros((height, width), dtype=np.int64)
+    for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        perimeter += ~same(d_row, d_col)
+    corners = np.zeros((height, width), dtype=np.int64)
+    for (row_delta, _), (_, col_delta) in _CORNERS:
+        vertical, horizontal = same(row_delta, 0), same(0, col_delta)
+        corners += (~vertical & ~horizontal) | (vertical & horizontal & ~same(row_delta, col_delta))
+
+    def per_region(values: npt.NDArray[np.int64] | None = None) -> list[int]:
+        totals = np.bincount(flat_labels, weights=None if values is None else values.ravel())
+        return [int(total) for total in totals[:count]]
+
+    flat_codes = codes.ravel()[roots]
+    return Regions(
+        labels.tolist(),
+        [chr(code) for code in flat_codes.tolist()],
+        per_region(),
+        per_region(perimeter),
+        per_region(corners),
+    )
+
+
+def label_regions(lines: Iterable[str], *, vectorized: bool | None = None) -> Regions:
+    """Split a grid into regions of equal cells in a single pass, and measure every region.
+
+    Args:
+        lines: The rows of the grid, for example the lines of a PuzzleInput.
+        vectorized: Whether to label the grid with NumPy. By default NumPy is used when it is
+            installed.
+
+    Returns:
+        The region of every cell, with the area, perimeter and number of sides of every region.
+    """
+    rows = list(lines)
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        msg = "All lines of a grid need to have the same length."
+        raise ValueError(msg)
+    if vectorized is None:
+        vectorized = HAS_NUMPY
+    return (_label_numpy if vectorized else _label_python)(rows, len(rows[0]))
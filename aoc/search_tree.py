@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from aoc.exceptions import UnsolveableError
+
+type GoalTest[S] = Callable[[S], bool]
+
+
+def start_nodes[S: Hashable](start: S | None, starts: Iterable[S] | None) -> list[S]:
+    """Combine the single and multiple start arguments of the search engines.
+
+    Raises:
+        ValueError: If not exactly one of the arguments was given, or there are no starts.
+    """
+    if start is not None and starts is None:
+        return [start]
+    if start is None and starts is not None:
+        nodes = list(dict.fromkeys(starts))
+        if not nodes:
+            msg = "At least one start is needed."
+            raise ValueError(msg)
+        return nodes
+    msg = "Exactly one of start and starts must be given."
+    raise ValueError(msg)
+
+
+def goal_test[S: Hashable](
+    goal: S | None,
+    goals: Collection[S] | GoalTest[S] | None,
+) -> GoalTest[S]:
+    """Combine the single goal, set of goals, and goal predicate arguments of the search engines.
+
+    Raises:
+        ValueError: If not exactly one of the arguments was given.
+    """
+    if goal is not None and goals is None:
+        return frozenset((goal,)).__contains__
+    if goal is None and goals is not None:
+        return goals if callable(goals) else frozenset(goals).__contains__
+    msg = "Exactly one of goal and goals must be given."
+    raise ValueError(msg)
+
+
+def reconstruct_path[S: Hashable](parents: Mapping[S, S], goal: S) -> list[S]:
+    """Walk the parent pointers back from the goal to the start.
+
+    Args:
+        parents: The node each node was reached from. The start is its own parent.
+        goal: The node to build the path to.
+
+    Returns:
+        The path from the start to the goal (inclusive).
+    """
+    path = [goal]
+    current = goal
+    while (parent := parents[current]) != current:
+        path.append(parent)
+        current = parent
+    path.reverse()
+    return path
+
+
+def join_paths[S: Hashable](forward: Mapping[S, S], backward: Mapping[S, S], meeting: S) -> list[S]:
+    """Join the path from the start to a meeting point with the path from there to the goal.
+
+    Args:
+        forward: The parent pointers of a search from the start.
+        backward: The parent pointers of a search backwards from the goal.
+        meeting: A node reached by both searches.
+
+    Returns:
+        The path from the start to the goal (inclusive).
+    """
+    path = reconstruct_path(forward, meeting)
+    current = meeting
+    while (parent := backward[current]) != current:
+        path.append(parent)
+        current = parent
+    return path
+
+
+def reverse_paths[S: Hashable](paths: Mapping[S, set[S]]) -> dict[S, set[S]]:
+    """Flip every edge in an adjacency mapping, for searching backwards from a goal."""
+    reverse: dict[S, set[S]] = {}
+    for node, next_nodes in paths.items():
+        for next_node in next_nodes:
+            reverse.setdefault(next_node, set()).add(node)
+    return reverse
+
+
+@dataclass(frozen=True)
+class ShortestPathTree[S: Hashable]:
+    """The result of searching an entire graph from a start node.
+
+    Every reachable node is in both mappings. The start is its own parent.
+    """
+
+    distances: Mapping[S, float]
+    parents: Mapping[S, S]
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.distances
+
+    def distance_to(self, goal: S) -> float:
+        if goal not in self.distances:
+            msg = f"{goal!r} is not reachable."
+            raise UnsolveableError(msg)
+        return self.distances[goal]
+
+    def path_to(self, goal: S) -> list[S]:
+        if goal not in self.parents:
+            msg = f"{goal!r} is not reachable."
+            raise UnsolveableError(msg)
+        return reconstruct_path(self.parents, goal)
+
+
+@dataclass(frozen=True)
+class ShortestPathDag[S: Hashable]:
+    """Every cheapest path from the start(s) to the nearest goal(s), as a graph of predecessors.
+
+    Every node no further away than the goals is in both mappings. The starts have no
+    predecessors. The number of paths can grow exponentially with their length, so the methods
+    work on the graph itself, and only iter_paths walks paths one by one.
+    """
+
+    distances: Mapping[S, float]
+    predecessors: Mapping[S, set[S]]
+    # The goals that were reached at the lowest cost.
+    goals: tuple[S, ...]
+
+    @property
+    def cost(self) -> float:
+        return self.distances[self.goals[0]]
+
+    def _ends(self, goal: S | None) -> tuple[S, ...]:
+        if goal is None:
+            return self.goals
+        if goal not in self.predecessors:
+            msg = f"{goal!r} is not reachable."
+            raise UnsolveableError(msg)
+        return (goal,)
+
+    def nodes_on_paths(self, goal: S | None = None) -> set[S]:
+        """The nodes on any cheapest path to the goal, or to any of the nearest goals."""
+        seen = set(self._ends(goal))
+        frontier = list(seen)
+        while frontier:
+            node = frontier.pop()
+            for parent in self.predecessors[node]:
+                if parent not in seen:
+                    seen.add(parent)
+                    frontier.append(parent)
+        return seen
+
+    def count_paths(self, goal: S | None = None) -> int:
+        """The number of cheapest paths to the goal, or to any of the nearest goals."""
+        nodes = sorted(self.nodes_on_paths(goal), key=self.distances.__getitem__)
+        counts: dict[S, int] = {}
+        for node in nodes:
+            parents = self.predecessors[node]
+            counts[node] = sum(counts[parent] for parent in parents) if parents else 1
+        return sum(counts[end] for end in self._ends(goal))
+
+    def iter_paths(self, goal: S | None = None) -> Iterator[list[S]]:
+        """Yield the cheapest paths to the goal, or to any of the nearest goals, one at a time."""
+        # Every entry is a path from a node back to the goal, in reverse.
+        stack = [[end] for end in reversed(self._ends(goal))]
+        while stack:
+            reverse_path = stack.pop()
+            parents = self.predecessors[reverse_path[-1]]
+            if not parents:
+                yield reverse_path[::-1]
+            stack.extend([*reverse_path, parent] for parent in parents)
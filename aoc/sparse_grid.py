@@ -0,0 +1,160 @@
+"""An unbounded grid of live cells for cellular automata, stored in chunks as NumPy blocks.
+
+NumPy is an optional dependency, install it with the numpy extra.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from aoc.datatypes import NEIGHBOR_OFFSETS_4, NEIGHBOR_OFFSETS_8, Coord
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+type Chunk = npt.NDArray[np.bool_]
+type Rule = Callable[[Chunk, npt.NDArray[np.uint8]], Chunk]
+
+
+class LifeRule:
+    """A Life-like rule: dead cells with a birth count of live neighbors come alive, and live
+    cells with a survive count stay alive. Conway's Game of Life is LifeRule({3}, {2, 3}).
+    """
+
+    def __init__(self, birth: Collection[int], survive: Collection[int]) -> None:
+        if 0 in birth:
+            msg = "Cells can not be born without neighbors, as the grid is infinite."
+            raise ValueError(msg)
+        self.birth = np.isin(np.arange(9), list(birth))
+        self.survive = np.isin(np.arange(9), list(survive))
+
+    def __call__(self, alive: Chunk, neighbors: npt.NDArray[np.uint8]) -> Chunk:
+        return np.where(alive, self.survive[neighbors], self.birth[neighbors])
+
+
+def _halo_slices(size: int) -> dict[int, tuple[slice, slice]]:
+    """Where the edge of a neighboring chunk goes in a padded block, and where it comes from."""
+    return {
+        -1: (slice(0, 1), slice(size - 1, size)),
+        0: (slice(1, size + 1), slice(0, size)),
+        1: (slice(size + 1, size + 2), slice(0, 1)),
+    }
+
+
+class SparseGrid:
+    """A set of live cells on an unbounded grid.
+
+    The grid is split into square chunks, and only chunks with live cells are stored, as boolean
+    NumPy blocks keyed by the chunk's position. A step of a cellular automaton counts the
+    neighbors of a whole chunk at once, and only looks at the chunks with live cells and the
+    chunks next to them that cells may grow into.
+    """
+
+    def __init__(self, cells: Iterable[Coord] = (), *, chunk_size: int = 64) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, int], Chunk] = {}
+        self._halo = _halo_slices(chunk_size)
+        for cell in cells:
+            self.add(cell)
+
+    def _locate(self, cell: Coord) -> tuple[tuple[int, int], int, int]:
+        chunk_row, row = divmod(cell[0], self.chunk_size)
+        chunk_col, col = divmod(cell[1], self.chunk_size)
+        return (chunk_row, chunk_col), row, col
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, tuple):
+            return False
+        key, row, col = self._locate(cell)  # type: ignore[arg-type]
+        chunk = self.chunks.get(key)
+        return chunk is not None and bool(chunk[row, col])
+
+    def add(self, cell: Coord) -> None:
+        key, row, col = self._locate(cell)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = np.zeros((self.chunk_size, self.chunk_size), np.bool_)
+        chunk[row, col] = True
+
+    def discard(self, cell: Coord) -> None:
+        key, row, col = self._locate(cell)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            chunk[row, col] = False
+            if not chunk.any():
+                del self.chunks[key]
+
+    def __len__(self) -> int:
+        return sum(int(np.count_nonzero(chunk)) for chunk in self.chunks.values())
+
+    def __iter__(self) -> Iterator[Coord]:
+        size = self.chunk_size
+        for (chunk_row, chunk_col), chunk in self.chunks.items():
+            for row, col in zip(*np.nonzero(chunk), strict=True):
+                yield Coord(chunk_row * size + int(row), chunk_col * size + int(col))
+
+    def bounds(self) -> tuple[Coord, Coord]:
+        """The smallest and largest row and column of any live cell.
+
+        Raises:
+            ValueError: If there are no live cells.
+        """
+        cells = list(self)
+        if not cells:
+            msg = "The grid has no live cells."
+            raise ValueError(msg)
+        rows = [cell.row for cell in cells]
+        cols = [cell.col for cell in cells]
+        return Coord(min(rows), min(cols)), Coord(max(rows), max(cols))
+
+    def _padded(self, key: tuple[int, int]) -> npt.NDArray[np.uint8]:
+        """The chunk with a border of the cells around it, taken from the neighboring chunks."""
+        size = self.chunk_size
+        block = np.zeros((size + 2, size + 2), np.uint8)
+        chunk_row, chunk_col = key
+        for d_row, d_col in itertools.product((-1, 0, 1), repeat=2):
+            chunk = self.chunks.get((chunk_row + d_row, chunk_col + d_col))
+            if chunk is not None:
+                block_rows, chunk_rows = self._halo[d_row]
+                block_cols, chunk_cols = self._halo[d_col]
+                block[block_rows, block_cols] = chunk[chunk_rows, chunk_cols]
+        return block
+
+    def _candidates(self) -> set[tuple[int, int]]:
+        """The chunks that may have live cells after the next step."""
+        size = self.chunk_size
+        edges = {-1: slice(0, 1), 0: slice(0, size), 1: slice(size - 1, size)}
+        candidates = set(self.chunks)
+        for (chunk_row, chunk_col), chunk in self.chunks.items():
+            for d_row, d_col in NEIGHBOR_OFFSETS_8:
+                key = (chunk_row + d_row, chunk_col + d_col)
+                if key not in candidates and chunk[edges[d_row], edges[d_col]].any():
+                    candidates.add(key)
+        return candidates
+
+    def step(self, rule: Rule, *, diagonal: bool = True) -> None:
+        """Advance every cell by one generation of a cellular automaton.
+
+        Args:
+            rule: Takes a chunk of live cells and the number of live neighbors of every cell in
+                it, and returns which cells are alive in the next generation. A cell without
+                live neighbors may never come alive.
+            diagonal: Whether diagonal cells count as neighbors.
+        """
+        size = self.chunk_size
+        offsets = NEIGHBOR_OFFSETS_8 if diagonal else NEIGHBOR_OFFSETS_4
+        next_chunks: dict[tuple[int, int], Chunk] = {}
+        for key in self._candidates():
+            block = self._padded(key)
+            neighbors = np.zeros((size, size), np.uint8)
+            for d_row, d_col in offsets:
+                neighbors += block[1 + d_row : size + 1 + d_row, 1 + d_col : size + 1 + d_col]
+            chunk = rule(block[1:-1, 1:-1].astype(np.bool_), neighbors)
+            if chunk.any():
+                next_chunks[key] = chunk
+        self.chunks = next_chunks
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sized
+
+
+@dataclass
+class SearchStats:
+    """Counters filled in by a search engine, to find out why a search is slow.
+
+    Pass an instance as the stats argument of a search, and read it once the search is done.
+    Searches without stats run the uninstrumented code, so they pay nothing for this.
+    """
+
+    expanded: int = 0
+    pushed: int = 0
+    stale_skipped: int = 0
+    peak_frontier: int = 0
+    neighbor_time: float = 0.0
+    cost_time: float = 0.0
+
+    def observe_frontier(self, size: int) -> None:
+        self.peak_frontier = max(self.peak_frontier, size)
+
+    def timed_neighbors[F: Callable[..., Iterator[Any]]](
+        self,
+        next_func: F,
+        frontier: Sized | None = None,
+    ) -> F:
+        """Wrap a neighbor function to count expansions and time them.
+
+        Args:
+            next_func: The neighbor function of the search.
+            frontier: The frontier of the search, if it is a single collection that is updated in
+                place. Its size is sampled on every expansion.
+        """
+
+        def wrapper(current: object, paths: object) -> Iterator[Any]:
+            if frontier is not None:
+                # The popped node was still in the frontier before this expansion.
+                self.observe_frontier(len(frontier) + 1)
+            start = time.perf_counter()
+            nodes = list(next_func(current, paths=paths))
+            self.neighbor_time += time.perf_counter() - start
+            self.expanded += 1
+            return iter(nodes)
+
+        return cast("F", wrapper)
+
+    def timed_cost[F: Callable[..., float]](self, cost_func: F) -> F:
+        """Wrap a cost function to time it."""
+
+        def wrapper(paths: object, current: object, last: object) -> float:
+            start = time.perf_counter()
+            cost = cost_func(paths, current, last)
+            self.cost_time += time.perf_counter() - start
+            return cost
+
+        return cast("F", wrapper)
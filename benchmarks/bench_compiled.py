@@ -0,0 +1,74 @@
+"""Compare bfs and dijkstra on an adjacency mapping with the same searches on a CompiledGraph.
+
+Run with: python -m benchmarks.bench_compiled
+"""
+
+from __future__ import annotations
+
+import contextlib
+import random
+import time
+from typing import TYPE_CHECKING
+
+from aoc import bfs, dijkstra
+from aoc.compiled import CompiledGraph
+from aoc.exceptions import UnsolveableError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+NODES = 20_000
+EDGES_PER_NODE = 4
+MAX_COST = 9
+REPEATS = 5
+
+
+def _graph() -> tuple[dict[int, set[int]], dict[tuple[int, int], int]]:
+    rng = random.Random(2022)  # noqa: S311
+    paths = {node: {rng.randrange(NODES) for _ in range(EDGES_PER_NODE)} for node in range(NODES)}
+    costs = {
+        (node, next_node): rng.randint(1, MAX_COST)
+        for node, next_nodes in paths.items()
+        for next_node in next_nodes
+    }
+    return paths, costs
+
+
+def _time(search: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        with contextlib.suppress(UnsolveableError):
+            search()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main() -> None:
+    paths, costs = _graph()
+
+    def cost_func(paths: Mapping[int, set[int]], current: int, last: int) -> float:  # noqa: ARG001
+        return costs[(last, current)]
+
+    start = time.perf_counter()
+    graph = CompiledGraph.from_mapping(paths, cost_func=cost_func)
+    print(f"compiling: {(time.perf_counter() - start) * 1000:.1f}ms")  # noqa: T201
+
+    def never(_: int) -> bool:
+        return False
+
+    searches: dict[str, Callable[[], object]] = {
+        "bfs": lambda: bfs.breadth_first_search(start=0, goals=never, paths=paths),
+        "CompiledGraph.bfs": lambda: graph.bfs(start=0, goals=never),
+        "dijkstra": lambda: dijkstra.dijkstra(
+            start=0,
+            goals=never,
+            paths=paths,
+            cost_func=cost_func,
+        ),
+        "CompiledGraph.dijkstra": lambda: graph.dijkstra(start=0, goals=never),
+    }
+    for name, search in searches.items():
+        print(f"{name:<24} {_time(search) * 1000:7.1f}ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Micro-benchmarks for the Coord hot paths, compared to their previous implementations.
+
+Run with: python -m benchmarks.bench_datatypes
+"""
+
+from __future__ import annotations
+
+import itertools
+import timeit
+
+from aoc.datatypes import Coord, Direction
+
+
+def _old_add(self: Coord, other: object) -> Coord:
+    if isinstance(other, Coord):
+        delta = other
+    elif isinstance(other, Direction):
+        match other:
+            case Direction.NORTH:
+                delta = Coord(-1, 0)
+            case Direction.SOUTH:
+                delta = Coord(1, 0)
+            case Direction.WEST:
+                delta = Coord(0, -1)
+            case Direction.EAST:
+                delta = Coord(0, 1)
+    else:
+        msg = "Coords can only be added with themselves and Directions."
+        raise TypeError(msg)
+    return Coord(self.row + delta.row, self.col + delta.col)
+
+
+def _old_get_neighbors(self: Coord) -> list[Coord]:
+    all_neighbors = []
+    for row, col in itertools.product(range(-1, 2, 1), repeat=2):
+        if row == 0 and col == 0:
+            continue
+        all_neighbors.append(Coord(self.row + row, self.col + col))
+    return all_neighbors
+
+
+def _old_get_neighbors_limited(self: Coord, corner: Coord) -> list[Coord]:
+    neighbors = _old_get_neighbors(self)
+
+    def filter_below_bounds(coord: Coord) -> bool:
+        return coord.row > -1 and coord.col > -1
+
+    neighbors = list(filter(filter_below_bounds, neighbors))
+
+    def filter_above_bounds(coord: Coord) -> bool:
+        return coord.row <= corner.row and coord.col <= corner.col
+
+    return list(filter(filter_above_bounds, neighbors))
+
+
+def _compare(name: str, old: str, new: str, number: int = 200_000) -> None:
+    context = {
+        "Coord": Coord,
+        "Direction": Direction,
+        "point": Coord(5, 5),
+        "corner": Coord(10, 10),
+        "_old_add": _old_add,
+        "_old_get_neighbors": _old_get_neighbors,
+        "_old_get_neighbors_limited": _old_get_neighbors_limited,
+    }
+    old_time = min(timeit.repeat(old, globals=context, number=number, repeat=5)) / number
+    new_time = min(timeit.repeat(new, globals=context, number=number, repeat=5)) / number
+    print(  # noqa: T201
+        f"{name:<40} {old_time * 1e9:8.0f} ns {new_time * 1e9:8.0f} ns {old_time / new_time:6.1f}x",
+    )
+
+
+def main() -> None:
+    print(f"{'':<40} {'before':>11} {'after':>11} {'speedup':>7}")  # noqa: T201
+    _compare("Coord + Coord", "_old_add(point, corner)", "point + corner")
+    _compare("Coord + Direction", "_old_add(point, Direction.EAST)", "point + Direction.EAST")
+    _compare("get_neighbors", "_old_get_neighbors(point)", "point.get_neighbors()")
+    _compare(
+        "get_neighbors_limited",
+        "_old_get_neighbors_limited(point, corner)",
+        "point.get_neighbors_limited(corner)",
+    )
+    _compare(
+        "4 neighbors within bounds",
+        "[c for c in _old_get_neighbors_limited(point, corner) if c.row == 5 or c.col == 5]",
+        "list(point.neighbors4(corner))",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare the search engines with and without interned states, on large composite states.
+
+The states hold a position and the frozenset of collected keys, on an open grid with keys
+scattered around it, like the key collecting puzzles. They are frozen dataclasses, which hash
+and compare in Python.
+
+Run with: python -m benchmarks.bench_intern
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from aoc import a_star, bfs, dijkstra
+from aoc.datatypes import Coord
+from aoc.exceptions import UnsolveableError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+SIZE = 14
+KEYS = 7
+
+
+@dataclass(frozen=True)
+class State:
+    position: Coord
+    keys: frozenset[Coord]
+
+
+def _keys() -> frozenset[Coord]:
+    rng = random.Random(2019)  # noqa: S311
+    cells = [Coord(row, col) for row in range(SIZE) for col in range(SIZE)]
+    return frozenset(rng.sample(cells[1:], KEYS))
+
+
+def main() -> None:
+    keys = _keys()
+    corner = Coord(SIZE - 1, SIZE - 1)
+
+    def next_func(current: State, paths: Mapping[State, object]) -> Iterator[State]:  # noqa: ARG001
+        collected = current.keys
+        for neighbor in current.position.neighbors4(corner):
+            yield State(neighbor, collected | {neighbor} if neighbor in keys else collected)
+
+    def cost_func(paths: object, current: State, last: State) -> float:  # noqa: ARG001
+        return 1.0
+
+    def heuristic(current: State) -> float:
+        return float(KEYS - len(current.keys))
+
+    start = State(Coord(0, 0), frozenset())
+    searches: dict[str, Callable[..., object]] = {
+        "bfs": functools.partial(
+            bfs.breadth_first_search,
+            start=start,
+            goals=lambda _: False,
+            paths={},
+            next_func=next_func,
+        ),
+        "dijkstra": functools.partial(
+            dijkstra.dijkstra,
+            start=start,
+            goals=lambda _: False,
+            paths={},
+            cost_func=cost_func,
+            next_func=next_func,
+        ),
+        "a_star": functools.partial(
+            a_star.a_star_multi,
+            [start],
+            lambda _: False,
+            heuristic,
+            cost_func,
+            next_func,
+        ),
+    }
+    print(f"{'engine':<10} {'interned':<9} {'time':>9} {'peak memory':>12}")  # noqa: T201
+    for name, search in searches.items():
+        for interned in (False, True):
+            start_time = time.perf_counter()
+            with contextlib.suppress(UnsolveableError):
+                search(interned=interned)
+            elapsed = time.perf_counter() - start_time
+            # Measure memory separately, as tracing allocations slows everything down.
+            tracemalloc.start()
+            with contextlib.suppress(UnsolveableError):
+                search(interned=interned)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(  # noqa: T201
+                f"{name:<10} {interned!s:<9} {elapsed * 1000:7.1f}ms {peak / 2**20:10.1f}MB",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare the frontier queues of aoc.pq on a dense random graph.
+
+Run with: python -m benchmarks.bench_pq
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import random
+import time
+from typing import TYPE_CHECKING
+
+from aoc import dijkstra, pq
+from aoc.exceptions import UnsolveableError
+from aoc.stats import SearchStats
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+NODES = 2_000
+EDGES_PER_NODE = 50
+MAX_COST = 100
+
+
+def _graph() -> tuple[dict[int, set[int]], dict[tuple[int, int], int]]:
+    rng = random.Random(2023)  # noqa: S311
+    paths = {node: set(rng.sample(range(NODES), EDGES_PER_NODE)) for node in range(NODES)}
+    costs = {
+        (node, next_node): rng.randint(1, MAX_COST)
+        for node, next_nodes in paths.items()
+        for next_node in next_nodes
+    }
+    return paths, costs
+
+
+def main() -> None:
+    paths, costs = _graph()
+
+    def cost_func(paths: Mapping[int, set[int]], current: int, last: int) -> float:  # noqa: ARG001
+        return costs[(last, current)]
+
+    queues: dict[str, pq.QueueFactory[int] | None] = {
+        "heapq (inline)": None,
+        "LazyHeap": pq.LazyHeap[int],
+        "IndexedHeap(2)": functools.partial(pq.IndexedHeap[int], arity=2),
+        "IndexedHeap(4)": pq.IndexedHeap[int],
+        "IndexedHeap(8)": functools.partial(pq.IndexedHeap[int], arity=8),
+        "RadixHeap": pq.RadixHeap[int],
+    }
+    print(f"{'queue':<16} {'time':>9} {'pushed':>8} {'stale':>8} {'peak size':>10}")  # noqa: T201
+    for name, queue in queues.items():
+        search = functools.partial(
+            dijkstra.dijkstra,
+            start=0,
+            goals=lambda _: False,
+            paths=paths,
+            cost_func=cost_func,
+            queue=queue,
+        )
+        # Time the search without stats, and count with them, as timing the cost function
+        # slows everything down.
+        start = time.perf_counter()
+        with contextlib.suppress(UnsolveableError):
+            search()
+        elapsed = time.perf_counter() - start
+        stats = SearchStats()
+        with contextlib.suppress(UnsolveableError):
+            search(stats=stats)
+        print(  # noqa: T201
+            f"{name:<16} {elapsed * 1000:7.1f}ms {stats.pushed:>8} {stats.stale_skipped:>8}"
+            f" {stats.peak_frontier:>10}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare a thousand generations of Life on a set of cells with the same run on a SparseGrid.
+
+Run with: python -m benchmarks.bench_sparse_grid
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import Counter
+
+from aoc.datatypes import Coord
+from aoc.sparse_grid import LifeRule, SparseGrid
+
+SIZE = 200
+DENSITY = 0.35
+GENERATIONS = 1000
+
+
+def _cells() -> set[Coord]:
+    rng = random.Random(2022)  # noqa: S311
+    return {Coord(row, col) for row in range(SIZE) for col in range(SIZE) if rng.random() < DENSITY}
+
+
+def _set_life(live: set[Coord]) -> set[Coord]:
+    counts = Counter(neighbor for cell in live for neighbor in cell.get_neighbors())
+    return {cell for cell, count in counts.items() if count == 3 or (count == 2 and cell in live)}  # noqa: PLR2004
+
+
+def main() -> None:
+    cells = _cells()
+
+    start = time.perf_counter()
+    live = cells
+    for _ in range(GENERATIONS):
+        live = _set_life(live)
+    print(f"set:        {time.perf_counter() - start:6.2f}s, {len(live)} cells")  # noqa: T201
+
+    rule = LifeRule({3}, {2, 3})
+    for chunk_size in (32, 64):
+        start = time.perf_counter()
+        grid = SparseGrid(cells, chunk_size=chunk_size)
+        for _ in range(GENERATIONS):
+            grid.step(rule)
+        elapsed = time.perf_counter() - start
+        print(f"SparseGrid({chunk_size}): {elapsed:6.2f}s, {len(grid)} cells")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,10 @@ from dataclasses import dataclass
 
 import pytest
 
-from aoc.a_star import Cost, Heuristic, Neighbors, a_star
+from aoc.a_star import Cost, Heuristic, MultiGoalHeuristic, Neighbors, a_star, a_star_multi
 from aoc.datatypes import Coord
 from aoc.exceptions import UnsolveableError
+from aoc.pq import IndexedHeap, LazyHeap
 
 
 @dataclass
@@ -222,3 +223,93 @@ def test_unsolveable() -> None:
             MazeCost(),
             MazeNeighbors(test_maze),
         )
+
+
+class CountingNeighbors(Neighbors[Coord]):
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.expanded: list[Coord] = []
+
+    def __call__(self, current: Coord, paths: Mapping[Coord, Coord]) -> Iterator[Coord]:  # noqa: ARG002
+        self.expanded.append(current)
+        for potential_neighbor in [Coord(-1, 0), Coord(1, 0), Coord(0, -1), Coord(0, 1)]:
+            neighbor = current + potential_neighbor
+            if 0 <= neighbor.row < self.size and 0 <= neighbor.col < self.size:
+                yield neighbor
+
+
+@pytest.mark.parametrize("prefer_deeper", [True, False])
+def test_open_grid_expands_each_node_once(*, prefer_deeper: bool) -> None:
+    neighbors = CountingNeighbors(size=20)
+
+    path, cost = a_star(
+        Coord(0, 0),
+        Coord(19, 19),
+        MazeHeuristic(),
+        MazeCost(),
+        neighbors,
+        prefer_deeper=prefer_deeper,
+    )
+
+    assert cost == 38.0
+    assert len(path) == 39
+    assert len(neighbors.expanded) == len(set(neighbors.expanded))
+    if prefer_deeper:
+        # Breaking ties towards the goal walks straight there.
+        assert len(neighbors.expanded) == 38
+
+
+def test_multiple_starts_and_goals() -> None:
+    # fmt: off
+    maze = (
+        "S.....\n"
+        ".xxxx.\n"
+        "......\n"
+        ".xxxx.\n"
+        "T.....\n"
+    )
+    # fmt: on
+    test_maze = parse_maze(maze)
+    goals = {Coord(4, 0), Coord(2, 5)}
+
+    path, cost = a_star_multi(
+        [test_maze.start, Coord(0, 5)],
+        goals,
+        MultiGoalHeuristic(MazeHeuristic(), goals),
+        MazeCost(),
+        MazeNeighbors(test_maze),
+    )
+
+    assert path == [Coord(0, 5), Coord(1, 5), Coord(2, 5)]
+    assert cost == 2.0
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"queue": LazyHeap[str]}, {"queue": IndexedHeap[str]}, {"interned": True}],
+)
+def test_inconsistent_heuristic(options: dict[str, object]) -> None:
+    # The estimate for A is exact, but drops by far more than the step from A to C costs, so
+    # C is first reached and closed through the more expensive B.
+    edges = {
+        ("S", "A"): 1,
+        ("S", "B"): 1,
+        ("A", "C"): 1,
+        ("B", "C"): 3,
+        ("C", "G"): 10,
+    }
+    estimates = {"S": 0, "A": 11, "B": 0, "C": 0, "G": 0}
+
+    def neighbors(current: str, paths: Mapping[str, str]) -> Iterator[str]:  # noqa: ARG001
+        return (target for source, target in edges if source == current)
+
+    def cost(paths: Mapping[str, str], current: str, last: str) -> float:  # noqa: ARG001
+        return edges[(last, current)]
+
+    def heuristic(current: str, goal: str) -> float:  # noqa: ARG001
+        return estimates[current]
+
+    path, total = a_star("S", "G", heuristic, cost, neighbors, **options)  # type: ignore[arg-type]
+
+    assert path == ["S", "A", "C", "G"]
+    assert total == 12
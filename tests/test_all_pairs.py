@@ -0,0 +1,65 @@
+import random
+from collections.abc import Mapping
+
+import pytest
+
+from aoc import dijkstra
+
+np = pytest.importorskip("numpy")
+all_pairs = pytest.importorskip("aoc.all_pairs")
+
+
+def random_graph(seed: int) -> tuple[dict[int, set[int]], dict[tuple[int, int], int]]:
+    rng = random.Random(seed)  # noqa: S311
+    paths = {node: {rng.randrange(30) for _ in range(2)} for node in range(25)}
+    costs = {(node, next_node): rng.randint(1, 9) for node in paths for next_node in paths[node]}
+    return paths, costs
+
+
+@pytest.mark.parametrize("method", ["auto", "floyd_warshall", "bfs", "dijkstra"])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_all_pairs_distances(method: str, weighted: bool) -> None:  # noqa: FBT001
+    if method == "bfs" and weighted:
+        pytest.skip("bfs needs unit costs")
+    paths, costs = random_graph(len(method))
+
+    def cost_func(paths: Mapping[int, set[int]], current: int, last: int) -> float:  # noqa: ARG001
+        return costs[last, current] if weighted else 1.0
+
+    nodes = [3, 0, 28, 7, 31]
+    matrix = all_pairs.all_pairs_distances(
+        paths,
+        nodes=nodes,
+        cost_func=cost_func if weighted else None,
+        method=method,
+    )
+
+    assert matrix.nodes == nodes
+    assert matrix.matrix.shape == (5, 5)
+    for start in nodes:
+        tree = dijkstra.dijkstra_distances(start=start, paths=paths, cost_func=cost_func)
+        for goal in nodes:
+            expected = tree.distances.get(goal, float("inf"))
+            assert matrix[start, goal] == expected
+
+
+def test_all_pairs_distances__all_nodes() -> None:
+    paths = {"A": {"B"}, "B": {"A", "C"}}
+
+    matrix = all_pairs.all_pairs_distances(paths)
+
+    assert matrix.nodes == ["A", "B", "C"]
+    assert matrix.matrix.tolist() == [
+        [0.0, 1.0, 2.0],
+        [1.0, 0.0, 1.0],
+        [float("inf"), float("inf"), 0.0],
+    ]
+
+
+def test_all_pairs_distances__bfs_needs_unit_costs() -> None:
+    with pytest.raises(ValueError, match="costs 1"):
+        all_pairs.all_pairs_distances(
+            {"A": {"B"}},
+            cost_func=lambda _paths, _current, _last: 2.0,
+            method="bfs",
+        )
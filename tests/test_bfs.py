@@ -1,3 +1,5 @@
+import itertools
+
 import pytest
 
 from aoc import bfs
@@ -24,3 +26,102 @@ def test_bfs__no_solution() -> None:
 
     with pytest.raises(UnsolveableError):
         bfs.breadth_first_search(start="A", goal="D", paths=paths)
+
+
+def test_bfs__start_is_goal() -> None:
+    path, cost = bfs.breadth_first_search(start="A", goal="A", paths={"A": {"B"}})
+    assert path == ["A"]
+    assert cost == 0
+
+
+def test_bfs__long_corridor() -> None:
+    length = 5000
+    paths = {node: {node - 1, node + 1} for node in range(length)}
+
+    path, cost = bfs.breadth_first_search(start=0, goal=length - 1, paths=paths)
+    assert path == list(range(length))
+    assert cost == length - 1
+
+
+def test_bfs_distances() -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"D"},
+        "C": {"D"},
+        "D": {"E"},
+        "F": {"A"},
+    }
+
+    tree = bfs.bfs_distances(start="A", paths=paths)
+    assert tree.distances == {"A": 0, "B": 1, "C": 1, "D": 2, "E": 3}
+    assert tree.path_to("A") == ["A"]
+    assert tree.path_to("E")[::3] == ["A", "E"]
+    assert len(tree.path_to("E")) == 4
+    assert "F" not in tree
+    with pytest.raises(UnsolveableError):
+        tree.path_to("F")
+
+
+def test_bfs__multiple_starts_and_goals() -> None:
+    paths = {
+        "A": {"B"},
+        "B": {"C"},
+        "C": {"D"},
+        "X": {"Y"},
+        "Y": {"D", "Z"},
+    }
+
+    path, cost = bfs.breadth_first_search(starts=["A", "X"], goals={"D", "Z"}, paths=paths)
+    assert path[0] == "X"
+    assert path[-1] in {"D", "Z"}
+    assert cost == 2
+
+
+def test_bfs__goal_predicate() -> None:
+    paths = {node: {node + 1} for node in range(100)}
+
+    path, cost = bfs.breadth_first_search(start=3, goals=lambda node: node % 10 == 0, paths=paths)
+    assert path == [3, 4, 5, 6, 7, 8, 9, 10]
+    assert cost == 7
+
+
+def test_bfs__start_and_starts() -> None:
+    with pytest.raises(ValueError, match="start"):
+        bfs.breadth_first_search(start="A", starts=["B"], goal="C", paths={})
+
+
+@pytest.mark.parametrize("goal", ["A", "B", "D", "E"])
+def test_bidirectional_search__matches_bfs(goal: str) -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"D"},
+        "C": {"D", "E"},
+        "D": {"E"},
+    }
+
+    path, cost = bfs.bidirectional_search(start="A", goal=goal, paths=paths)
+    _, expected_cost = bfs.breadth_first_search(start="A", goal=goal, paths=paths)
+    assert cost == expected_cost
+    assert path[0] == "A"
+    assert path[-1] == goal
+    assert all(b in paths[a] for a, b in itertools.pairwise(path))
+
+
+def test_bidirectional_search__no_solution() -> None:
+    paths = {
+        "A": {"B"},
+        "C": {"D"},
+    }
+
+    with pytest.raises(UnsolveableError):
+        bfs.bidirectional_search(start="A", goal="D", paths=paths)
+
+
+def test_bidirectional_search__custom_next_func_needs_prev_func() -> None:
+    with pytest.raises(ValueError, match="prev_func"):
+        bfs.bidirectional_search(
+            start="A",
+            goal="B",
+            paths={},
+            next_func=bfs.SimpleMappingNeighborFunc(),
+        )
@@ -0,0 +1,49 @@
+from collections.abc import Iterator, Mapping
+
+import pytest
+
+from aoc import bfs
+from aoc.bitset import VisitedBitset
+from aoc.datatypes import Coord
+
+
+def test_visited_bitset() -> None:
+    visited = VisitedBitset(Coord(2, 4), [Coord(0, 0)])
+    visited.add(Coord(2, 4))
+    visited.add(Coord(1, 3))
+    visited.add(Coord(1, 3))
+
+    assert Coord(0, 0) in visited
+    assert Coord(1, 3) in visited
+    assert (2, 4) in visited
+    assert Coord(1, 4) not in visited
+    assert Coord(3, 0) not in visited
+    assert Coord(-1, 0) not in visited
+    assert "A" not in visited
+    assert len(visited) == 3
+    assert list(visited) == [Coord(0, 0), Coord(1, 3), Coord(2, 4)]
+
+    visited.discard(Coord(1, 3))
+    visited.discard(Coord(9, 9))
+    assert Coord(1, 3) not in visited
+    assert len(visited) == 2
+    with pytest.raises(IndexError):
+        visited.add(Coord(0, 5))
+
+
+def test_flood_fill_with_bitset() -> None:
+    corner = Coord(19, 29)
+    walls = {Coord(row, 10) for row in range(20)}
+
+    def next_func(current: Coord, paths: Mapping[Coord, set[Coord]]) -> Iterator[Coord]:  # noqa: ARG001
+        return (cell for cell in current.neighbors4(corner) if cell not in walls)
+
+    visited = bfs.flood_fill(
+        start=Coord(5, 5),
+        paths={},
+        next_func=next_func,
+        visited=VisitedBitset(corner),
+    )
+
+    assert len(visited) == 20 * 10
+    assert set(visited) == bfs.flood_fill(start=Coord(5, 5), paths={}, next_func=next_func)
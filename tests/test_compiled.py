@@ -0,0 +1,60 @@
+import itertools
+import random
+from collections.abc import Mapping
+
+import pytest
+
+from aoc import bfs, dijkstra
+from aoc.compiled import CompiledGraph
+from aoc.exceptions import UnsolveableError
+
+
+def random_graph(seed: int) -> tuple[dict[int, set[int]], dict[tuple[int, int], int]]:
+    rng = random.Random(seed)  # noqa: S311
+    paths = {node: {rng.randrange(60) for _ in range(3)} for node in range(50)}
+    costs = {(node, next_node): rng.randint(1, 9) for node in paths for next_node in paths[node]}
+    return paths, costs
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compiled_matches_engines(seed: int) -> None:
+    paths, costs = random_graph(seed)
+
+    def cost_func(paths: Mapping[int, set[int]], current: int, last: int) -> float:  # noqa: ARG001
+        return costs[last, current]
+
+    graph = CompiledGraph.from_mapping(paths, cost_func=cost_func)
+    tree = dijkstra.dijkstra_distances(start=0, paths=paths, cost_func=cost_func)
+    compiled_tree = graph.dijkstra_distances(start=0)
+
+    assert compiled_tree.distances == tree.distances
+    for goal in range(60):
+        if goal not in tree:
+            with pytest.raises(UnsolveableError):
+                graph.dijkstra(start=0, goal=goal)
+            with pytest.raises(UnsolveableError):
+                graph.bfs(start=0, goal=goal)
+            continue
+        path, cost = graph.dijkstra(start=0, goal=goal)
+        assert cost == tree.distance_to(goal)
+        assert sum(costs[last, current] for last, current in itertools.pairwise(path)) == cost
+        assert compiled_tree.path_to(goal)[-1] == goal
+        assert (
+            graph.bfs(start=0, goal=goal)[1]
+            == bfs.breadth_first_search(start=0, goal=goal, paths=paths)[1]
+        )
+
+
+def test_compiled_graph() -> None:
+    paths = {"A": {"B", "C"}, "B": {"D"}}
+    graph = CompiledGraph.from_mapping(paths)
+
+    assert len(graph) == 4
+    assert "D" in graph
+    assert "E" not in graph
+    assert sorted(graph.neighbors("A")) == [("B", 1.0), ("C", 1.0)]
+    assert list(graph.neighbors("D")) == []
+    assert graph.bfs(starts=["C", "B"], goals=lambda node: node == "D") == (["B", "D"], 1)
+    assert graph.dijkstra(start="A", goals={"C", "D"}) == (["A", "C"], 1.0)
+    with pytest.raises(UnsolveableError):
+        graph.dijkstra(start="E", goal="A")
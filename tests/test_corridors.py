@@ -0,0 +1,94 @@
+import itertools
+
+from aoc.bfs import breadth_first_search
+from aoc.corridors import contract_corridors
+from aoc.datatypes import Coord
+from aoc.dijkstra import dijkstra
+
+MAZE = (
+    "#S#########",
+    "#.....#...#",
+    "#.###.#.#.#",
+    "#...#...#.#",
+    "###.#####.#",
+    "#.........#",
+    "#########T#",
+)
+
+
+def parse(maze: tuple[str, ...]) -> tuple[set[Coord], Coord, Coord]:
+    cells = {
+        Coord(row, col): char
+        for row, line in enumerate(maze)
+        for col, char in enumerate(line)
+        if char != "#"
+    }
+    start = next(cell for cell, char in cells.items() if char == "S")
+    goal = next(cell for cell, char in cells.items() if char == "T")
+    return set(cells), start, goal
+
+
+def test_contract_maze() -> None:
+    walkable, start, goal = parse(MAZE)
+    graph = contract_corridors(walkable, keep=[start, goal])
+
+    path, cost = dijkstra(start=start, goal=goal, paths=graph.paths, cost_func=graph.cost_func)
+    expanded = graph.expand(path)
+
+    assert len(graph.paths) < len(walkable) // 4
+    paths = {cell: {n for n in cell.neighbors4() if n in walkable} for cell in walkable}
+    assert cost == breadth_first_search(start=start, goal=goal, paths=paths)[1]
+    assert expanded[0] == start
+    assert expanded[-1] == goal
+    assert len(expanded) == cost + 1
+    assert all(b in a.neighbors4() for a, b in itertools.pairwise(expanded))
+
+
+def test_contract_mapping() -> None:
+    # A -- B -- C -- D, plus a one way corridor D -> E -> A and a dead end C -- F.
+    paths = {
+        "A": {"B"},
+        "B": {"A", "C"},
+        "C": {"B", "D", "F"},
+        "D": {"C", "E"},
+        "E": {"A"},
+        "F": {"C"},
+    }
+
+    graph = contract_corridors(paths)
+
+    assert set(graph.paths) == {"A", "C", "D", "E", "F"}
+    assert graph.paths["A"] == {"C"}
+    assert graph.costs["A", "C"] == 2
+    assert graph.corridors["A", "C"] == ("B",)
+    assert graph.expand(["A", "C", "F"]) == ["A", "B", "C", "F"]
+    assert graph.paths["D"] == {"C", "E"}
+
+
+def test_contract_keeps_cheapest_corridor() -> None:
+    # Two corridors join A and B, one of them with an extra node.
+    paths = {
+        "A": {"X", "Y1", "Z"},
+        "X": {"A", "B"},
+        "Y1": {"A", "Y2"},
+        "Y2": {"Y1", "B"},
+        "B": {"X", "Y2", "W"},
+        "W": {"B"},
+        "Z": {"A"},
+    }
+
+    graph = contract_corridors(paths)
+
+    assert graph.costs["A", "B"] == 2
+    assert graph.corridors["A", "B"] == ("X",)
+    assert graph.expand(["A", "B"]) == ["A", "X", "B"]
+
+
+def test_contract_weighted() -> None:
+    paths = {"A": {"B"}, "B": {"A", "C"}, "C": {"B"}}
+    weights = {"A": 1, "B": 10, "C": 100}
+
+    graph = contract_corridors(paths, cost_func=lambda _paths, current, _last: weights[current])
+
+    assert graph.costs["A", "C"] == 110
+    assert graph.costs["C", "A"] == 11
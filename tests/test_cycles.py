@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from aoc import cycles
+
+
+def rho(state: int) -> int:
+    # From 2, states repeat every 6 steps after the first 2.
+    return (state * state + 1) % 1000
+
+
+def naive(state: int, steps: int) -> int:
+    for _ in range(steps):
+        state = rho(state)
+    return state
+
+
+def naive_cycle(state: int) -> tuple[int, int]:
+    seen: dict[int, int] = {}
+    step = 0
+    while state not in seen:
+        seen[state] = step
+        state = rho(state)
+        step += 1
+    return seen[state], step - seen[state]
+
+
+@pytest.mark.parametrize("start", [0, 2, 7, 500])
+def test_find_cycle(start: int) -> None:
+    cycle = cycles.find_cycle(start, rho)
+    assert (cycle.start, cycle.length) == naive_cycle(start)
+    for steps in range(60):
+        assert naive(start, cycle.reduce(steps)) == naive(start, steps)
+
+
+def test_find_cycle_with_key() -> None:
+    def spin(state: list[int]) -> list[int]:
+        return state[1:] + state[:1]
+
+    cycle = cycles.find_cycle([1, 2, 3, 4], spin, key=tuple)
+    assert cycle == cycles.Cycle(0, 4)
+
+
+@pytest.mark.parametrize("max_fingerprints", [0, 3, cycles.MAX_FINGERPRINTS])
+@pytest.mark.parametrize("steps", [0, 1, 5, 9, 10, 17, 100, 10**12])
+def test_state_after(steps: int, max_fingerprints: int) -> None:
+    cycle = cycles.find_cycle(2, rho)
+    expected = naive(2, cycle.reduce(steps))
+    assert cycles.state_after(2, rho, steps, max_fingerprints=max_fingerprints) == expected
+
+
+@pytest.mark.parametrize("max_fingerprints", [0, cycles.MAX_FINGERPRINTS])
+def test_state_after_without_cycle(max_fingerprints: int) -> None:
+    def count(state: int) -> int:
+        return state + 1
+
+    assert cycles.state_after(0, count, 1000, max_fingerprints=max_fingerprints) == 1000
+
+
+class Colliding:
+    """A value whose hash collides with every other Colliding value."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Colliding) and other.value == self.value
+
+    def __hash__(self) -> int:
+        return 0
+
+
+def test_state_after_hash_collisions() -> None:
+    assert cycles.state_after(2, rho, 10**12, key=Colliding) == naive(
+        2,
+        cycles.find_cycle(2, rho).reduce(10**12),
+    )
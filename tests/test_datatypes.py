@@ -1,6 +1,6 @@
 import pytest
 
-from aoc import Coord
+from aoc import Coord, Direction
 
 
 def test_coord_get_neighbors() -> None:
@@ -201,3 +201,43 @@ def test_sub_invalid_type() -> None:
 
 def test_coord_sub() -> None:
     assert Coord(5, 2) - Coord(2, 3) == Coord(3, -1)
+
+
+def test_coord_add_direction() -> None:
+    assert Coord(1, 1) + Direction.NORTH == Coord(0, 1)
+    assert Coord(1, 1) + Direction.SOUTH == Coord(2, 1)
+    assert Coord(1, 1) + Direction.WEST == Coord(1, 0)
+    assert Coord(1, 1) + Direction.EAST == Coord(1, 2)
+    assert type(Coord(1, 1) + Direction.EAST) is Coord
+
+
+def test_direction_tables() -> None:
+    assert len(Direction) == 4
+    for direction in Direction:
+        assert direction.opposite.opposite is direction
+        assert direction.turn_left().turn_right() is direction
+        assert direction.turn_left().turn_left() is direction.opposite
+        assert direction.delta + direction.opposite.delta == Coord(0, 0)
+    assert Direction.NORTH.turn_right() is Direction.EAST
+    assert Direction.NORTH.delta == Coord(-1, 0)
+
+
+def test_coord_neighbors4() -> None:
+    assert set(Coord(1, 1).neighbors4()) == {Coord(0, 1), Coord(1, 0), Coord(1, 2), Coord(2, 1)}
+    assert set(Coord(0, 0).neighbors4(Coord(2, 2))) == {Coord(0, 1), Coord(1, 0)}
+    assert set(Coord(2, 2).neighbors4(Coord(2, 2))) == {Coord(1, 2), Coord(2, 1)}
+
+
+def test_coord_neighbors8() -> None:
+    assert list(Coord(1, 1).neighbors8()) == Coord(1, 1).get_neighbors()
+    assert len(list(Coord(0, 0).neighbors8(Coord(0, 0)))) == 0
+
+
+def test_coord_within() -> None:
+    corner = Coord(2, 3)
+
+    assert Coord(0, 0).within(corner)
+    assert Coord(2, 3).within(corner)
+    assert not Coord(3, 0).within(corner)
+    assert not Coord(0, -1).within(corner)
+    assert all(coord.within(corner) for coord in Coord(2, 3).get_neighbors_limited(corner))
@@ -1,3 +1,4 @@
+import math
 from collections.abc import Mapping
 
 import pytest
@@ -43,3 +44,290 @@ def test_dijkstra__no_solution() -> None:
 
     with pytest.raises(UnsolveableError):
         dijkstra.dijkstra(start="A", goal="D", paths=paths, cost_func=dumb_cost_func)
+
+
+def test_dijkstra__unorderable_nodes() -> None:
+    class Node:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    a, b, c, d = Node("A"), Node("B"), Node("C"), Node("D")
+    paths = {a: {b, c}, b: {d}, c: {d}}
+
+    def unit_cost(paths: Mapping[Node, set[Node]], current: Node, last: Node) -> float:  # noqa: ARG001
+        return 1.0
+
+    path, cost = dijkstra.dijkstra(start=a, goal=d, paths=paths, cost_func=unit_cost)
+    assert path[0] is a
+    assert path[-1] is d
+    assert len(path) == 3
+    assert cost == 2.0
+
+
+def test_dijkstra_distances() -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"C"},
+        "C": {"D"},
+    }
+    cost_map = {
+        ("A", "B"): 1,
+        ("B", "C"): 1,
+        ("A", "C"): 3,
+        ("C", "D"): 5,
+    }
+
+    tree = dijkstra.dijkstra_distances(
+        start="A",
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+    )
+    assert tree.distances == {"A": 0.0, "B": 1.0, "C": 2.0, "D": 7.0}
+    assert tree.path_to("D") == ["A", "B", "C", "D"]
+    assert tree.distance_to("D") == 7.0
+    with pytest.raises(UnsolveableError):
+        tree.distance_to("E")
+
+
+def test_dijkstra__multiple_starts_goal_predicate() -> None:
+    paths = {
+        "A": {"C"},
+        "B": {"C"},
+        "C": {"D1", "D2"},
+    }
+    cost_map = {
+        ("A", "C"): 5,
+        ("B", "C"): 1,
+        ("C", "D1"): 4,
+        ("C", "D2"): 2,
+    }
+
+    path, cost = dijkstra.dijkstra(
+        starts=["A", "B"],
+        goals=lambda node: node.startswith("D"),
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+    )
+    assert path == ["B", "C", "D2"]
+    assert cost == 3.0
+
+
+def test_bidirectional_dijkstra__faster_path() -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"C"},
+        "C": {"D"},
+        "D": {"E"},
+        "B2": {"E"},
+    }
+    cost_map = {
+        ("A", "B"): 1,
+        ("B", "C"): 1,
+        ("A", "C"): 3,
+        ("C", "D"): 1,
+        ("D", "E"): 4,
+        ("B2", "E"): 0,
+    }
+
+    path, cost = dijkstra.bidirectional_dijkstra(
+        start="A",
+        goal="E",
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+    )
+    assert path == ["A", "B", "C", "D", "E"]
+    assert cost == 7.0
+
+
+def test_bidirectional_dijkstra__no_solution() -> None:
+    paths = {
+        "A": {"B"},
+        "C": {"D"},
+    }
+
+    with pytest.raises(UnsolveableError):
+        dijkstra.bidirectional_dijkstra(
+            start="A",
+            goal="D",
+            paths=paths,
+            cost_func=CostMappingFunc(cost_map={("A", "B"): 1, ("C", "D"): 1}),
+        )
+
+
+@pytest.mark.parametrize("max_cost", [1, 5, None])
+def test_dijkstra_auto(max_cost: int | None) -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"C"},
+        "C": {"D"},
+    }
+    cost_map = {
+        ("A", "B"): 0,
+        ("B", "C"): 1,
+        ("A", "C"): 1,
+        ("C", "D"): 1,
+    }
+
+    path, cost = dijkstra.dijkstra_auto(
+        start="A",
+        goal="D",
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+        max_cost=max_cost,
+    )
+    assert path[0] == "A"
+    assert path[-1] == "D"
+    assert cost == 2.0
+
+
+def test_dial__turn_penalty() -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"D"},
+        "C": {"D"},
+        "D": {"E"},
+    }
+    cost_map = {
+        ("A", "B"): 1000,
+        ("A", "C"): 1,
+        ("B", "D"): 1,
+        ("C", "D"): 1000,
+        ("D", "E"): 1000,
+    }
+
+    path, cost = dijkstra.dial(
+        start="A",
+        goal="E",
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+        max_cost=1000,
+    )
+    assert path in (["A", "B", "D", "E"], ["A", "C", "D", "E"])
+    assert cost == 2001.0
+
+
+def test_dial__cost_out_of_range() -> None:
+    paths = {"A": {"B"}}
+
+    with pytest.raises(ValueError, match="integers"):
+        dijkstra.dial(
+            start="A",
+            goal="B",
+            paths=paths,
+            cost_func=CostMappingFunc(cost_map={("A", "B"): 3}),
+            max_cost=2,
+        )
+
+
+def test_zero_one_bfs__no_solution() -> None:
+    paths = {"A": {"B"}, "C": {"D"}}
+
+    with pytest.raises(UnsolveableError):
+        dijkstra.zero_one_bfs(
+            start="A",
+            goal="D",
+            paths=paths,
+            cost_func=CostMappingFunc(cost_map={("A", "B"): 0, ("C", "D"): 1}),
+        )
+
+
+def test_dijkstra_all_best__diamond() -> None:
+    # Two equally cheap ways from A to D, a more expensive one through E, and D -> F -> G.
+    paths = {
+        "A": {"B", "C", "E"},
+        "B": {"D"},
+        "C": {"D"},
+        "E": {"D"},
+        "D": {"F"},
+        "F": {"G"},
+    }
+    cost_map = {
+        ("A", "B"): 1,
+        ("A", "C"): 2,
+        ("A", "E"): 1,
+        ("B", "D"): 2,
+        ("C", "D"): 1,
+        ("E", "D"): 5,
+        ("D", "F"): 1,
+        ("F", "G"): 1,
+    }
+
+    dag = dijkstra.dijkstra_all_best(
+        start="A",
+        goal="F",
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+    )
+
+    assert dag.cost == 4.0
+    assert dag.count_paths() == 2
+    assert dag.nodes_on_paths() == {"A", "B", "C", "D", "F"}
+    assert sorted(dag.iter_paths()) == [["A", "B", "D", "F"], ["A", "C", "D", "F"]]
+    assert dag.count_paths("D") == 2
+    assert dag.count_paths("E") == 1
+    # G is further away than the goal, so it was never settled.
+    with pytest.raises(UnsolveableError):
+        dag.count_paths("G")
+
+
+def test_dijkstra_all_best__grid_path_count() -> None:
+    # On an open grid, the number of shortest paths between opposite corners is a binomial
+    # coefficient, which quickly becomes too large to enumerate.
+    size = 40
+    paths = {
+        (row, col): {(row + 1, col), (row, col + 1)} for row in range(size) for col in range(size)
+    }
+
+    def unit_cost[S](paths: Mapping[S, set[S]], current: S, last: S) -> float:  # noqa: ARG001
+        return 1.0
+
+    dag = dijkstra.dijkstra_all_best(
+        start=(0, 0),
+        goal=(size - 1, size - 1),
+        paths=paths,
+        cost_func=unit_cost,
+    )
+
+    assert dag.count_paths() == math.comb(2 * (size - 1), size - 1)
+    assert len(dag.nodes_on_paths()) == size * size
+    assert len(next(dag.iter_paths())) == 2 * size - 1
+
+
+def test_dijkstra_all_best__several_goals() -> None:
+    paths = {"A": {"B", "C", "D"}}
+    cost_map = {("A", "B"): 1, ("A", "C"): 1, ("A", "D"): 2}
+
+    dag = dijkstra.dijkstra_all_best(
+        start="A",
+        goals={"B", "C", "D"},
+        paths=paths,
+        cost_func=CostMappingFunc(cost_map=cost_map),
+    )
+
+    assert sorted(dag.goals) == ["B", "C"]
+    assert dag.count_paths() == 2
+    assert sorted(dag.iter_paths()) == [["A", "B"], ["A", "C"]]
+
+
+def test_dijkstra_all_best__no_solution() -> None:
+    with pytest.raises(UnsolveableError):
+        dijkstra.dijkstra_all_best(
+            start="A",
+            goal="C",
+            paths={"A": {"B"}},
+            cost_func=CostMappingFunc(cost_map={("A", "B"): 1}),
+        )
+
+
+def test_dijkstra_all_best__zero_cost() -> None:
+    # A and B are both 1 from S, and the free edges between them would make them each other's
+    # predecessors.
+    paths = {"S": {"A", "B"}, "A": {"B", "G"}, "B": {"A"}}
+    cost_map = {("S", "A"): 1, ("S", "B"): 1, ("A", "B"): 0, ("B", "A"): 0, ("A", "G"): 1}
+    with pytest.raises(ValueError, match="positive"):
+        dijkstra.dijkstra_all_best(
+            start="S",
+            goal="G",
+            paths=paths,
+            cost_func=CostMappingFunc(cost_map=cost_map),
+        )
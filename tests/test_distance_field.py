@@ -0,0 +1,70 @@
+import random
+from collections.abc import Iterator, Mapping
+
+import pytest
+
+from aoc import bfs
+from aoc.datatypes import Coord
+
+np = pytest.importorskip("numpy")
+distance_field = pytest.importorskip("aoc.distance_field")
+
+
+def test_grid_distance_field() -> None:
+    walls = {Coord(0, 1), Coord(1, 1)}
+
+    distances = distance_field.grid_distance_field(walls, [Coord(0, 0)], Coord(2, 2))
+
+    assert distances.tolist() == [
+        [0, -1, 6],
+        [1, -1, 5],
+        [2, 3, 4],
+    ]
+
+
+def test_grid_distance_field__diagonal_multiple_sources() -> None:
+    walls = np.zeros((3, 4), dtype=bool)
+    walls[:, 1] = True
+    walls[1, 1] = False
+
+    distances = distance_field.grid_distance_field(
+        walls,
+        [Coord(0, 0), Coord(2, 3)],
+        Coord(2, 3),
+        diagonal=True,
+    )
+
+    assert distances.tolist() == [
+        [0, -1, 2, 2],
+        [1, 1, 1, 1],
+        [2, -1, 1, 0],
+    ]
+
+
+@pytest.mark.parametrize("diagonal", [True, False])
+def test_grid_distance_field__matches_bfs(*, diagonal: bool) -> None:
+    rng = random.Random(42)  # noqa: S311
+    corner = Coord(29, 39)
+    walls = {
+        Coord(row, col)
+        for row in range(corner.row + 1)
+        for col in range(corner.col + 1)
+        if rng.random() < 0.3
+    }
+    start = Coord(15, 20)
+    walls.discard(start)
+
+    def neighbors(current: Coord, paths: Mapping[Coord, set[Coord]]) -> Iterator[Coord]:  # noqa: ARG001
+        for neighbor in current.get_neighbors_limited(corner):
+            if neighbor in walls:
+                continue
+            if diagonal or neighbor.row == current.row or neighbor.col == current.col:
+                yield neighbor
+
+    expected = bfs.bfs_distances(start=start, paths={}, next_func=neighbors).distances
+
+    distances = distance_field.grid_distance_field(walls, [start], corner, diagonal=diagonal)
+
+    for row in range(corner.row + 1):
+        for col in range(corner.col + 1):
+            assert distances[row, col] == expected.get(Coord(row, col), -1)
@@ -0,0 +1,107 @@
+import pytest
+
+from aoc import bfs
+from aoc.datatypes import Coord
+from aoc.grid import Grid, GridNeighbors
+from aoc.puzzle import PuzzleInput
+
+# fmt: off
+MAZE = (
+    "S...#\n"
+    ".##.#\n"
+    "...#.\n"
+    "#.#..\n"
+    "....E\n"
+)
+# fmt: on
+
+
+def test_from_puzzle_input() -> None:
+    puzzle_input = PuzzleInput.from_contents(contents=MAZE, test=True)
+
+    grid = Grid.from_puzzle_input(puzzle_input)
+
+    assert grid.width == 5
+    assert grid.height == 5
+    assert grid.corner == Coord(4, 4)
+    assert grid.find("S") == Coord(0, 0)
+    assert grid.find("E") == Coord(4, 4)
+    assert grid[Coord(1, 1)] == "#"
+    assert grid.index(Coord(2, 3)) == 13
+    assert grid.coord(13) == Coord(2, 3)
+
+
+def test_uneven_lines() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        Grid.from_lines(["...", ".."])
+
+
+def test_index_out_of_bounds() -> None:
+    grid = Grid.from_lines(["...", "..."])
+    with pytest.raises(IndexError):
+        grid.index(Coord(2, 0))
+
+
+def test_neighbor_table() -> None:
+    grid = Grid.from_lines(MAZE.splitlines())
+
+    four = grid.neighbor_table()
+    eight = grid.neighbor_table(diagonal=True)
+
+    assert set(grid.to_coords(four[grid.index(Coord(0, 0))])) == {Coord(0, 1), Coord(1, 0)}
+    assert set(grid.to_coords(four[grid.index(Coord(2, 4))])) == {Coord(3, 4)}
+    assert set(grid.to_coords(eight[grid.index(Coord(2, 4))])) == {
+        Coord(1, 3),
+        Coord(3, 3),
+        Coord(3, 4),
+    }
+    assert four[grid.index(Coord(1, 1))] == ()
+
+
+def test_neighbor_table_rebuilt_after_edit() -> None:
+    grid = Grid.from_lines(["...", "...", "..."])
+    assert len(grid.neighbor_table()[grid.index(Coord(1, 1))]) == 4
+
+    grid[Coord(0, 1)] = "#"
+    assert len(grid.neighbor_table()[grid.index(Coord(1, 1))]) == 3
+
+
+def test_paths_match() -> None:
+    grid = Grid.from_lines(MAZE.splitlines())
+    start, end = grid.find("S"), grid.find("E")
+
+    bfs_path, bfs_cost = grid.bfs_path(start, end)
+    dijkstra_path, dijkstra_cost = grid.dijkstra_path(
+        start,
+        end,
+        lambda paths, current, last: 1.0,  # noqa: ARG005
+    )
+    a_star_path, a_star_cost = grid.a_star_path(start, end)
+
+    assert bfs_cost == dijkstra_cost == a_star_cost == 8
+    for path in [bfs_path, dijkstra_path, a_star_path]:
+        assert path[0] == start
+        assert path[-1] == end
+        assert all(grid[coord] != "#" for coord in path)
+
+
+def test_neighbors_on_engine() -> None:
+    grid = Grid.from_lines(MAZE.splitlines())
+
+    path, cost = bfs.breadth_first_search(
+        start=grid.index(Coord(0, 0)),
+        goal=grid.index(Coord(4, 0)),
+        paths={},
+        next_func=GridNeighbors(grid),
+    )
+
+    assert grid.to_coords(path) == [
+        Coord(0, 0),
+        Coord(1, 0),
+        Coord(2, 0),
+        Coord(2, 1),
+        Coord(3, 1),
+        Coord(4, 1),
+        Coord(4, 0),
+    ]
+    assert cost == 6
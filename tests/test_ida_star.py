@@ -0,0 +1,114 @@
+import itertools
+from collections.abc import Iterator, Mapping
+
+import pytest
+
+from aoc.a_star import a_star
+from aoc.datatypes import Coord
+from aoc.exceptions import UnsolveableError
+from aoc.ida_star import beam_search, ida_star
+from tests.test_a_star import MazeCost, MazeHeuristic, MazeNeighbors, parse_maze
+
+MAZE = "S.....\n.xxxx.\n.x..T.\n.x.xx.\n.x....\n.xxxx.\n......"
+
+
+def test_ida_star_matches_a_star() -> None:
+    maze = parse_maze(MAZE)
+    args = (maze.start, maze.end, MazeHeuristic(), MazeCost(), MazeNeighbors(maze))
+
+    path, cost = ida_star(*args)
+
+    assert cost == a_star(*args)[1]
+    assert path[0] == maze.start
+    assert path[-1] == maze.end
+    assert len(path) == cost + 1
+    assert all(abs(a.row - b.row) + abs(a.col - b.col) == 1 for a, b in itertools.pairwise(path))
+
+
+def test_ida_star_start_is_goal() -> None:
+    maze = parse_maze("S.T")
+
+    assert ida_star(maze.start, maze.start, MazeHeuristic(), MazeCost(), MazeNeighbors(maze)) == (
+        [maze.start],
+        0.0,
+    )
+
+
+def test_ida_star_paths_hold_the_current_path() -> None:
+    maze = parse_maze(MAZE)
+    neighbors = MazeNeighbors(maze)
+    seen_sizes: list[int] = []
+
+    def next_func(current: Coord, paths: Mapping[Coord, Coord]) -> Iterator[Coord]:
+        # The parent chain of the current node always leads back to the start.
+        node = current
+        while node in paths:
+            node = paths[node]
+        assert node == maze.start
+        seen_sizes.append(len(paths))
+        return neighbors(current, paths)
+
+    _, cost = ida_star(maze.start, maze.end, MazeHeuristic(), MazeCost(), next_func)
+
+    assert max(seen_sizes) <= cost
+
+
+def test_ida_star_no_path() -> None:
+    maze = parse_maze("S.x.T")
+
+    with pytest.raises(UnsolveableError):
+        ida_star(maze.start, maze.end, MazeHeuristic(), MazeCost(), MazeNeighbors(maze))
+
+
+@pytest.mark.parametrize("beam_width", [1, 2, 100])
+def test_beam_search(beam_width: int) -> None:
+    maze = parse_maze(MAZE)
+    args = (maze.start, maze.end, MazeHeuristic(), MazeCost(), MazeNeighbors(maze))
+
+    path, cost = beam_search(*args, beam_width=beam_width)
+
+    assert path[0] == maze.start
+    assert path[-1] == maze.end
+    assert len(path) == cost + 1
+    if beam_width == 100:
+        assert cost == a_star(*args)[1]
+
+
+def test_beam_search_too_narrow() -> None:
+    # The only way to the goal leads away from it first, which a beam of one never tries.
+    maze = parse_maze(".S..\n.xxx\n...T")
+
+    with pytest.raises(UnsolveableError):
+        beam_search(
+            maze.start,
+            maze.end,
+            MazeHeuristic(),
+            MazeCost(),
+            MazeNeighbors(maze),
+            beam_width=1,
+        )
+    assert (
+        beam_search(
+            maze.start,
+            maze.end,
+            MazeHeuristic(),
+            MazeCost(),
+            MazeNeighbors(maze),
+            beam_width=2,
+        )[1]
+        == 6
+    )
+
+
+def test_beam_search_invalid_width() -> None:
+    maze = parse_maze("S.T")
+
+    with pytest.raises(ValueError, match="wide"):
+        beam_search(
+            maze.start,
+            maze.end,
+            MazeHeuristic(),
+            MazeCost(),
+            MazeNeighbors(maze),
+            beam_width=0,
+        )
@@ -0,0 +1,70 @@
+import itertools
+
+import pytest
+
+from aoc.datatypes import Coord
+from aoc.exceptions import UnsolveableError
+from aoc.incremental import IncrementalAStar
+from aoc.stats import SearchStats
+
+
+def manhattan(current: Coord, goal: Coord) -> float:
+    return float(abs(current.row - goal.row) + abs(current.col - goal.col))
+
+
+def chebyshev(current: Coord, goal: Coord) -> float:
+    return float(max(abs(current.row - goal.row), abs(current.col - goal.col)))
+
+
+def test_walls_block_the_path() -> None:
+    search = IncrementalAStar(Coord(0, 0), Coord(2, 2), Coord(2, 2), manhattan)
+    assert search.distance() == 4
+
+    # Wall off the middle row, except for its rightmost cell.
+    search.add_wall(Coord(1, 0))
+    search.add_wall(Coord(1, 1))
+    assert search.path() == [Coord(0, 0), Coord(0, 1), Coord(0, 2), Coord(1, 2), Coord(2, 2)]
+
+    search.add_wall(Coord(1, 2))
+    assert search.distance() == float("inf")
+    with pytest.raises(UnsolveableError):
+        search.path()
+
+    search.remove_wall(Coord(1, 0))
+    assert search.path() == [Coord(0, 0), Coord(1, 0), Coord(2, 0), Coord(2, 1), Coord(2, 2)]
+
+
+def test_detour() -> None:
+    walls = [Coord(row, 2) for row in range(4)]
+    search = IncrementalAStar(Coord(0, 0), Coord(0, 4), Coord(4, 4), manhattan, walls=walls)
+    assert search.distance() == 12
+
+    search.remove_wall(Coord(2, 2))
+    path = search.path()
+
+    assert len(path) == 9
+    assert Coord(2, 2) in path
+    assert all(b in a.neighbors4() for a, b in itertools.pairwise(path))
+
+
+def test_diagonal() -> None:
+    search = IncrementalAStar(Coord(0, 0), Coord(3, 3), Coord(3, 3), chebyshev, diagonal=True)
+    assert search.distance() == 3
+
+    search.add_wall(Coord(1, 1))
+    search.add_wall(Coord(2, 2))
+    assert search.distance() == 4
+
+
+def test_repairs_are_cheaper_than_searching() -> None:
+    stats = SearchStats()
+    corner = Coord(29, 29)
+    search = IncrementalAStar(Coord(0, 0), corner, corner, manhattan, stats=stats)
+    search.distance()
+    first_search = stats.expanded
+
+    search.add_wall(Coord(0, 1))
+    search.distance()
+
+    assert first_search > 0
+    assert stats.expanded - first_search < first_search / 4
@@ -0,0 +1,151 @@
+import itertools
+from array import array
+from collections.abc import Iterator, Mapping
+
+import pytest
+
+from aoc import a_star, bfs, dijkstra
+from aoc.datatypes import Coord
+from aoc.exceptions import UnsolveableError
+from aoc.intern import ParentView, StateTable
+from aoc.stats import SearchStats
+
+type State = tuple[Coord, frozenset[Coord]]
+
+CORNER = Coord(4, 4)
+KEYS = frozenset({Coord(0, 4), Coord(4, 0), Coord(2, 2)})
+START: State = (Coord(0, 0), frozenset())
+
+
+def next_func(current: State, paths: Mapping[State, object]) -> Iterator[State]:  # noqa: ARG001
+    position, collected = current
+    for neighbor in position.neighbors4(CORNER):
+        yield neighbor, collected | {neighbor} if neighbor in KEYS else collected
+
+
+def cost_func(paths: Mapping[State, object], current: State, last: State) -> float:  # noqa: ARG001
+    # Picking up a key takes a while.
+    return 3.0 if current[1] != last[1] else 1.0
+
+
+def has_all_keys(state: State) -> bool:
+    return state[1] == KEYS
+
+
+def test_state_table() -> None:
+    table = StateTable(["A", "B"])
+
+    assert table.intern("C") == 2
+    assert table.intern("A") == 0
+    assert len(table) == 3
+    assert list(table) == ["A", "B", "C"]
+    assert table[2] == "C"
+    assert table.find("B") == 1
+    assert table.find("D") is None
+    assert "D" not in table
+    assert table.path(array("q", [0, 0, 1]), 2) == ["A", "B", "C"]
+
+
+def test_parent_view() -> None:
+    table = StateTable(["A", "B", "C", "D"])
+    view = ParentView(table, array("q", [0, 0, 1, -1]))
+
+    assert dict(view) == {"B": "A", "C": "B"}
+    assert "A" not in view
+    assert "D" not in view
+    assert "E" not in view
+    with pytest.raises(KeyError):
+        view["A"]
+
+
+def test_interned_bfs() -> None:
+    plain = bfs.breadth_first_search(start=START, goals=has_all_keys, paths={}, next_func=next_func)
+    stats = SearchStats()
+    interned = bfs.breadth_first_search(
+        start=START,
+        goals=has_all_keys,
+        paths={},
+        next_func=next_func,
+        stats=stats,
+        interned=True,
+    )
+
+    assert interned[1] == plain[1]
+    assert interned[0][0] == START
+    assert has_all_keys(interned[0][-1])
+    assert stats.expanded > 0
+
+
+def test_interned_dijkstra() -> None:
+    plain = dijkstra.dijkstra(
+        start=START,
+        goals=has_all_keys,
+        paths={},
+        cost_func=cost_func,
+        next_func=next_func,
+    )
+    interned = dijkstra.dijkstra(
+        start=START,
+        goals=has_all_keys,
+        paths={},
+        cost_func=cost_func,
+        next_func=next_func,
+        interned=True,
+    )
+
+    path, cost = interned
+    assert cost == plain[1]
+    assert sum(cost_func({}, current, last) for last, current in itertools.pairwise(path)) == cost
+
+
+@pytest.mark.parametrize("prefer_deeper", [False, True])
+def test_interned_a_star(prefer_deeper: bool) -> None:  # noqa: FBT001
+    def heuristic(current: State) -> float:
+        return float(len(KEYS - current[1]))
+
+    def checked_next_func(current: State, paths: Mapping[State, State]) -> Iterator[State]:
+        # The paths lead back to the start, which has no parent.
+        node = current
+        while node in paths:
+            node = paths[node]
+        assert node == START
+        return next_func(current, paths)
+
+    plain = a_star.a_star_multi([START], has_all_keys, heuristic, cost_func, checked_next_func)
+    interned = a_star.a_star_multi(
+        [START],
+        has_all_keys,
+        heuristic,
+        cost_func,
+        checked_next_func,
+        prefer_deeper=prefer_deeper,
+        interned=True,
+    )
+
+    assert interned[1] == plain[1]
+    assert interned[0][0] == START
+
+
+def test_interned_no_path() -> None:
+    with pytest.raises(UnsolveableError):
+        dijkstra.dijkstra(
+            start=START,
+            goal=(Coord(9, 9), KEYS),
+            paths={},
+            cost_func=cost_func,
+            next_func=next_func,
+            interned=True,
+        )
+
+
+def test_interned_with_queue() -> None:
+    with pytest.raises(ValueError, match="interned"):
+        dijkstra.dijkstra(
+            start=START,
+            goals=has_all_keys,
+            paths={},
+            cost_func=cost_func,
+            next_func=next_func,
+            queue=lambda: None,  # type: ignore[arg-type,return-value]
+            interned=True,
+        )
@@ -0,0 +1,68 @@
+import itertools
+import math
+
+import pytest
+
+from aoc.datatypes import Coord
+from aoc.exceptions import UnsolveableError
+from aoc.grid import Grid
+from aoc.jps import jump_point_search
+from aoc.stats import SearchStats
+
+# fmt: off
+MAZE = [
+    "S.........",
+    "..........",
+    "....###...",
+    "......#...",
+    "......#..T",
+]
+# fmt: on
+
+
+def test_jump_point_search__grid() -> None:
+    grid = Grid.from_lines(MAZE)
+    start, goal = grid.find("S"), grid.find("T")
+
+    path, cost = jump_point_search(start, goal, grid)
+
+    assert cost == 13.0
+    assert path[0] == start
+    assert path[-1] == goal
+    assert len(path) == 14
+    assert all(abs(a.row - b.row) + abs(a.col - b.col) == 1 for a, b in itertools.pairwise(path))
+    assert all(grid[coord] != "#" for coord in path)
+
+
+def test_jump_point_search__floors_diagonal() -> None:
+    floors = {
+        Coord(row, col)
+        for row, line in enumerate(MAZE)
+        for col, char in enumerate(line)
+        if char != "#"
+    }
+
+    path, cost = jump_point_search(Coord(0, 0), Coord(4, 9), floors, diagonal=True)
+
+    assert cost == pytest.approx(5 + 4 * math.sqrt(2))
+    assert path[0] == Coord(0, 0)
+    assert path[-1] == Coord(4, 9)
+    assert len(path) == 10
+    assert all(coord in floors for coord in path)
+
+
+def test_jump_point_search__expands_few_nodes() -> None:
+    grid = Grid.from_lines(["." * 50] * 50)
+    stats = SearchStats()
+
+    _, cost = jump_point_search(Coord(0, 0), Coord(49, 49), grid, stats=stats)
+
+    assert cost == 98.0
+    assert stats.expanded < 10
+
+
+def test_jump_point_search__unsolveable() -> None:
+    grid = Grid.from_lines(["S#.", "##.", "..T"])
+
+    with pytest.raises(UnsolveableError):
+        jump_point_search(grid.find("S"), grid.find("T"), grid, diagonal=False)
@@ -0,0 +1,48 @@
+from collections.abc import Mapping
+
+import pytest
+
+from aoc import dijkstra
+from aoc.exceptions import UnsolveableError
+from aoc.parallel import batch_search
+
+PATHS = {
+    "A": {"B", "C"},
+    "B": {"D"},
+    "C": {"D"},
+    "D": {"E"},
+}
+
+
+def unit_cost(paths: Mapping[str, set[str]], current: str, last: str) -> float:  # noqa: ARG001
+    return 1.0
+
+
+def shortest_path(paths: Mapping[str, set[str]], query: tuple[str, str]) -> float:
+    start, goal = query
+    return dijkstra.dijkstra(start=start, goal=goal, paths=paths, cost_func=unit_cost)[1]
+
+
+def broken_engine(paths: Mapping[str, set[str]], query: str) -> float:  # noqa: ARG001
+    msg = "Not a search error."
+    raise KeyError(msg)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_search(workers: int) -> None:
+    queries = [("A", "E"), ("E", "A"), ("B", "D"), ("A", "A")] * 5
+
+    results = list(batch_search(shortest_path, PATHS, queries, workers=workers))
+
+    assert len(results) == len(queries)
+    for result, expected in zip(results, [3.0, None, 1.0, 0.0] * 5, strict=True):
+        if expected is None:
+            assert isinstance(result, UnsolveableError)
+        else:
+            assert result == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_search__other_errors_are_raised(workers: int) -> None:
+    with pytest.raises(KeyError):
+        list(batch_search(broken_engine, PATHS, ["A", "B"], workers=workers))
@@ -0,0 +1,83 @@
+import random
+from collections.abc import Callable, Mapping
+
+import pytest
+
+from aoc import a_star, dijkstra, pq
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pq.LazyHeap[int],
+        pq.IndexedHeap[int],
+        lambda: pq.IndexedHeap[int](arity=2),
+        pq.RadixHeap[int],
+    ],
+)
+def test_queue_sorts(queue: Callable[[], pq.PriorityQueue[int]]) -> None:
+    rng = random.Random(1)  # noqa: S311
+    priorities = [rng.randrange(1000) for _ in range(200)]
+    frontier = queue()
+    for item, priority in enumerate(priorities):
+        frontier.push(item, priority)
+
+    popped = [frontier.pop() for _ in range(len(priorities))]
+
+    assert [priority for priority, _ in popped] == sorted(priorities)
+    assert sorted(item for _, item in popped) == list(range(len(priorities)))
+    assert len(frontier) == 0
+
+
+def test_indexed_heap_decrease_key() -> None:
+    heap = pq.IndexedHeap[str]()
+    heap.push("A", 5)
+    heap.push("B", 3)
+    heap.push("A", 1)
+    heap.push("B", 4)
+
+    assert len(heap) == 2
+    assert heap.priority("B") == 3
+    assert heap.pop() == (1, "A")
+    assert heap.pop() == (3, "B")
+    with pytest.raises(IndexError):
+        heap.pop()
+
+
+def test_radix_heap_is_monotone() -> None:
+    heap = pq.RadixHeap[str]()
+    heap.push("A", 5)
+    heap.pop()
+
+    with pytest.raises(ValueError, match="at least 5"):
+        heap.push("B", 4)
+    with pytest.raises(ValueError, match="integers"):
+        heap.push("B", 6.5)
+
+
+@pytest.mark.parametrize("queue", [pq.LazyHeap[str], pq.IndexedHeap[str], pq.RadixHeap[str]])
+def test_engines_with_queue(queue: pq.QueueFactory[str]) -> None:
+    paths = {
+        "A": {"B", "C"},
+        "B": {"C"},
+        "C": {"D"},
+    }
+    costs = {("A", "B"): 1, ("A", "C"): 5, ("B", "C"): 1, ("C", "D"): 4}
+
+    def cost(paths: Mapping[str, object], current: str, last: str) -> float:  # noqa: ARG001
+        return costs[(last, current)]
+
+    path, total = dijkstra.dijkstra(start="A", goal="D", paths=paths, cost_func=cost, queue=queue)
+    assert path == ["A", "B", "C", "D"]
+    assert total == 6
+
+    path, total = a_star.a_star(
+        "A",
+        "D",
+        lambda current, goal: 0.0,  # noqa: ARG005
+        cost,
+        lambda current, _: iter(paths.get(current, ())),
+        queue=queue,
+    )
+    assert path == ["A", "B", "C", "D"]
+    assert total == 6
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from aoc import regions
+from aoc.datatypes import Coord
+from aoc.puzzle import PuzzleInput
+
+GARDEN = """\
+RRRRIICCFF
+RRRRIICCCF
+VVRRRCCFFF
+VVRCCCJFFF
+VVVVCJJCFE
+VVIVCCJJEE
+VVIIICJJEE
+MIIIIIJJEE
+MIIISIJEEE
+MMMISSJEEE
+"""
+
+# The backends to label with. NumPy is only used when it is installed.
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(not regions.HAS_NUMPY, reason="NumPy is not installed"),
+    ),
+]
+
+
+def test_union_find() -> None:
+    sets = regions.UnionFind("abcde")
+    assert sets.union("a", "b")
+    assert sets.union("c", "d")
+    assert sets.union("b", "d")
+    assert not sets.union("a", "c")
+    assert sets.connected("a", "d")
+    assert not sets.connected("a", "e")
+    assert sets.find("c") == sets.find("a")
+    assert sets.sets == 2
+    assert sets.groups() == [["a", "b", "c", "d"], ["e"]]
+
+    assert sets.union("e", "f")
+    assert len(sets) == 6
+    assert "f" in sets
+    assert sets.sets == 2
+
+
+@pytest.mark.parametrize("vectorized", BACKENDS)
+def test_garden(vectorized: bool) -> None:  # noqa: FBT001
+    puzzle_input = PuzzleInput.from_contents(contents=GARDEN, test=True)
+    garden = regions.label_regions(puzzle_input.lines, vectorized=vectorized)
+    assert len(garden) == 11
+    assert garden.kinds == ["R", "I", "C", "F", "V", "J", "C", "E", "I", "M", "S"]
+    assert garden.labels[0][:5] == [0, 0, 0, 0, 1]
+    assert garden.areas[0] == 12
+    assert garden.perimeters[0] == 18
+    assert garden.sides[0] == 10
+    assert (
+        sum(
+            area * perimeter
+            for area, perimeter in zip(garden.areas, garden.perimeters, strict=True)
+        )
+        == 1930
+    )
+    assert sum(area * sides for area, sides in zip(garden.areas, garden.sides, strict=True)) == 1206
+
+
+@pytest.mark.parametrize("vectorized", BACKENDS)
+def test_nested_regions(vectorized: bool) -> None:  # noqa: FBT001
+    garden = regions.label_regions(
+        ["AAAAAA", "AAABBA", "AAABBA", "ABBAAA", "ABBAAA", "AAAAAA"],
+        vectorized=vectorized,
+    )
+    assert garden.kinds == ["A", "B", "B"]
+    assert garden.sides == [12, 4, 4]
+    assert garden.cells(1) == [Coord(1, 3), Coord(1, 4), Coord(2, 3), Coord(2, 4)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_backends_agree(seed: int) -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(seed)  # noqa: S311
+    lines = ["".join(rng.choice("ab") for _ in range(30)) for _ in range(20)]
+    assert regions.label_regions(lines, vectorized=True) == regions.label_regions(
+        lines,
+        vectorized=False,
+    )
+
+
+def test_not_a_rectangle() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        regions.label_regions(["ab", "a"])
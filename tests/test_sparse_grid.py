@@ -0,0 +1,88 @@
+import random
+from collections import Counter
+
+import pytest
+
+from aoc.datatypes import Coord
+
+np = pytest.importorskip("numpy")
+sparse_grid = pytest.importorskip("aoc.sparse_grid")
+
+CONWAY = sparse_grid.LifeRule({3}, {2, 3})
+GLIDER = {Coord(0, 1), Coord(1, 2), Coord(2, 0), Coord(2, 1), Coord(2, 2)}
+
+
+def naive_life(live: set[Coord]) -> set[Coord]:
+    counts = Counter(neighbor for cell in live for neighbor in cell.get_neighbors())
+    return {cell for cell, count in counts.items() if count == 3 or (count == 2 and cell in live)}
+
+
+def test_cells() -> None:
+    grid = sparse_grid.SparseGrid([Coord(-1, -1), Coord(5, 3)], chunk_size=4)
+    grid.add(Coord(5, 3))
+    assert len(grid) == 2
+    assert set(grid) == {Coord(-1, -1), Coord(5, 3)}
+    assert Coord(-1, -1) in grid
+    assert Coord(3, 3) not in grid
+    assert "cell" not in grid
+    assert grid.bounds() == (Coord(-1, -1), Coord(5, 3))
+
+    grid.discard(Coord(-1, -1))
+    grid.discard(Coord(-1, -1))
+    assert set(grid) == {Coord(5, 3)}
+    assert len(grid.chunks) == 1
+
+
+def test_empty_bounds() -> None:
+    with pytest.raises(ValueError, match="no live cells"):
+        sparse_grid.SparseGrid().bounds()
+
+
+def test_blinker() -> None:
+    grid = sparse_grid.SparseGrid([Coord(3, 2), Coord(3, 3), Coord(3, 4)], chunk_size=4)
+    grid.step(CONWAY)
+    assert set(grid) == {Coord(2, 3), Coord(3, 3), Coord(4, 3)}
+    grid.step(CONWAY)
+    assert set(grid) == {Coord(3, 2), Coord(3, 3), Coord(3, 4)}
+
+
+def test_glider_crosses_chunks() -> None:
+    grid = sparse_grid.SparseGrid(GLIDER, chunk_size=4)
+    for _ in range(40):
+        grid.step(CONWAY)
+    # A glider moves one cell down and right every four generations.
+    assert set(grid) == {Coord(row + 10, col + 10) for row, col in GLIDER}
+    assert len(grid.chunks) <= 4
+
+
+def test_dead_chunks_are_pruned() -> None:
+    grid = sparse_grid.SparseGrid([Coord(0, 0), Coord(10, 10)], chunk_size=4)
+    grid.step(CONWAY)
+    assert len(grid) == 0
+    assert not grid.chunks
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_naive(seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311
+    live = {
+        Coord(row, col) for row in range(-10, 10) for col in range(-10, 10) if rng.random() < 0.4
+    }
+    grid = sparse_grid.SparseGrid(live, chunk_size=8)
+    for _ in range(30):
+        live = naive_life(live)
+        grid.step(CONWAY)
+        assert set(grid) == live
+
+
+def test_without_diagonals() -> None:
+    # Every cell with exactly one live neighbor above, below, left or right comes alive.
+    rule = sparse_grid.LifeRule({1}, set())
+    grid = sparse_grid.SparseGrid([Coord(0, 0)], chunk_size=4)
+    grid.step(rule, diagonal=False)
+    assert set(grid) == {Coord(-1, 0), Coord(0, -1), Coord(0, 1), Coord(1, 0)}
+
+
+def test_birth_without_neighbors() -> None:
+    with pytest.raises(ValueError, match="without neighbors"):
+        sparse_grid.LifeRule({0, 3}, {2, 3})
@@ -0,0 +1,65 @@
+from collections.abc import Iterator, Mapping
+
+from aoc import a_star, bfs, dijkstra
+from aoc.stats import SearchStats
+
+PATHS = {
+    "A": {"B", "C"},
+    "B": {"D"},
+    "C": {"D"},
+    "D": {"E"},
+}
+
+
+def unit_cost(paths: Mapping[str, object], current: str, last: str) -> float:  # noqa: ARG001
+    return 1.0
+
+
+def test_bfs_stats() -> None:
+    stats = SearchStats()
+
+    bfs.breadth_first_search(start="A", goal="E", paths=PATHS, stats=stats)
+
+    # A, B and C are expanded before E is discovered from D.
+    assert stats.expanded == 4
+    assert stats.pushed == 5
+    assert stats.stale_skipped == 0
+    assert stats.peak_frontier == 2
+    assert stats.neighbor_time > 0
+
+
+def test_dijkstra_stats() -> None:
+    stats = SearchStats()
+
+    dijkstra.dijkstra(start="A", goal="E", paths=PATHS, cost_func=unit_cost, stats=stats)
+
+    assert stats.expanded == 4
+    assert stats.pushed == 5
+    assert stats.stale_skipped == 0
+    assert stats.peak_frontier == 2
+    assert stats.cost_time > 0
+
+
+def test_a_star_stats_stale_entries() -> None:
+    graph = {
+        "A": {"B", "C"},
+        "B": {"C"},
+        "C": {"D"},
+    }
+    costs = {("A", "B"): 1.0, ("A", "C"): 5.0, ("B", "C"): 1.0, ("C", "D"): 4.0}
+
+    def cost(paths: Mapping[str, str], current: str, last: str) -> float:  # noqa: ARG001
+        return costs[(last, current)]
+
+    def neighbors(current: str, paths: Mapping[str, str]) -> Iterator[str]:  # noqa: ARG001
+        yield from sorted(graph.get(current, set()))
+
+    stats = SearchStats()
+
+    path, _ = a_star.a_star("A", "D", lambda current, goal: 0.0, cost, neighbors, stats=stats)  # noqa: ARG005
+
+    assert path == ["A", "B", "C", "D"]
+    # C is pushed twice, first with cost 5 and then with cost 2. The first one is popped before D.
+    assert stats.pushed == 5
+    assert stats.expanded == 3
+    assert stats.stale_skipped == 1